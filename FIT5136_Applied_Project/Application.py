@@ -5,7 +5,10 @@ This is the primary entry point that initializes and runs the entire application
 It provides a clean separation between the application launcher and the main logic.
 
 Usage:
-    python Application.py
+    python Application.py [--profile-startup]
+
+    --profile-startup   Report the time spent loading each data store before
+                        the main menu is shown.
 
 Author: Applied10_Group6
 Version: 1.0
@@ -14,6 +17,9 @@ Date: 2025-10-12
 
 import sys
 import os
+import time
+
+STARTED = time.perf_counter()
 
 # Add src directory to Python path to import modules
 current_dir = os.path.dirname(os.path.abspath(__file__))
@@ -24,6 +30,39 @@ sys.path.insert(0, src_dir)
 os.chdir(src_dir)
 
 from mainPage import MainPage
+from dataContext import DataContext
+
+IMPORTED = time.perf_counter()
+
+
+def print_startup_profile(context: DataContext, menu_ready: float) -> None:
+    """
+    Display how long startup took and the time spent on each data store.
+
+    Stores not loaded yet are listed as deferred; they load on first use.
+
+    :param context: The application's DataContext.
+    :param menu_ready: perf_counter() value when the main menu was about to be shown.
+    """
+    print("\n" + "="*70)
+    print("STARTUP PROFILE")
+    print("="*70)
+    print(f"Module imports: {(IMPORTED - STARTED) * 1000:8.2f} ms")
+    print(f"To main menu:   {(menu_ready - STARTED) * 1000:8.2f} ms (including the banner wait)")
+    print("-"*70)
+    print(f"{'Store':<14}{'Load (ms)':>12}{'Waited (ms)':>14}  Loaded by")
+    for entry in context.startup_profile():
+        if entry['loaded']:
+            print(f"{entry['name']:<14}{entry['load_seconds'] * 1000:>12.2f}"
+                  f"{entry['wait_seconds'] * 1000:>14.2f}  {entry['loaded_by']}")
+        else:
+            print(f"{entry['name']:<14}{'deferred':>12}{'':>14}  -")
+    snapshot = context.snapshot_report
+    print("-"*70)
+    print(f"Startup snapshot: {snapshot['status']}")
+    print(f"  restored: {', '.join(snapshot['restored']) or '-'}")
+    print(f"  rebuilt:  {', '.join(snapshot['rebuilt']) or '-'}")
+    print("="*70)
 
 
 def print_welcome_banner():
@@ -43,14 +82,23 @@ def main():
     """
     Main application entry point.
 
-    Initializes the application and handles any startup errors.
+    Initializes the application and handles any startup errors. The likely
+    data stores are loaded in the background while the banner waits.
     """
+    profile_startup = '--profile-startup' in sys.argv[1:]
     try:
+        # Initialize the application and pre-warm its data during the banner
+        app = MainPage()
+        app.context.prewarm()
+
         # Display welcome banner
         print_welcome_banner()
 
-        # Initialize and run the main application
-        app = MainPage()
+        if profile_startup:
+            print_startup_profile(app.context, time.perf_counter())
+            input("\nPress Enter to continue...")
+
+        # Run the main application
         app.run()
 
     except KeyboardInterrupt:
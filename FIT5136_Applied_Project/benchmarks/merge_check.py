@@ -0,0 +1,230 @@
+"""
+merge_check.py - End-to-end check of VersionedJSONStore's concurrent merge.
+
+Runs several writer processes against one temporary data directory and
+verifies that:
+    1. Concurrent balance deltas to one user all survive (delta field).
+    2. Concurrent stock deductions from one product all survive (delta field).
+    3. Two writers editing the same field keep the later value and report
+       the conflict, while their edits to other fields, and entries appended
+       to a list field, are all kept.
+    4. Two writers each selling the last unit of a product cannot both
+       save: the second save fails and the stock stays at zero.
+    5. Orders created at the same time under the same order ID are renumbered
+       on save, so no order is lost and every ID is used once.
+
+Each writer is a separate interpreter, so every one has its own merge base,
+exactly as when several terminals share the data files. The script exits with
+status 1 if any check fails.
+
+Usage:
+    python benchmarks/merge_check.py [--writers N] [--rounds N]
+
+Author: Applied10_Group6
+Version: 1.0
+"""
+
+import argparse
+import json
+import os
+import subprocess
+import sys
+import tempfile
+from typing import Dict, List, Tuple
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+sys.path.insert(0, SRC_DIR)
+
+from dataStore import STORE_POLICIES, VersionedJSONStore  # noqa: E402
+from Order import OrderManager  # noqa: E402
+
+START_BALANCE = 1000
+START_STOCK = 100000
+
+
+def open_store(path: str) -> VersionedJSONStore:
+    """
+    Opens a store with the merge policy the application uses for its file name.
+
+    :param path: Path of users.txt or products.txt in the check directory.
+    :return: A new VersionedJSONStore with its own merge base.
+    """
+    return VersionedJSONStore(path, **STORE_POLICIES[os.path.basename(path)])
+
+
+def run_worker(kind: str, directory: str, worker: int, rounds: int) -> None:
+    """
+    Performs one writer's share of a check; runs in its own interpreter.
+
+    :param kind: 'balance', 'stock' or 'orders'.
+    :param directory: The shared data directory.
+    :param worker: This writer's number.
+    :param rounds: Number of changes to make, each saved separately.
+    """
+    if kind == 'orders':
+        manager = OrderManager(os.path.join(directory, 'orders.txt'))
+        for _ in range(rounds):
+            manager.create_order(f"writer{worker}@monash.edu", [], 1.0)
+        return
+    filename, key, field, step = {'balance': ('users.txt', 'alice@monash.edu', 'balance', 1),
+                                  'stock': ('products.txt', '1', 'quantity', -1)}[kind]
+    store = open_store(os.path.join(directory, filename))
+    data = store.load()
+    for _ in range(rounds):
+        data[key][field] += step
+        if not store.save(data):
+            raise SystemExit(f"writer {worker}: save failed")
+
+
+def run_writers(kind: str, directory: str, writers: int, rounds: int) -> None:
+    """
+    Starts every writer for a check at once and waits for them all.
+
+    :param kind: The check the writers take part in.
+    :param directory: The shared data directory.
+    :param writers: Number of writer processes.
+    :param rounds: Changes made by each writer.
+    """
+    processes = [subprocess.Popen([sys.executable, os.path.abspath(__file__), '--worker', kind,
+                                   '--dir', directory, '--id', str(worker), '--rounds', str(rounds)],
+                                  stdout=subprocess.DEVNULL)
+                 for worker in range(writers)]
+    for process in processes:
+        if process.wait() != 0:
+            raise RuntimeError(f"a {kind} writer exited with status {process.returncode}")
+
+
+def check_deltas(directory: str, writers: int, rounds: int) -> List[Tuple[str, bool, str]]:
+    """
+    Checks concurrent balance and stock changes.
+
+    :param directory: An empty data directory.
+    :param writers: Number of writer processes.
+    :param rounds: Changes made by each writer.
+    :return: Results as (check name, passed, detail).
+    """
+    with open(os.path.join(directory, 'users.txt'), 'w') as f:
+        json.dump({'alice@monash.edu': {'email': 'alice@monash.edu', 'balance': START_BALANCE}}, f)
+    with open(os.path.join(directory, 'products.txt'), 'w') as f:
+        json.dump({'1': {'id': '1', 'name': 'Milk', 'quantity': START_STOCK}}, f)
+    run_writers('balance', directory, writers, rounds)
+    run_writers('stock', directory, writers, rounds)
+
+    balance = open_store(os.path.join(directory, 'users.txt')).load()['alice@monash.edu']['balance']
+    stock = open_store(os.path.join(directory, 'products.txt')).load()['1']['quantity']
+    changes = writers * rounds
+    return [('balance deltas', balance == START_BALANCE + changes,
+             f"{balance} (expected {START_BALANCE + changes})"),
+            ('stock deltas', stock == START_STOCK - changes,
+             f"{stock} (expected {START_STOCK - changes})")]
+
+
+def check_conflict(directory: str) -> List[Tuple[str, bool, str]]:
+    """
+    Checks two writers changing the same user record from the same base.
+
+    :param directory: A data directory without a users.txt.
+    :return: Results as (check name, passed, detail).
+    """
+    path = os.path.join(directory, 'users.txt')
+    with open(path, 'w') as f:
+        json.dump({'bob@monash.edu': {'address': 'Clayton', 'phone': '0400000000',
+                                      'balance': 50, 'membership_history': []}}, f)
+    first, second = open_store(path), open_store(path)
+    mine, theirs = first.load(), second.load()
+
+    theirs['bob@monash.edu'].update(address='Caulfield', balance=70)
+    theirs['bob@monash.edu']['membership_history'].append('joined')
+    mine['bob@monash.edu'].update(address='Peninsula', phone='0411111111')
+    mine['bob@monash.edu']['membership_history'].append('renewed')
+    saved = second.save(theirs) and first.save(mine)
+
+    record = open_store(path).load()['bob@monash.edu']
+    conflicts = [(conflict.key, conflict.field) for conflict in first.last_conflicts]
+    return [('conflicting edit', saved and record['address'] == 'Peninsula'
+             and conflicts == [('bob@monash.edu', 'address')],
+             f"address {record['address']!r}, conflicts {conflicts}"),
+            ('independent edits', record['phone'] == '0411111111' and record['balance'] == 70,
+             f"phone {record['phone']!r}, balance {record['balance']}"),
+            ('list appends', sorted(record['membership_history']) == ['joined', 'renewed'],
+             f"{record['membership_history']}")]
+
+
+def check_oversell(directory: str) -> List[Tuple[str, bool, str]]:
+    """
+    Checks two writers selling the last unit of a product from the same base.
+
+    :param directory: A data directory without a products.txt.
+    :return: Results as (check name, passed, detail).
+    """
+    path = os.path.join(directory, 'products.txt')
+    with open(path, 'w') as f:
+        json.dump({'1': {'id': '1', 'name': 'Milk', 'quantity': 1}}, f)
+    first, second = open_store(path), open_store(path)
+    mine, theirs = first.load(), second.load()
+    mine['1']['quantity'] -= 1
+    theirs['1']['quantity'] -= 1
+    saved = (first.save(mine), second.save(theirs))
+    stock = open_store(path).load()['1']['quantity']
+    return [('oversell rejected', saved == (True, False) and stock == 0,
+             f"saves {saved}, stock {stock} (expected (True, False), 0)")]
+
+
+def check_rekeying(directory: str, writers: int, rounds: int) -> List[Tuple[str, bool, str]]:
+    """
+    Checks writers creating orders at the same time.
+
+    :param directory: A data directory without an orders.txt.
+    :param writers: Number of writer processes.
+    :param rounds: Orders created by each writer.
+    :return: Results as (check name, passed, detail).
+    """
+    run_writers('orders', directory, writers, rounds)
+    with open(os.path.join(directory, 'orders.txt'), 'r') as f:
+        orders = json.load(f)
+    per_writer: Dict[str, int] = {}
+    for order in orders.values():
+        per_writer[order['user_email']] = per_writer.get(order['user_email'], 0) + 1
+    expected = writers * rounds
+    ids_match = all(key == order['order_id'] for key, order in orders.items())
+    return [('order rekeying', len(orders) == expected and ids_match
+             and sorted(orders, key=int) == [str(i) for i in range(1, expected + 1)]
+             and all(count == rounds for count in per_writer.values()),
+             f"{len(orders)} orders (expected {expected}), IDs 1..{expected} each used once: {ids_match}")]
+
+
+def report(writers: int, rounds: int) -> bool:
+    """
+    Runs every check in a fresh directory and prints the results.
+
+    :param writers: Number of concurrent writer processes.
+    :param rounds: Changes made by each writer.
+    :return: True if every check passed.
+    """
+    results = []
+    for check in (lambda d: check_deltas(d, writers, rounds), check_conflict, check_oversell,
+                  lambda d: check_rekeying(d, writers, rounds)):
+        with tempfile.TemporaryDirectory() as directory:
+            results.extend(check(directory))
+
+    print("=" * 70)
+    print(f"MERGE CHECK ({writers} writers x {rounds} changes)")
+    print("=" * 70)
+    for name, passed, detail in results:
+        print(f"{name:<20} {'PASS' if passed else 'FAIL'}  {detail}")
+    print("=" * 70)
+    return all(passed for _, passed, _ in results)
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="End-to-end check of the versioned store merge.")
+    parser.add_argument('--writers', type=int, default=4, help="concurrent writer processes")
+    parser.add_argument('--rounds', type=int, default=25, help="changes made by each writer")
+    parser.add_argument('--worker', choices=('balance', 'stock', 'orders'), help=argparse.SUPPRESS)
+    parser.add_argument('--dir', help=argparse.SUPPRESS)
+    parser.add_argument('--id', type=int, default=0, help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.worker:
+        run_worker(args.worker, args.dir, args.id, args.rounds)
+        sys.exit(0)
+    sys.exit(0 if report(args.writers, args.rounds) else 1)
@@ -0,0 +1,194 @@
+"""
+order_memory_benchmark.py - Bytes per order held by OrderManager.
+
+Builds synthetic orders and measures the memory retained per order by:
+    1. The previous OrderData layout: an instance __dict__, the user's email
+       and every product ID and name as separate strings, line items as
+       dictionaries and created_at as a datetime (reproduced below as
+       LegacyOrderData).
+    2. The current OrderData: slots, interned strings, tuple line items and
+       an integer timestamp.
+
+Each record is decoded from its own JSON text, as when orders.txt is loaded,
+so no strings are shared between records unless the layout shares them. Each
+layout is built in a fresh interpreter and measured as the growth of its
+resident set size (tracemalloc slows a million-order build by an order of
+magnitude). The round trip through to_dict()/from_dict() is checked on every
+record.
+
+Usage:
+    python benchmarks/order_memory_benchmark.py [--orders N]
+
+Author: Applied10_Group6
+Version: 1.0
+"""
+
+import argparse
+import gc
+import json
+import os
+import random
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterator, List
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src'))
+
+from Order import OrderData, OrderStatus  # noqa: E402
+
+USERS = 50000
+PRODUCTS = 5000
+STATUSES = [status.value for status in OrderStatus]
+LAYOUTS = {'legacy': 'Previous (dict/datetime)', 'compact': 'Compact OrderData'}
+
+
+class LegacyOrderData:
+    """
+    LegacyOrderData - The OrderData layout before compaction, for comparison.
+
+    Author: Applied10_Group6
+    Version: 1.0
+    """
+
+    def __init__(self, data: Dict[str, Any]):
+        """
+        Constructs an order the way OrderData.from_dict used to.
+
+        :param data: Dictionary containing order data.
+        """
+        self.__order_id = data.get('order_id')
+        self.__user_email = data.get('user_email')
+        self.__product_list = data.get('product_list', [])
+        self.__total_price = data.get('total_price', 0.0)
+        self.__status = OrderStatus(data.get('status', 'Pending'))
+        self.__created_at = datetime.strptime(data['created_at'], '%Y-%m-%d %H:%M:%S')
+        self.__version = data.get('version', 0)
+
+
+def synthetic_orders(count: int, seed: int = 5136) -> Iterator[str]:
+    """
+    Generates orders as they would appear in orders.txt, one JSON text each.
+
+    :param count: Number of orders.
+    :param seed: Random seed, so every run measures the same data.
+    :return: Iterator of JSON-encoded order records.
+    """
+    rng = random.Random(seed)
+    start = datetime(2023, 1, 1)
+    for order_id in range(1, count + 1):
+        items = []
+        for _ in range(rng.randint(1, 5)):
+            product = rng.randrange(PRODUCTS)
+            quantity = rng.randint(1, 4)
+            unit_price = round(1 + product % 97 * 0.75, 2)
+            items.append({'product_id': str(product), 'name': f"Product {product} Standard Pack",
+                          'quantity': quantity, 'unit_price': unit_price,
+                          'subtotal': round(unit_price * quantity, 2)})
+        created = start + timedelta(seconds=rng.randrange(2 * 365 * 86400))
+        yield json.dumps({'order_id': str(order_id),
+                          'user_email': f"student{rng.randrange(USERS)}@student.monash.edu",
+                          'product_list': items,
+                          'total_price': round(sum(item['subtotal'] for item in items), 2),
+                          'status': rng.choice(STATUSES),
+                          'created_at': created.strftime('%Y-%m-%d %H:%M:%S'),
+                          'version': 1})
+
+
+def resident_bytes() -> int:
+    """
+    Returns the current resident set size of this process.
+
+    :return: Bytes resident, from /proc where available, else the peak from getrusage.
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except OSError:
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss * 1024
+
+
+def measure(count: int, build: Callable[[Dict[str, Any]], Any]) -> Dict[str, float]:
+    """
+    Builds count orders and measures the memory they retain.
+
+    :param count: Number of orders.
+    :param build: Callable turning a decoded record into the held object.
+    :return: Dictionary with 'bytes_per_order' and 'seconds'.
+    """
+    gc.collect()
+    before = resident_bytes()
+    started = time.perf_counter()
+    held: List[Any] = [build(json.loads(text)) for text in synthetic_orders(count)]
+    seconds = time.perf_counter() - started
+    gc.collect()
+    retained = resident_bytes() - before
+    del held
+    return {'bytes_per_order': retained / count, 'seconds': seconds}
+
+
+def measure_in_child(layout: str, count: int) -> Dict[str, float]:
+    """
+    Measures one layout in a fresh interpreter.
+
+    :param layout: A key of LAYOUTS.
+    :param count: Number of orders.
+    :return: The measure() result.
+    """
+    result = subprocess.run([sys.executable, os.path.abspath(__file__), '--orders', str(count),
+                             '--layout', layout], capture_output=True, text=True, check=True)
+    return json.loads(result.stdout)
+
+
+def check_round_trip(count: int) -> int:
+    """
+    Checks that to_dict() gives back exactly the record from_dict() was given.
+
+    :param count: Number of orders to check.
+    :return: Number of mismatching records.
+    """
+    mismatches = 0
+    for text in synthetic_orders(count):
+        record = json.loads(text)
+        if json.dumps(OrderData.from_dict(record).to_dict()) != text:
+            mismatches += 1
+    return mismatches
+
+
+def report(count: int) -> bool:
+    """
+    Runs both measurements and the round-trip check, and prints the results.
+
+    :param count: Number of synthetic orders.
+    :return: True if every record round-trips losslessly.
+    """
+    legacy = measure_in_child('legacy', count)
+    compact = measure_in_child('compact', count)
+    mismatches = check_round_trip(count)
+
+    print("=" * 70)
+    print(f"ORDER MEMORY BENCHMARK ({count:,} orders)")
+    print("=" * 70)
+    print(f"{'Layout':<28}{'Bytes/order':>14}{'Total MB':>12}{'Build s':>12}")
+    for name, result in ((LAYOUTS['legacy'], legacy), (LAYOUTS['compact'], compact)):
+        print(f"{name:<28}{result['bytes_per_order']:>14.0f}"
+              f"{result['bytes_per_order'] * count / 1e6:>12.1f}{result['seconds']:>12.2f}")
+    print("-" * 70)
+    print(f"Reduction: {1 - compact['bytes_per_order'] / legacy['bytes_per_order']:.0%}")
+    print(f"Lossless round trip: {'PASS' if not mismatches else f'FAIL ({mismatches} records)'}")
+    print("=" * 70)
+    return not mismatches
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Bytes per order, previous vs compact OrderData.")
+    parser.add_argument('--orders', type=int, default=1000000, help="number of synthetic orders")
+    parser.add_argument('--layout', choices=sorted(LAYOUTS), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    if args.layout:
+        builder = LegacyOrderData if args.layout == 'legacy' else OrderData.from_dict
+        print(json.dumps(measure(args.orders, builder)))
+        sys.exit(0)
+    sys.exit(0 if report(args.orders) else 1)
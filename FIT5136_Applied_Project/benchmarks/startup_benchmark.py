@@ -0,0 +1,154 @@
+"""
+startup_benchmark.py - Import-time budget and cold-start benchmark.
+
+Measures, in fresh interpreters:
+    1. The cumulative import time of mainPage, from `python -X importtime`,
+       together with the slowest modules it pulls in.
+    2. Which page and store modules are already loaded when the main menu is
+       shown; these should all be deferred until first use.
+    3. Cold-start time from launch to the main menu, read from
+       `Application.py --profile-startup` over several runs.
+
+Each figure is compared against its target and the script exits with status 1
+if any target is missed, so it can be run in CI or before a release.
+
+Usage:
+    python benchmarks/startup_benchmark.py [--runs N] [--record FILE]
+
+Author: Applied10_Group6
+Version: 1.0
+"""
+
+import argparse
+import json
+import os
+import re
+import statistics
+import subprocess
+import sys
+import time
+from typing import Dict, List, Optional, Tuple
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+SRC_DIR = os.path.join(ROOT_DIR, 'src')
+APPLICATION = os.path.join(ROOT_DIR, 'Application.py')
+
+# Targets tracked by this benchmark
+IMPORT_BUDGET_MS = 40.0        # Cumulative `import mainPage`
+COLD_START_TARGET_MS = 100.0   # Median launch-to-main-menu time
+DEFERRED_MODULES = ('AdminPage', 'UserPage', 'ShoppingPage', 'searchProduct', 'product', 'cart', 'Order',
+                    'dataStore', 'snapshot', 'stockIndex', 'stockReservation')
+
+IMPORTTIME_LINE = re.compile(r'^import time:\s+(\d+) \|\s+(\d+) \| (\s*)(\S+)$')
+MENU_READY_LINE = re.compile(r'To main menu:\s+([\d.]+) ms')
+
+
+def measure_import_time(module: str = 'mainPage', top: int = 10) -> Tuple[float, List[Tuple[str, float, float]]]:
+    """
+    Imports a module in a fresh interpreter under -X importtime.
+
+    :param module: The module to import.
+    :param top: Number of slowest modules to return.
+    :return: Tuple of (cumulative milliseconds for the module,
+             [(module, self ms, cumulative ms)] for the slowest modules by cumulative time).
+    """
+    result = subprocess.run([sys.executable, '-X', 'importtime', '-c', f'import {module}'],
+                            cwd=SRC_DIR, capture_output=True, text=True, check=True)
+    total_ms = 0.0
+    modules = []
+    for line in result.stderr.splitlines():
+        match = IMPORTTIME_LINE.match(line)
+        if not match:
+            continue
+        self_us, cumulative_us, indent, name = match.groups()
+        if name == module and not indent:
+            total_ms = int(cumulative_us) / 1000
+        else:
+            modules.append((name, int(self_us) / 1000, int(cumulative_us) / 1000))
+    modules.sort(key=lambda entry: entry[2], reverse=True)
+    return total_ms, modules[:top]
+
+
+def loaded_at_menu() -> List[str]:
+    """
+    Builds MainPage in a fresh interpreter and lists the deferred modules it loaded.
+
+    :return: Names from DEFERRED_MODULES that were imported before any login.
+    """
+    probe = ("import sys, mainPage; mainPage.MainPage(); "
+             f"print(' '.join(m for m in {DEFERRED_MODULES!r} if m in sys.modules))")
+    result = subprocess.run([sys.executable, '-c', probe], cwd=SRC_DIR,
+                            capture_output=True, text=True, check=True)
+    return result.stdout.split()
+
+
+def measure_cold_start(runs: int = 5) -> List[Tuple[float, float]]:
+    """
+    Launches the application repeatedly and exits at the main menu.
+
+    :param runs: Number of launches.
+    :return: One (in-process ms to main menu, wall-clock ms for the whole process) pair per run.
+    """
+    samples = []
+    for _ in range(runs):
+        started = time.perf_counter()
+        # Enter past the banner and the profile, then 3 to exit at the main menu
+        result = subprocess.run([sys.executable, APPLICATION, '--profile-startup'],
+                                input='\n\n3\n', capture_output=True, text=True)
+        wall_ms = (time.perf_counter() - started) * 1000
+        match = MENU_READY_LINE.search(result.stdout)
+        if match is None:
+            raise RuntimeError(f"Application did not report startup time:\n{result.stdout}{result.stderr}")
+        samples.append((float(match.group(1)), wall_ms))
+    return samples
+
+
+def report(runs: int, record: Optional[str]) -> bool:
+    """
+    Runs every measurement, prints the results against their targets and optionally records them.
+
+    :param runs: Number of cold-start launches.
+    :param record: File to append a JSON line of results to, or None.
+    :return: True if every target was met.
+    """
+    import_ms, slowest = measure_import_time()
+    early = loaded_at_menu()
+    samples = measure_cold_start(runs)
+    menu_ms = statistics.median(sample[0] for sample in samples)
+    wall_ms = statistics.median(sample[1] for sample in samples)
+
+    checks: Dict[str, bool] = {
+        'import budget': import_ms <= IMPORT_BUDGET_MS,
+        'deferred modules': not early,
+        'cold start': menu_ms <= COLD_START_TARGET_MS,
+    }
+
+    print("=" * 70)
+    print("STARTUP BENCHMARK")
+    print("=" * 70)
+    print(f"import mainPage:      {import_ms:8.2f} ms  (budget {IMPORT_BUDGET_MS:.0f} ms)")
+    print("Slowest imports (cumulative / self ms):")
+    for name, self_ms, cumulative_ms in slowest:
+        print(f"    {name:<28}{cumulative_ms:8.2f}{self_ms:10.2f}")
+    print(f"Loaded before login:  {', '.join(early) if early else 'none'}")
+    print(f"Launch to main menu:  {menu_ms:8.2f} ms  median of {runs} (target {COLD_START_TARGET_MS:.0f} ms)")
+    print(f"Whole process:        {wall_ms:8.2f} ms  median, including interpreter start and exit")
+    print("-" * 70)
+    for name, passed in checks.items():
+        print(f"{name:<20} {'PASS' if passed else 'FAIL'}")
+    print("=" * 70)
+
+    if record:
+        with open(record, 'a') as f:
+            f.write(json.dumps({'time': time.strftime('%Y-%m-%dT%H:%M:%S'), 'python': sys.version.split()[0],
+                                'import_ms': round(import_ms, 2), 'menu_ms': round(menu_ms, 2),
+                                'wall_ms': round(wall_ms, 2), 'loaded_before_login': early}) + '\n')
+    return all(checks.values())
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description="Import-time budget and cold-start benchmark.")
+    parser.add_argument('--runs', type=int, default=5, help="cold-start launches to take the median of")
+    parser.add_argument('--record', metavar='FILE', help="append the results as a JSON line to FILE")
+    args = parser.parse_args()
+    sys.exit(0 if report(args.runs, args.record) else 1)
@@ -13,9 +13,14 @@ Version: 1.0
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, List, Tuple
 from product import Product
-import json
 import os
 from InputHandler import InputHandler, BackToMainException, ExitApplicationException
+from dataStore import PromoCodeStore
+from dataContext import DataContext
+from datetime import datetime
+from priceEvents import PriceChangeBus, PRICE_CHANGES
+from promotionSchedule import PROMOTIONS, PromotionScheduler
+from stockIndex import StockIndex
 
 
 class Page(ABC):
@@ -70,7 +75,8 @@ class ProductManager:
     LOW_STOCK_DEFAULT_THRESHOLD = 5
 
     @staticmethod
-    def display_product_list(products: Dict[str, Any], title: str = "All Products") -> None:
+    def display_product_list(products: Dict[str, Any], title: str = "All Products",
+                             stock_index: Optional[StockIndex] = None) -> None:
         """
         Displays a formatted list of products with in-stock items first.
 
@@ -79,28 +85,39 @@ class ProductManager:
 
         :param products: Dictionary mapping product IDs to product information.
         :param title: Display title for the product list.
+        :param stock_index: Index of product quantities, used to find out-of-stock items.
         """
         if not products:
             print("No products in the system.")
             return
 
         print(f"\n--- {title} ---")
-        in_stock, out_of_stock = ProductManager._separate_by_stock(products)
+        in_stock, out_of_stock = ProductManager._separate_by_stock(products, stock_index)
 
         for product_id, product in in_stock + out_of_stock:
             ProductManager._display_single_product(product_id, product)
 
     @staticmethod
-    def _separate_by_stock(products: Dict[str, Any]) -> Tuple[List[Tuple], List[Tuple]]:
+    def _separate_by_stock(products: Dict[str, Any],
+                           stock_index: Optional[StockIndex] = None) -> Tuple[List[Tuple], List[Tuple]]:
         """
         Separates products into in-stock and out-of-stock lists.
 
         This private helper method organizes products by availability status
-        for improved display organization.
+        for improved display organization. With a stock index, the
+        out-of-stock products are read from the index instead of being tested
+        one by one.
 
         :param products: Dictionary of product data.
+        :param stock_index: Index of product quantities, if available.
         :return: Tuple containing (in_stock_list, out_of_stock_list).
         """
+        if stock_index is not None:
+            out_of_stock = [(pid, products[pid]) for pid in stock_index.out_of_stock() if pid in products]
+            empty = {pid for pid, _ in out_of_stock}
+            in_stock = [(pid, p) for pid, p in products.items() if pid not in empty]
+            return in_stock, out_of_stock
+
         in_stock = []
         out_of_stock = []
 
@@ -143,17 +160,22 @@ class ProductManager:
         print("-" * 20)
 
     @staticmethod
-    def get_low_stock_products(products: Dict[str, Any], threshold: int) -> Dict[str, Any]:
+    def get_low_stock_products(products: Dict[str, Any], threshold: int,
+                               stock_index: Optional[StockIndex] = None) -> Dict[str, Any]:
         """
         Filters and returns products with stock levels at or below the threshold.
 
         This method helps administrators identify products that need restocking
-        by filtering items based on inventory levels.
+        by filtering items based on inventory levels. With a stock index the
+        catalog is not scanned, and the products come lowest stock first.
 
         :param products: Dictionary of all product data.
         :param threshold: Maximum stock level to include in results.
+        :param stock_index: Index of product quantities, if available.
         :return: Dictionary containing only low-stock products.
         """
+        if stock_index is not None:
+            return {pid: products[pid] for pid in stock_index.at_most(threshold) if pid in products}
         return {
             pid: p for pid, p in products.items()
             if 'quantity' in p and p['quantity'] <= threshold
@@ -228,9 +250,68 @@ class PromotionManager:
             return False
 
         products[product_id]['promotion_price'] = promo_price
+        PRICE_CHANGES.publish(product_id, products[product_id])
         print(f"Promotion price set for {products[product_id]['name']}.")
         return True
 
+    @staticmethod
+    def schedule_promotion(products: Dict[str, Any], product_id: str, promo_price: float,
+                           start: datetime, end: datetime,
+                           scheduler: PromotionScheduler = PROMOTIONS) -> Optional[str]:
+        """
+        Schedules a promotional price for a product between two times.
+
+        The same rule as set_promotion applies: the promotion price must be
+        lower than the original price.
+
+        :param products: Dictionary of all product data.
+        :param product_id: The unique identifier of the product to promote.
+        :param promo_price: The promotional price to charge during the window.
+        :param start: When the promotion starts.
+        :param end: When the promotion ends.
+        :param scheduler: The promotion scheduler.
+        :return: The scheduled promotion's ID, or None if it was rejected.
+        """
+        if product_id not in products:
+            print("Product not found.")
+            return None
+
+        if promo_price >= products[product_id]['price']:
+            print("Promotion price must be less than original price.")
+            return None
+
+        try:
+            promotion_id = scheduler.schedule(product_id, promo_price, start, end)
+        except ValueError as e:
+            print(f"Error: {e}")
+            return None
+        print(f"Promotion {promotion_id} scheduled for {products[product_id]['name']} "
+              f"from {start:%Y-%m-%d %H:%M} to {end:%Y-%m-%d %H:%M}.")
+        return promotion_id
+
+    @staticmethod
+    def list_scheduled_promotions(products: Dict[str, Any],
+                                  scheduler: PromotionScheduler = PROMOTIONS) -> None:
+        """
+        Displays the scheduled promotions that have not yet ended.
+
+        :param products: Dictionary of all product data.
+        :param scheduler: The promotion scheduler.
+        """
+        scheduler.advance()
+        promotions = scheduler.list_promotions()
+        print("\n--- Scheduled Promotions ---")
+        if not promotions:
+            print("No scheduled promotions.")
+            return
+
+        for promotion in promotions:
+            name = products.get(promotion['product_id'], {}).get('name', '(removed product)')
+            state = "Active" if promotion['active'] else "Upcoming"
+            print(f"#{promotion['id']} | {state} | Product {promotion['product_id']}: {name} | "
+                  f"Promotion Price: ${promotion['promotion_price']} | "
+                  f"{promotion['start']} to {promotion['end']}")
+
     @staticmethod
     def cancel_promotion(products: Dict[str, Any], product_id: str) -> bool:
         """
@@ -252,9 +333,103 @@ class PromotionManager:
             return False
 
         del products[product_id]['promotion_price']
+        PRICE_CHANGES.publish(product_id, products[product_id])
         print(f"Promotion cancelled for {products[product_id]['name']}.")
         return True
 
+    @staticmethod
+    def select_products(products: Dict[str, Any], where: Dict[str, Any]) -> List[str]:
+        """
+        Returns the IDs of products whose fields equal every given value.
+
+        Text values are compared case-insensitively, as in category browsing.
+
+        :param products: Dictionary of all product data.
+        :param where: Field names mapped to the required values (empty matches all).
+        :return: Matching product IDs.
+        """
+        wanted = {field: value.lower() if isinstance(value, str) else value
+                  for field, value in where.items()}
+
+        def matches(product: Dict[str, Any]) -> bool:
+            for field, value in wanted.items():
+                actual = product.get(field)
+                if (actual.lower() if isinstance(actual, str) else actual) != value:
+                    return False
+            return True
+
+        return [pid for pid, p in products.items() if matches(p)]
+
+    @staticmethod
+    def bulk_update_prices(products: Dict[str, Any], field: str, factor: float,
+                           where: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Sets a price field to the regular price times a factor for every matching product.
+
+        The pass is columnar: the matching rows' prices are gathered into
+        lists, the new column is computed in one sweep, and every row is
+        validated before any product is changed. If any row would break a
+        pricing rule (promotion_price < price, member_price <= price, no
+        negative prices) nothing is applied.
+
+        :param products: Dictionary of all product data, updated in place.
+        :param field: 'promotion_price', 'member_price' or 'price'.
+        :param factor: Multiplier applied to each product's regular price.
+        :param where: Field filter, as for select_products (e.g. {'category': 'Food'}).
+        :return: Dictionary with 'matched', 'updated', 'violations' ((ID, reason) pairs)
+                 and 'applied'.
+        :raises ValueError: If field is not a price field.
+        """
+        if field not in PriceChangeBus.PRICE_FIELDS:
+            raise ValueError(f"Not a price field: {field}")
+        ids = PromotionManager.select_products(products, where)
+        prices = [products[pid]['price'] for pid in ids]
+        new_values = [round(price * factor, 2) for price in prices]
+
+        # Columns the rules are checked against, after the change
+        new_prices = new_values if field == 'price' else prices
+        member_prices = (new_values if field == 'member_price'
+                         else [products[pid].get('member_price', 0) for pid in ids])
+        promo_prices = (new_values if field == 'promotion_price'
+                        else [products[pid].get('promotion_price') for pid in ids])
+
+        violations = []
+        for pid, value, price, member, promo in zip(ids, new_values, new_prices, member_prices, promo_prices):
+            if value < 0:
+                violations.append((pid, f"{field.replace('_', ' ')} would be negative"))
+            elif member > price:
+                violations.append((pid, f"member price ${member:.2f} would exceed price ${price:.2f}"))
+            elif promo is not None and promo >= price:
+                violations.append((pid, f"promotion price ${promo:.2f} would not be below price ${price:.2f}"))
+
+        if violations:
+            return {'matched': len(ids), 'updated': 0, 'violations': violations, 'applied': False}
+
+        updated = 0
+        for pid, value in zip(ids, new_values):
+            product = products[pid]
+            if product.get(field) != value:
+                product[field] = value
+                PRICE_CHANGES.publish(pid, product)
+                updated += 1
+        return {'matched': len(ids), 'updated': updated, 'violations': [], 'applied': True}
+
+    @staticmethod
+    def bulk_cancel_promotions(products: Dict[str, Any], where: Dict[str, Any]) -> int:
+        """
+        Cancels the promotion of every matching product that has one.
+
+        :param products: Dictionary of all product data, updated in place.
+        :param where: Field filter, as for select_products.
+        :return: Number of promotions cancelled.
+        """
+        cancelled = 0
+        for pid in PromotionManager.select_products(products, where):
+            if products[pid].pop('promotion_price', None) is not None:
+                PRICE_CHANGES.publish(pid, products[pid])
+                cancelled += 1
+        return cancelled
+
     @staticmethod
     def list_promotions(products: Dict[str, Any]) -> None:
         """
@@ -285,11 +460,13 @@ class PromoCodeAdminManager:
 
     This class provides comprehensive promotional code management including creation,
     editing, deletion, and listing. It handles file-based persistence and validation
-    of promo code data, demonstrating the Single Responsibility Principle.
+    of promo code data, demonstrating the Single Responsibility Principle. Codes
+    are served from the shared PromoCodeStore, so the file is re-read only after
+    it changes.
 
     """
 
-    PROMO_CODE_FILE = 'promo_codes.json'
+    PROMO_CODE_FILE = DataContext.PROMO_CODE_FILE
 
     @staticmethod
     def load_promo_codes() -> Dict[str, Any]:
@@ -301,7 +478,14 @@ class PromoCodeAdminManager:
 
         :return: Dictionary mapping promo codes to their configurations.
         """
-        if not os.path.exists(PromoCodeAdminManager.PROMO_CODE_FILE):
+        store = PromoCodeStore.for_file(PromoCodeAdminManager.PROMO_CODE_FILE)
+        try:
+            promo_codes = store.load()
+        except Exception as e:
+            print(f"Error loading promo codes: {e}")
+            return {}
+
+        if promo_codes is None:
             # Initialize with default promo codes
             default_codes = {
                 'NEWMONASH20': {
@@ -333,13 +517,7 @@ class PromoCodeAdminManager:
             }
             PromoCodeAdminManager.save_promo_codes(default_codes)
             return default_codes
-
-        try:
-            with open(PromoCodeAdminManager.PROMO_CODE_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading promo codes: {e}")
-            return {}
+        return promo_codes
 
     @staticmethod
     def save_promo_codes(promo_codes: Dict[str, Any]) -> bool:
@@ -353,8 +531,7 @@ class PromoCodeAdminManager:
         :return: True if save was successful, False otherwise.
         """
         try:
-            with open(PromoCodeAdminManager.PROMO_CODE_FILE, 'w', encoding='utf-8') as f:
-                json.dump(promo_codes, f, indent=4, ensure_ascii=False)
+            PromoCodeStore.for_file(PromoCodeAdminManager.PROMO_CODE_FILE).save(promo_codes)
             return True
         except Exception as e:
             print(f"Error saving promo codes: {e}")
@@ -517,17 +694,19 @@ class AdminPage(Page):
 
     """
 
-    def __init__(self, products_data: Dict[str, Any], admin_email: str = "admin@monash.edu"):
+    def __init__(self, context: DataContext, admin_email: str = "admin@monash.edu"):
         """
-        Constructs an AdminPage instance with product data and admin email.
+        Constructs an AdminPage instance with the shared data context and admin email.
 
-        :param products_data: Dictionary mapping product IDs to product information.
+        :param context: The application's DataContext, which owns the product data.
         :param admin_email: Email address of the logged-in administrator.
         """
         # Use private attribute for encapsulation
-        self.__products = products_data
+        self.__context = context
+        self.__products = context.products
         self.__admin_email = admin_email
         self.__admin_info = self.__load_admin_info()
+        self.__stock_alerts: List[str] = []
 
     @property
     def products(self) -> Dict[str, Any]:
@@ -544,28 +723,47 @@ class AdminPage(Page):
 
         This method implements the abstract run() method from the Page class,
         providing the main interaction loop for administrative functions.
+        While it runs, products falling to the low-stock threshold are
+        reported above the menu.
         """
-        while True:
-            try:
-                ScreenManager.clear_screen()
-                self.__save_data()
-                self.__display_menu()
-                choice = InputHandler.get_choice(
-                    "Enter your choice: ",
-                    valid_choices=['1', '2', '3', '4', '5', '6', '7', '8', '9', '10'],
-                    allow_main=True    # Allow returning to main menu
-                )
-
-                if not self.__handle_menu_choice(choice):
+        stock_index = self.__context.stock_index
+        stock_index.add_alert(ProductManager.LOW_STOCK_DEFAULT_THRESHOLD, self.__on_low_stock)
+        try:
+            while True:
+                try:
+                    ScreenManager.clear_screen()
+                    self.__save_data()
+                    self.__display_menu()
+                    choice = InputHandler.get_choice(
+                        "Enter your choice: ",
+                        valid_choices=['1', '2', '3', '4', '5', '6', '7', '8', '9', '10', '11', '12', '13'],
+                        allow_main=True    # Allow returning to main menu
+                    )
+
+                    if not self.__handle_menu_choice(choice):
+                        break
+
+                except BackToMainException:
+                    print("\n↩️  Returning to main menu...")
+                    input("Press Enter to continue...")
                     break
+                except ExitApplicationException as e:
+                    InputHandler.handle_navigation_exception(e)
+                    break
+        finally:
+            stock_index.remove_alert(ProductManager.LOW_STOCK_DEFAULT_THRESHOLD, self.__on_low_stock)
 
-            except BackToMainException:
-                print("\n↩️  Returning to main menu...")
-                input("Press Enter to continue...")
-                break
-            except ExitApplicationException as e:
-                InputHandler.handle_navigation_exception(e)
-                break
+    def __on_low_stock(self, product_id: str, quantity: int, threshold: int) -> None:
+        """
+        Records a low-stock alert, shown above the menu the next time it is displayed.
+
+        :param product_id: The product whose stock fell.
+        :param quantity: Its new quantity.
+        :param threshold: The alert threshold.
+        """
+        name = self.__products.get(product_id, {}).get('name', product_id)
+        state = "is out of stock" if quantity <= 0 else f"is down to {quantity} (<= {threshold})"
+        self.__stock_alerts.append(f"⚠️  Low stock: {name} (ID {product_id}) {state}")
 
     def __display_menu(self) -> None:
         """
@@ -577,6 +775,9 @@ class AdminPage(Page):
         print("\n" + "="*60)
         print("  Welcome Admin in Monash Online Merchant System")
         print("="*60)
+        for alert in self.__stock_alerts:
+            print(alert)
+        self.__stock_alerts.clear()
         print("1. List All Products")
         print("2. Add a New Product")
         print("3. Edit an Existing Product")
@@ -587,6 +788,9 @@ class AdminPage(Page):
         print("8. Promotion Management")
         print("9. Promo Code Management")
         print("10. View My Profile")
+        print("11. Sales Report")
+        print("12. Bulk Product Import/Export")
+        print("13. Restock Suggestions")
         print("="*60)
 
     def __handle_menu_choice(self, choice: str) -> bool:
@@ -608,7 +812,10 @@ class AdminPage(Page):
             '7': self.low_stock_report,
             '8': self.promotion_management,
             '9': self.promo_code_management,
-            '10': self.view_profile
+            '10': self.view_profile,
+            '11': self.sales_report,
+            '12': self.bulk_products,
+            '13': self.restock_suggestions
         }
 
         if choice == '5':
@@ -623,36 +830,24 @@ class AdminPage(Page):
 
     def __load_admin_info(self) -> Dict[str, Any]:
         """
-        Loads administrator information from users data file.
+        Loads administrator information from the shared account data.
 
         This private method retrieves the admin's personal information
         including email, name, and contact details.
 
         :return: Dictionary containing admin information, or default values if not found.
         """
-        try:
-            # Load users data directly to avoid circular import
-            if os.path.exists('users.txt'):
-                with open('users.txt', 'r') as f:
-                    users_data = json.load(f)
-                    if self.__admin_email in users_data:
-                        return users_data[self.__admin_email]
-
-            # Return default admin info if not found in users.txt
-            return {
-                'email': self.__admin_email,
-                'first_name': 'Admin',
-                'last_name': 'User',
-                'mobile_number': 'N/A'
-            }
-        except Exception as e:
-            print(f"Error loading admin information: {e}")
-            return {
-                'email': self.__admin_email,
-                'first_name': 'Admin',
-                'last_name': 'User',
-                'mobile_number': 'N/A'
-            }
+        account = self.__context.find_account(self.__admin_email)
+        if account is not None:
+            return account
+
+        # Return default admin info if the admin has no account record
+        return {
+            'email': self.__admin_email,
+            'first_name': 'Admin',
+            'last_name': 'User',
+            'mobile_number': 'N/A'
+        }
 
     def view_profile(self) -> None:
         """
@@ -677,14 +872,18 @@ class AdminPage(Page):
         """
         Provides interface for managing product promotional pricing.
 
-        This method displays a submenu for setting, canceling, and listing
-        product promotions, delegating operations to PromotionManager.
+        This method displays a submenu for setting, canceling, scheduling and
+        listing product promotions, delegating operations to PromotionManager.
         """
         print("\n--- Promotion Management ---")
         print("1. Set Promotion Price for a Product")
         print("2. Cancel Promotion for a Product")
         print("3. List Products with Promotion")
-        print("4. Back")
+        print("4. Bulk Price Update by Category")
+        print("5. Schedule a Promotion")
+        print("6. List Scheduled Promotions")
+        print("7. Cancel a Scheduled Promotion")
+        print("8. Back")
         choice = input("Enter your choice: ").strip()
 
         if choice == '1':
@@ -695,6 +894,15 @@ class AdminPage(Page):
             PromotionManager.list_promotions(self.__products)
             input("\nPress Enter to continue...")
         elif choice == '4':
+            self.__bulk_price_update()
+        elif choice == '5':
+            self.__schedule_promotion()
+        elif choice == '6':
+            PromotionManager.list_scheduled_promotions(self.__products)
+            input("\nPress Enter to continue...")
+        elif choice == '7':
+            self.__cancel_scheduled_promotion()
+        elif choice == '8':
             return
         else:
             print("Invalid choice.")
@@ -912,6 +1120,110 @@ class AdminPage(Page):
 
         input("\nPress Enter to continue...")
 
+    def __schedule_promotion(self) -> None:
+        """
+        Handles user interaction for scheduling a product promotion.
+
+        The promotion is saved to the schedule and starts and ends on its
+        own; the product record itself is not changed.
+        """
+        product_id = input("Enter product ID to schedule a promotion: ").strip()
+
+        if product_id not in self.__products:
+            print("Product not found.")
+            input("\nPress Enter to continue...")
+            return
+
+        try:
+            product_name = self.__products[product_id]['name']
+            promo_price = float(input(f"Enter promotion price for {product_name}: "))
+        except ValueError:
+            print("Invalid price. Please enter a number.")
+            input("\nPress Enter to continue...")
+            return
+
+        try:
+            start = datetime.strptime(input("Start (YYYY-MM-DD HH:MM): ").strip(), '%Y-%m-%d %H:%M')
+            end = datetime.strptime(input("End (YYYY-MM-DD HH:MM): ").strip(), '%Y-%m-%d %H:%M')
+        except ValueError:
+            print("Invalid date. Please use the format YYYY-MM-DD HH:MM.")
+            input("\nPress Enter to continue...")
+            return
+
+        PromotionManager.schedule_promotion(self.__products, product_id, promo_price, start, end)
+        input("\nPress Enter to continue...")
+
+    def __cancel_scheduled_promotion(self) -> None:
+        """
+        Handles user interaction for cancelling a scheduled promotion.
+        """
+        PromotionManager.list_scheduled_promotions(self.__products)
+        promotion_id = input("\nEnter the promotion number to cancel: ").strip().lstrip('#')
+        if PROMOTIONS.cancel(promotion_id):
+            print(f"Scheduled promotion {promotion_id} cancelled.")
+        else:
+            print("Scheduled promotion not found.")
+        input("\nPress Enter to continue...")
+
+    def __bulk_price_update(self) -> None:
+        """
+        Handles user interaction for updating prices of many products at once.
+
+        The administrator picks the products by category and subcategory,
+        then a price field and a multiplier of the regular price. All
+        changes are validated together and saved in a single write.
+        """
+        where = {}
+        category = input("Category (blank for all): ").strip()
+        if category:
+            where['category'] = category
+        subcategory = input("Subcategory (blank for all): ").strip()
+        if subcategory:
+            where['subcategory'] = subcategory
+
+        matched = len(PromotionManager.select_products(self.__products, where))
+        if not matched:
+            print("No products match.")
+            input("\nPress Enter to continue...")
+            return
+
+        print(f"{matched} product(s) match.")
+        print("1. Set Promotion Price")
+        print("2. Set Member Price")
+        print("3. Set Regular Price")
+        print("4. Cancel Promotions")
+        fields = {'1': 'promotion_price', '2': 'member_price', '3': 'price'}
+        choice = input("Enter your choice: ").strip()
+
+        if choice == '4':
+            if input(f"Cancel promotions for {matched} product(s)? (y/n): ").strip().lower() == 'y':
+                cancelled = PromotionManager.bulk_cancel_promotions(self.__products, where)
+                if cancelled:
+                    self.__save_data()
+                print(f"✅ Cancelled {cancelled} promotion(s).")
+        elif choice in fields:
+            field = fields[choice]
+            try:
+                factor = float(input("Multiplier of the regular price (e.g. 0.8 for 20% off): "))
+            except ValueError:
+                print("Invalid multiplier. Please enter a number.")
+                input("\nPress Enter to continue...")
+                return
+            if input(f"Set {field.replace('_', ' ')} = price x {factor} for {matched} product(s)? (y/n): "
+                     ).strip().lower() == 'y':
+                result = PromotionManager.bulk_update_prices(self.__products, field, factor, where)
+                if result['applied']:
+                    if result['updated']:
+                        self.__save_data()
+                    print(f"✅ Updated {result['updated']} of {result['matched']} product(s).")
+                else:
+                    print(f"❌ No changes made: {len(result['violations'])} product(s) would break pricing rules.")
+                    for pid, reason in result['violations'][:10]:
+                        print(f"  {pid}: {reason}")
+        else:
+            print("Invalid choice.")
+        input("\nPress Enter to continue...")
+
     def __cancel_promotion(self) -> None:
         """
         Handles user interaction for canceling a product promotion.
@@ -933,7 +1245,7 @@ class AdminPage(Page):
         This method delegates to ProductManager for formatted display
         of all product information.
         """
-        ProductManager.display_product_list(self.__products, "All Products")
+        ProductManager.display_product_list(self.__products, "All Products", self.__context.stock_index)
         input("\nPress Enter to continue...")
 
     def add_product(self) -> None:
@@ -959,6 +1271,7 @@ class AdminPage(Page):
 
         # Add to products and save
         self.__products[product_id] = product_data
+        self.__context.stock_index.update(product_id, product_data['quantity'])
         self.__save_data()
         print("✅ Product added successfully!")
         input("\nPress Enter to continue...")
@@ -1132,6 +1445,8 @@ class AdminPage(Page):
                         return False
 
                 product[field] = float_value
+                if field in PriceChangeBus.PRICE_FIELDS:
+                    PRICE_CHANGES.publish(product['id'], product)
             elif field_type == int:
                 int_value = int(new_value)
                 # Validate that quantity is non-negative (natural number including 0)
@@ -1139,6 +1454,8 @@ class AdminPage(Page):
                     print("Error: Quantity cannot be negative. Please enter a natural number (0 or greater).")
                     return False
                 product[field] = int_value
+                if field == 'quantity':
+                    self.__context.stock_index.update(product['id'], int_value)
             return True
         except ValueError:
             print(f"Invalid input. {field.replace('_', ' ').title()} must be a {field_type.__name__}.")
@@ -1163,6 +1480,7 @@ class AdminPage(Page):
 
         if confirm == 'y':
             del self.__products[product_id]
+            self.__context.stock_index.remove(product_id)
             self.__save_data()
             print("✅ Product deleted successfully.")
         else:
@@ -1178,7 +1496,8 @@ class AdminPage(Page):
         presents them for administrator review.
         """
         threshold = self.__get_stock_threshold()
-        low_stock_products = ProductManager.get_low_stock_products(self.__products, threshold)
+        low_stock_products = ProductManager.get_low_stock_products(self.__products, threshold,
+                                                                   self.__context.stock_index)
 
         if not low_stock_products:
             print(f"No low stock items (<= {threshold}).")
@@ -1191,6 +1510,124 @@ class AdminPage(Page):
         )
         input("\nPress Enter to continue...")
 
+    def sales_report(self) -> None:
+        """
+        Displays units sold and revenue over a chosen period.
+
+        Figures come from the sales counters kept with the orders, so no
+        order history is replayed.
+        """
+        print("\n--- Sales Report ---")
+        print("1. Last 7 Days")
+        print("2. Last 30 Days")
+        print("3. All Time")
+        periods = {'1': (7, "Last 7 Days"), '2': (30, "Last 30 Days"), '3': (None, "All Time")}
+        choice = input("Choose a period (default 1): ").strip() or '1'
+        if choice not in periods:
+            print("Invalid choice.")
+            input("\nPress Enter to continue...")
+            return
+        days, title = periods[choice]
+        sales = self.__context.order_manager.sales
+        summary = sales.summary(days)
+        units = sum(counters[0] for counters in summary['products'].values())
+        revenue = sum(counters[1] for counters in summary['products'].values())
+
+        print("\n" + "="*60)
+        print(f"  📈 Sales Report - {title}")
+        print("="*60)
+        print(f"Orders: {summary['orders']}    Units: {units}    Revenue: ${revenue:.2f}")
+
+        top = sales.top_products(limit=10, days=days)
+        print("\nTop Sellers:")
+        if not top:
+            print("  No sales in this period.")
+        for rank, (product_id, units_sold, product_revenue) in enumerate(top, 1):
+            name = self.__products.get(product_id, {}).get('name', f"Product {product_id}")
+            print(f"  {rank:>2}. {name:<30} {units_sold:>6} units  ${product_revenue:>10.2f}")
+
+        print("\nRevenue by Category:")
+        categories = sorted(summary['categories'].items(), key=lambda entry: entry[1][1], reverse=True)
+        for category, (units_sold, category_revenue) in categories:
+            if units_sold > 0:
+                print(f"  {category:<32} {units_sold:>6} units  ${category_revenue:>10.2f}")
+        print("="*60)
+        input("\nPress Enter to continue...")
+
+    def restock_suggestions(self) -> None:
+        """
+        Lists the products forecast to sell out before a restock could arrive.
+
+        Forecasts use each product's rate of sale, kept up to date as orders
+        are placed, so no order history is replayed.
+        """
+        from restockAdvisor import LEAD_TIME_DAYS, RestockAdvisor
+
+        print("\n--- Restock Suggestions ---")
+        try:
+            lead_input = input(f"Delivery lead time in days (default {LEAD_TIME_DAYS}): ").strip()
+            lead_time = float(lead_input) if lead_input else LEAD_TIME_DAYS
+        except ValueError:
+            print(f"Invalid number. Using default {LEAD_TIME_DAYS}.")
+            lead_time = LEAD_TIME_DAYS
+
+        advisor = RestockAdvisor(self.__context.order_manager.velocity, lead_time_days=lead_time)
+        suggestions = advisor.suggestions(self.__products)
+        if not suggestions:
+            print("No products are forecast to run out before a restock could arrive.")
+            input("\nPress Enter to continue...")
+            return
+
+        print("\n" + "="*80)
+        print(f"{'#':>3}  {'Product':<28} {'Stock':>6} {'Sold/day':>9} {'Days left':>10} "
+              f"{'Reorder at':>11} {'Order':>7}")
+        print("-"*80)
+        for rank, entry in enumerate(suggestions, 1):
+            print(f"{rank:>3}. {entry['name'][:28]:<28} {entry['quantity']:>6} {entry['daily_rate']:>9.2f} "
+                  f"{entry['days_left']:>10.1f} {entry['reorder_point']:>11} {entry['order_quantity']:>7}")
+        print("="*80)
+        input("\nPress Enter to continue...")
+
+    def bulk_products(self) -> None:
+        """
+        Imports products from, or exports them to, a CSV or NDJSON file.
+
+        An import validates every row with the add-product rules, reports
+        rejected rows in an error file and saves the catalog once at the end.
+        """
+        from productBulk import ProductBulkIO
+
+        print("\n--- Bulk Product Import/Export ---")
+        print("1. Import Products from File")
+        print("2. Export Products to File")
+        print("3. Back")
+        choice = input("Enter your choice: ").strip()
+        if choice not in ('1', '2'):
+            return
+
+        path = input("File path (.csv, or .ndjson/.jsonl): ").strip()
+        if not path:
+            print("Error: A file path is required.")
+            input("\nPress Enter to continue...")
+            return
+        try:
+            if choice == '1':
+                result = ProductBulkIO.import_products(path, self.__products)
+                self.__context.stock_index.rebuild(self.__products)
+                self.__save_data()
+                print(f"✅ Imported {result['rows']} row(s): {result['created']} created, "
+                      f"{result['updated']} updated, {result['rejected']} rejected "
+                      f"({result['rows_per_second']:,.0f} rows/s).")
+                if result['errors_path']:
+                    print(f"Rejected rows were written to {result['errors_path']}")
+            else:
+                result = ProductBulkIO.export_products(path, self.__products)
+                print(f"✅ Exported {result['rows']} product(s) to {path} "
+                      f"({result['rows_per_second']:,.0f} rows/s).")
+        except (OSError, ValueError) as e:
+            print(f"Error: {e}")
+        input("\nPress Enter to continue...")
+
     def __get_stock_threshold(self) -> int:
         """
         Prompts for and validates stock threshold input.
@@ -1232,8 +1669,7 @@ class AdminPage(Page):
         """
         Persists product data to the storage file.
 
-        This private method delegates to DataManager for file-based
-        persistence of all product changes.
+        This private method delegates to the shared DataContext for
+        file-based persistence of all product changes.
         """
-        from mainPage import DataManager
-        DataManager.save_data('products.txt', self.__products)
\ No newline at end of file
+        self.__context.save_products()
\ No newline at end of file
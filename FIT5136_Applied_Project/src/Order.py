@@ -8,11 +8,22 @@ Author: Tao Pan
 Version: 2.0
 """
 
+import atexit
+import csv
+import heapq
 import json
+import os
+import sys
+import time
+import weakref
 from abc import ABC, abstractmethod
-from typing import Dict, List, Optional, Any
-from datetime import datetime
+from typing import Callable, Dict, Iterable, Iterator, List, Optional, Any, Tuple, Union
+from datetime import datetime, timedelta
 from enum import Enum
+from dataStore import DataManager, VersionedJSONStore
+from orderArchive import OrderArchive
+from salesAggregates import SalesAggregates
+from restockAdvisor import SalesVelocity
 
 
 class OrderStatus(Enum):
@@ -31,6 +42,91 @@ class OrderStatus(Enum):
     DELIVERED = "Delivered"
     CANCELLED = "Cancelled"
 
+    def can_transition_to(self, status: 'OrderStatus') -> bool:
+        """
+        Checks whether the order lifecycle allows moving from this status to another.
+
+        :param status: The target status.
+        :return: True if the transition is allowed.
+        """
+        return status in ALLOWED_TRANSITIONS[self]
+
+
+# Order lifecycle: Pending -> Confirmed -> Shipped -> Delivered, cancellable until shipped
+ALLOWED_TRANSITIONS = {
+    OrderStatus.PENDING: (OrderStatus.CONFIRMED, OrderStatus.CANCELLED),
+    OrderStatus.CONFIRMED: (OrderStatus.SHIPPED, OrderStatus.CANCELLED),
+    OrderStatus.SHIPPED: (OrderStatus.DELIVERED,),
+    OrderStatus.DELIVERED: (),
+    OrderStatus.CANCELLED: (),
+}
+
+# Orders in these states never change again and are archived straight away
+TERMINAL_STATUSES = (OrderStatus.DELIVERED, OrderStatus.CANCELLED)
+
+# Keys of a checkout line item, in the order they are written; such items are stored as tuples
+LINE_ITEM_FIELDS = ('product_id', 'name', 'quantity', 'unit_price', 'subtotal')
+CREATED_AT_FORMAT = '%Y-%m-%d %H:%M:%S'
+_EPOCH = datetime(1970, 1, 1)
+
+LineItem = Union[Tuple[Any, ...], Dict[str, Any]]
+
+
+def _intern(value: Any) -> Any:
+    """
+    Interns a string so that equal values share one object.
+
+    :param value: Any value.
+    :return: The interned string, or the value unchanged if it is not a str.
+    """
+    return sys.intern(value) if type(value) is str else value
+
+
+def _pack_item(item: Dict[str, Any]) -> LineItem:
+    """
+    Packs a line item dictionary into a tuple of its values.
+
+    :param item: A product_list entry.
+    :return: A tuple in LINE_ITEM_FIELDS order, or a copy of the dictionary
+             if it has any other shape.
+    """
+    if tuple(item) == LINE_ITEM_FIELDS:
+        product_id, name, quantity, unit_price, subtotal = item.values()
+        return _intern(product_id), _intern(name), quantity, unit_price, subtotal
+    return dict(item)
+
+
+def _unpack_item(item: LineItem) -> Dict[str, Any]:
+    """
+    Rebuilds the line item dictionary packed by _pack_item.
+
+    :param item: A packed line item.
+    :return: A new dictionary.
+    """
+    if isinstance(item, tuple):
+        return dict(zip(LINE_ITEM_FIELDS, item))
+    return dict(item)
+
+
+def _id_sort_key(order_id: str) -> Tuple[int, int, str]:
+    """
+    Returns a key ordering numeric order IDs by value, before any other IDs.
+
+    :param order_id: The order ID.
+    :return: Sort key.
+    """
+    return (0, int(order_id), '') if order_id.isdigit() else (1, 0, order_id)
+
+
+def _to_epoch(moment: datetime) -> int:
+    """
+    Converts a (naive, local) datetime to whole seconds since 1970-01-01.
+
+    :param moment: The datetime.
+    :return: Seconds since the epoch, without time zone conversion.
+    """
+    return int((moment - _EPOCH).total_seconds())
+
 
 class DataPersistence(ABC):
     """
@@ -86,9 +182,17 @@ class OrderData:
     total price, status, and creation time, providing access through validated
     properties for data integrity.
 
+    Orders are held compactly: attributes live in slots, emails and product
+    IDs and names are interned, line items are tuples of values and the
+    creation time is an integer of seconds. The properties and to_dict()
+    rebuild the usual dictionaries and datetime on request.
+
     Author: Tao Pan
     Version: 2.0
     """
+    __slots__ = ('__order_id', '__user_email', '__items', '__total_price',
+                 '__status', '__created_at', '__version')
+
     def __init__(self, order_id: str, user_email: str, product_list: List[Dict],
                  total_price: float, status: OrderStatus = OrderStatus.PENDING):
         """
@@ -101,11 +205,12 @@ class OrderData:
         :param status: Current order status (default: Pending).
         """
         self.__order_id = order_id
-        self.__user_email = user_email
-        self.__product_list = product_list
+        self.__user_email = _intern(user_email)
+        self.__items = tuple(_pack_item(item) for item in product_list)
         self.__total_price = total_price
         self.__status = status
-        self.__created_at = datetime.now()
+        self.__created_at = _to_epoch(datetime.now())
+        self.__version = 0
 
     # Encapsulation: Property decorators for controlled access
     @property
@@ -131,9 +236,9 @@ class OrderData:
         """
         Returns a copy of the product list to preserve data integrity.
 
-        :return: A copy of the list of ordered products.
+        :return: A new list of new dictionaries, one per ordered product.
         """
-        return self.__product_list.copy()  # Return copy to protect internal state
+        return [_unpack_item(item) for item in self.__items]
 
     @property
     def total_price(self) -> float:
@@ -170,9 +275,18 @@ class OrderData:
         """
         Returns the creation time of the order.
 
-        :return: Datetime object of order creation.
+        :return: Datetime object of order creation (to the second).
         """
-        return self.__created_at
+        return _EPOCH + timedelta(seconds=self.__created_at)
+
+    @property
+    def version(self) -> int:
+        """
+        Returns the record version stamped by the last save (0 if never saved).
+
+        :return: Version number.
+        """
+        return self.__version
 
     def to_dict(self) -> Dict[str, Any]:
         """
@@ -183,10 +297,11 @@ class OrderData:
         return {
             'order_id': self.__order_id,
             'user_email': self.__user_email,
-            'product_list': self.__product_list,
+            'product_list': self.product_list,
             'total_price': self.__total_price,
             'status': self.__status.value,
-            'created_at': self.__created_at.strftime('%Y-%m-%d %H:%M:%S')
+            'created_at': self.created_at.strftime(CREATED_AT_FORMAT),
+            'version': self.__version
         }
 
     @classmethod
@@ -199,15 +314,32 @@ class OrderData:
         """
         order = cls.__new__(cls)
         order.__order_id = data.get('order_id')
-        order.__user_email = data.get('user_email')
-        order.__product_list = data.get('product_list', [])
+        order.__user_email = _intern(data.get('user_email'))
+        order.__items = tuple(_pack_item(item) for item in data.get('product_list', []))
         order.__total_price = data.get('total_price', 0.0)
         order.__status = OrderStatus(data.get('status', 'Pending'))
         created_str = data.get('created_at')
-        order.__created_at = datetime.strptime(created_str, '%Y-%m-%d %H:%M:%S') if created_str else datetime.now()
+        # fromisoformat reads CREATED_AT_FORMAT several times faster than strptime
+        order.__created_at = _to_epoch(datetime.fromisoformat(created_str) if created_str else datetime.now())
+        order.__version = data.get('version', 0)
         return order
 
 
+# Live order managers; their sales counters are saved once at exit
+_MANAGERS: 'weakref.WeakSet[OrderManager]' = weakref.WeakSet()
+
+
+def _flush_all_sales() -> None:
+    """
+    Saves the pending sales counters of every order manager still alive at exit.
+    """
+    for manager in list(_MANAGERS):
+        manager.flush_sales()
+
+
+atexit.register(_flush_all_sales)
+
+
 class OrderManager(DataPersistence):
     """
     OrderManager - Handles all operations related to order management.
@@ -216,64 +348,189 @@ class OrderManager(DataPersistence):
     loading, saving, creating, updating, and listing orders. It demonstrates
     inheritance and polymorphism by overriding abstract methods.
 
+    Only active orders are held in memory. archive_orders() moves settled and
+    old orders to an OrderArchive once enough have built up; get_order and list_orders read both tiers.
+    Sales counters (SalesAggregates) and each product's rate of sale
+    (SalesVelocity) are updated in memory as orders are placed or cancelled.
+    Each save rewrites their sidecar files under lock, so they are saved
+    only once SALES_FLUSH_SECONDS have passed since the last save, and by
+    flush_sales() and at exit.
+
     Author: Tao Pan
     Version: 2.0
     """
-    def __init__(self, filename: str = 'orders.txt'):
+    ARCHIVE_AFTER_DAYS = 90
+    ARCHIVE_TERMINAL_AFTER_DAYS = 7
+    ARCHIVE_MIN_ORDERS = 100
+    SALES_FLUSH_SECONDS = 60
+
+    # Columns of a CSV export; product_list is written as compact JSON
+    EXPORT_FIELDS = ('order_id', 'user_email', 'created_at', 'status', 'total_price',
+                     'item_count', 'units', 'product_list', 'version')
+
+    def __init__(self, filename: str = 'orders.txt', archive_dir: Optional[str] = None,
+                 category_of: Optional[Callable[[str], Optional[str]]] = None):
         """
         Constructs an OrderManager with persistent storage.
 
         :param filename: The file name used to store order data.
-        """
+        :param archive_dir: Directory of archived orders (default: '<filename stem>_archive').
+        :param category_of: Callable returning a product's category, for the sales counters.
+        """
+        stem = os.path.splitext(filename)[0]
+        # Share the process-wide store for the file, so a primed snapshot is used
+        self.__store = DataManager.store_for(filename) or VersionedJSONStore(filename)
+        self.__archive = OrderArchive(archive_dir or f"{stem}_archive")
+        self.__rekeyed: Dict[str, str] = {}  # Order IDs renumbered on save
         super().__init__(filename)
         self.__orders: Dict[str, OrderData] = {}  # Private attribute
         self.__load_orders()
+        self.__sales = SalesAggregates(f"{stem}_sales.json", category_of)
+        self.__velocity = SalesVelocity(f"{stem}_velocity.json")
+        self.__sales_flushed_at = time.monotonic()
+        for tracker in (self.__sales, self.__velocity):
+            if not tracker.exists and (self.__orders or len(self.__archive)):
+                # First run with existing orders: count them once
+                tracker.rebuild(order.to_dict() for order in self.list_orders())
+        _MANAGERS.add(self)
 
-    def _load_data(self) -> Dict[str, Any]:
+    def _load_data(self) -> Iterator[Tuple[str, Dict[str, Any]]]:
         """
-        Loads order data from JSON storage.
+        Streams order data from JSON storage.
 
-        :return: Dictionary of raw order data.
+        :return: Iterator of (order ID, raw order record) pairs, consumed by __load_orders.
         """
-        try:
-            with open(self._filename, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            print(f"Warning: {self._filename} not found, starting with empty orders.")
-            return {}
-        except json.JSONDecodeError:
-            print(f"Error: {self._filename} is corrupted, starting with empty orders.")
-            return {}
+        return self.__store.iter_load()
 
-    def _save_data(self):
+    def _save_data(self) -> bool:
         """
         Saves all order data to JSON storage.
+
+        Orders created or updated concurrently by another process are merged
+        rather than overwritten. A new order whose ID was taken by another
+        process in the meantime is renumbered.
+
+        :return: True if the orders were written, False otherwise.
         """
         data = {oid: order.to_dict() for oid, order in self.__orders.items()}
-        with open(self._filename, 'w') as f:
-            json.dump(data, f, indent=4)
+        if not self.__store.save(data, rekey=self.__rekey_order):
+            return False
+        for oid, record in data.items():
+            current = self.__orders.get(oid)
+            if current is None or current.version != record.get('version', 0):
+                self.__orders[oid] = OrderData.from_dict(record)
+        for oid in [oid for oid in self.__orders if oid not in data]:
+            del self.__orders[oid]
+        return True
+
+    def __rekey_order(self, order_id: str, record: Dict[str, Any], taken: Any) -> str:
+        """
+        Assigns a fresh ID to a new order whose ID collided with another writer's.
+
+        :param order_id: The colliding order ID.
+        :param record: The order record, updated with the new ID.
+        :param taken: Order IDs already in use.
+        :return: The new order ID.
+        """
+        new_id = str(max(max((int(oid) for oid in taken if oid.isdigit()), default=0),
+                         self.__archive.max_order_id) + 1)
+        record['order_id'] = new_id
+        self.__rekeyed[order_id] = new_id
+        return new_id
 
     def __load_orders(self):
         """
         Loads OrderData objects into memory from stored data.
+
+        Records are streamed from the file and each is converted as soon as it
+        is decoded, so the raw dictionaries are never held in full.
+        """
+        for order_id, record in self._data:
+            self.__orders[order_id] = OrderData.from_dict(record)
+        self._data = {}
+
+    def __next_order_id(self) -> str:
+        """
+        Returns the ID following the largest one used in either tier.
+
+        :return: The next order ID.
         """
-        for order_id, order_data in self._data.items():
-            self.__orders[order_id] = OrderData.from_dict(order_data)
+        hot = max((int(oid) for oid in self.__orders if oid.isdigit()), default=0)
+        return str(max(hot, self.__archive.max_order_id) + 1)
+
+    @property
+    def archive(self) -> OrderArchive:
+        """
+        Returns the archive holding cold orders.
+
+        :return: The OrderArchive.
+        """
+        return self.__archive
+
+    @property
+    def sales(self) -> SalesAggregates:
+        """
+        Returns the sales counters kept up to date with the orders.
+
+        :return: The SalesAggregates.
+        """
+        return self.__sales
+
+    @property
+    def velocity(self) -> SalesVelocity:
+        """
+        Returns each product's rate of sale, kept up to date with the orders.
+
+        :return: The SalesVelocity.
+        """
+        return self.__velocity
+
+    def flush_sales(self) -> bool:
+        """
+        Saves the unsaved changes to the sales counters and rates of sale.
+
+        :return: True if both were written (or nothing was pending), False otherwise.
+        """
+        self.__sales_flushed_at = time.monotonic()
+        flushed = [tracker.flush() for tracker in (self.__sales, self.__velocity)]
+        return all(flushed)
+
+    def __record_sales(self, orders: List[OrderData], sign: int = 1) -> None:
+        """
+        Adds orders to the sales counters and rates of sale, or removes them.
+
+        Both are saved once SALES_FLUSH_SECONDS have passed since they were last saved.
+
+        :param orders: The orders placed, cancelled or reinstated.
+        :param sign: 1 to add the orders' sales, -1 to remove them.
+        """
+        for order in orders:
+            record = order.to_dict()
+            self.__sales.record(record, sign)
+            self.__velocity.record(record, sign)
+        if time.monotonic() - self.__sales_flushed_at >= self.SALES_FLUSH_SECONDS:
+            self.flush_sales()
 
     def create_order(self, user_email: str, product_list: List[Dict],
-                    total_price: float) -> OrderData:
+                    total_price: float) -> Optional[OrderData]:
         """
         Creates and saves a new order for a user.
 
         :param user_email: The email address of the user placing the order.
         :param product_list: The list of ordered products.
         :param total_price: The total cost of the order.
-        :return: The created OrderData instance.
+        :return: The created OrderData instance, or None if it could not be saved.
         """
-        order_id = str(len(self.__orders) + 1)
+        order_id = self.__next_order_id()
         order = OrderData(order_id, user_email, product_list, total_price)
         self.__orders[order_id] = order
-        self._save_data()
+        if not self._save_data():
+            del self.__orders[order_id]
+            print(f"Error: could not save order {order_id}.")
+            return None
+        order_id = self.__rekeyed.pop(order_id, order_id)
+        order = self.__orders.get(order_id, order)
+        self.__record_sales([order])
         print(f"Order {order_id} created successfully.")
         return order
 
@@ -284,33 +541,275 @@ class OrderManager(DataPersistence):
         :param order_id: The order's unique identifier.
         :return: Corresponding OrderData instance, or None if not found.
         """
-        return self.__orders.get(order_id)
+        order = self.__orders.get(order_id)
+        if order is None:
+            record = self.__archive.get(order_id)
+            order = OrderData.from_dict(record) if record is not None else None
+        return order
 
     def list_orders(self, user_email: Optional[str] = None) -> List[OrderData]:
         """
         Lists all orders, optionally filtered by a user's email.
 
+        Archived orders are included after the active ones.
+
         :param user_email: Optional filter by user email.
         :return: List of OrderData objects.
         """
         if user_email:
-            return [order for order in self.__orders.values()
-                   if order.user_email == user_email]
-        return list(self.__orders.values())
+            orders = [order for order in self.__orders.values()
+                     if order.user_email == user_email]
+        else:
+            orders = list(self.__orders.values())
+        orders.extend(OrderData.from_dict(record)
+                      for record in self.__archive.iter_records(user_email or None)
+                      if record['order_id'] not in self.__orders)
+        return orders
+
+    def archive_orders(self, max_age_days: int = ARCHIVE_AFTER_DAYS,
+                       now: Optional[datetime] = None,
+                       min_orders: int = ARCHIVE_MIN_ORDERS) -> int:
+        """
+        Moves terminal orders older than ARCHIVE_TERMINAL_AFTER_DAYS, and any
+        order older than max_age_days, to the archive.
+
+        Nothing is archived until at least min_orders orders qualify, so the
+        archive grows in batches rather than by a few orders per session, and
+        a recently delivered or cancelled order can still be corrected for a
+        while. The archive segments are written before the orders are removed
+        from the active store, so a failure never loses an order.
+
+        :param max_age_days: Age in days after which any order is archived.
+        :param now: Reference time (default: the current time).
+        :param min_orders: Fewest qualifying orders worth an archival run.
+        :return: Number of orders archived.
+        """
+        now = now or datetime.now()
+        cutoff = now - timedelta(days=max_age_days)
+        settled = now - timedelta(days=self.ARCHIVE_TERMINAL_AFTER_DAYS)
+        cold = [oid for oid, order in self.__orders.items()
+                if order.created_at < cutoff
+                or (order.status in TERMINAL_STATUSES and order.created_at < settled)]
+        if not cold or len(cold) < min_orders:
+            return 0
+        try:
+            self.__archive.append([self.__orders[oid].to_dict() for oid in cold])
+        except OSError as e:
+            print(f"Error archiving orders: {e}")
+            return 0
+        for oid in cold:
+            del self.__orders[oid]
+        self._save_data()
+        return len(cold)
 
-    def update_order_status(self, order_id: str, status: OrderStatus):
+    def update_order_status(self, order_id: str, status: OrderStatus) -> bool:
         """
         Updates the status of an existing order.
 
         :param order_id: The unique identifier of the order.
         :param status: The new status to set for the order.
+        :return: True if the status was changed and saved, False otherwise.
         """
         if order_id in self.__orders:
-            self.__orders[order_id].status = status
-            self._save_data()
+            order = self.__orders[order_id]
+            old_status = order.status
+            was_cancelled = old_status == OrderStatus.CANCELLED
+            order.status = status
+            if not self._save_data():
+                order.status = old_status
+                print(f"Error: could not save the status of order {order_id}; it is still {old_status.value}.")
+                return False
+            if was_cancelled != (status == OrderStatus.CANCELLED):
+                # Cancelling removes the order's sales; reinstating it adds them back
+                self.__record_sales([order], sign=-1 if status == OrderStatus.CANCELLED else 1)
             print(f"Order {order_id} status updated to {status.value}.")
+            return True
+        if self.__archive.get(order_id) is not None:
+            print(f"Order {order_id} is archived and can no longer be changed.")
         else:
             print(f"Order {order_id} not found.")
+        return False
+
+    def update_order_statuses(self, ids_or_predicate: Union[Iterable[str], Callable[[OrderData], bool]],
+                              status: OrderStatus) -> Dict[str, Any]:
+        """
+        Moves many orders to a new status with a single save.
+
+        Each order is checked against the OrderStatus lifecycle; orders that
+        cannot make the transition are left unchanged and reported. If the
+        save fails, every applied change is rolled back.
+
+        :param ids_or_predicate: Order IDs, or a predicate selecting active orders.
+        :param status: The new status.
+        :return: Dictionary with 'applied' (IDs), 'rejected' ((ID, reason) pairs),
+                 'missing' (IDs) and 'saved' (bool).
+        """
+        if callable(ids_or_predicate):
+            order_ids = [oid for oid, order in self.__orders.items() if ids_or_predicate(order)]
+        else:
+            order_ids = list(dict.fromkeys(ids_or_predicate))
+
+        previous: Dict[str, OrderStatus] = {}
+        rejected: List[Tuple[str, str]] = []
+        missing: List[str] = []
+        for order_id in order_ids:
+            order = self.__orders.get(order_id)
+            if order is None:
+                if self.__archive.get(order_id) is not None:
+                    rejected.append((order_id, "order is archived"))
+                else:
+                    missing.append(order_id)
+            elif not order.status.can_transition_to(status):
+                rejected.append((order_id, f"cannot go from {order.status.value} to {status.value}"))
+            else:
+                previous[order_id] = order.status
+                order.status = status
+
+        saved = not previous or self._save_data()
+        if not saved:
+            for order_id, old_status in previous.items():
+                self.__orders[order_id].status = old_status
+            print(f"Error: could not save status changes; {len(previous)} order(s) left unchanged.")
+        elif status == OrderStatus.CANCELLED and previous:
+            cancelled = [self.get_order(order_id) for order_id in previous]
+            self.__record_sales([order for order in cancelled if order is not None], sign=-1)
+
+        applied = list(previous) if saved else []
+        print(f"Status update to {status.value}: {len(applied)} applied, "
+              f"{len(rejected)} rejected, {len(missing)} not found.")
+        return {'applied': applied, 'rejected': rejected, 'missing': missing, 'saved': saved}
+
+    def export_orders(self, path: str, fmt: str = 'csv', order_by: str = 'id',
+                      start: Optional[datetime] = None, end: Optional[datetime] = None,
+                      status: Optional[OrderStatus] = None,
+                      user_email: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Streams active and archived orders to a CSV or NDJSON file.
+
+        Orders pass one at a time through a generator pipeline (source,
+        filter, row formatting, writer), so memory does not grow with the
+        number of orders exported. Archive segments outside the date range
+        are skipped using the archive index.
+
+        :param path: Output file path.
+        :param fmt: 'csv' or 'ndjson'.
+        :param order_by: 'id' or 'time'.
+        :param start: Only orders created at or after this time.
+        :param end: Only orders created before this time.
+        :param status: Only orders in this status.
+        :param user_email: Only orders of this user.
+        :return: Dictionary with 'rows', 'seconds' and 'rows_per_second'.
+        :raises ValueError: If fmt or order_by is not recognised.
+        """
+        if fmt not in ('csv', 'ndjson'):
+            raise ValueError(f"Unknown export format: {fmt}")
+        if order_by not in ('id', 'time'):
+            raise ValueError(f"Unknown export order: {order_by}")
+        first = start.strftime(CREATED_AT_FORMAT) if start else None
+        last = end.strftime(CREATED_AT_FORMAT) if end else None
+
+        started = time.perf_counter()
+        records = self.__iter_by_time(first, last) if order_by == 'time' else self.__iter_by_id(first, last)
+        selected = (record for record in records
+                    if (first is None or record.get('created_at', '') >= first)
+                    and (last is None or record.get('created_at', '') < last)
+                    and (status is None or record.get('status') == status.value)
+                    and (user_email is None or record.get('user_email') == user_email))
+
+        rows = 0
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            if fmt == 'csv':
+                writer = csv.writer(f)
+                writer.writerow(self.EXPORT_FIELDS)
+                for record in selected:
+                    writer.writerow(self.__csv_row(record))
+                    rows += 1
+            else:
+                for record in selected:
+                    f.write(json.dumps(record, separators=(',', ':')) + '\n')
+                    rows += 1
+
+        seconds = time.perf_counter() - started
+        rate = rows / seconds if seconds > 0 else 0.0
+        print(f"Exported {rows} order(s) to {path} in {seconds:.2f}s ({rate:,.0f} rows/s).")
+        return {'rows': rows, 'seconds': seconds, 'rows_per_second': rate}
+
+    def __csv_row(self, record: Dict[str, Any]) -> List[Any]:
+        """
+        Formats an order record as a CSV row in EXPORT_FIELDS order.
+
+        :param record: The order record.
+        :return: List of cell values.
+        """
+        items = record.get('product_list', [])
+        return [record.get('order_id'), record.get('user_email'), record.get('created_at'),
+                record.get('status'), record.get('total_price'), len(items),
+                sum(item.get('quantity', 0) for item in items),
+                json.dumps(items, separators=(',', ':')), record.get('version', 0)]
+
+    def __archive_segments(self, first: Optional[str], last: Optional[str]) -> List[Dict[str, Any]]:
+        """
+        Returns the archive segments that may hold orders created in [first, last).
+
+        :param first: Earliest creation time, or None.
+        :param last: Creation time bound (exclusive), or None.
+        :return: Segment index entries.
+        """
+        return [segment for segment in self.__archive.segments
+                if (first is None or segment['last_created'] >= first)
+                and (last is None or segment['first_created'] < last)]
+
+    def __iter_by_id(self, first: Optional[str], last: Optional[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Yields active and archived orders in ID order.
+
+        Every archive segment is stored in ID order, so the segments and the
+        sorted active orders are merged lazily with heapq.merge.
+
+        :param first: Earliest creation time, or None.
+        :param last: Creation time bound (exclusive), or None.
+        :return: Iterator of order records.
+        """
+        hot = (self.__orders[oid].to_dict() for oid in sorted(self.__orders, key=_id_sort_key))
+        archived = [(record for record in self.__archive.stream_segment(segment['file'])
+                     if record['order_id'] not in self.__orders)
+                    for segment in self.__archive_segments(first, last)]
+        previous = None
+        for record in heapq.merge(hot, *archived, key=lambda record: _id_sort_key(record['order_id'])):
+            if record['order_id'] != previous:  # An order archived twice appears in two segments
+                previous = record['order_id']
+                yield record
+
+    def __iter_by_time(self, first: Optional[str], last: Optional[str]) -> Iterator[Dict[str, Any]]:
+        """
+        Yields active and archived orders in creation-time order.
+
+        Archive segments cover one calendar month each, so the archive is
+        read a month at a time: that month's segments are sorted in memory
+        and merged lazily with the sorted active orders.
+
+        :param first: Earliest creation time, or None.
+        :param last: Creation time bound (exclusive), or None.
+        :return: Iterator of order records.
+        """
+        def time_key(record: Dict[str, Any]) -> Tuple[str, Tuple[int, int, str]]:
+            return record.get('created_at', ''), _id_sort_key(record['order_id'])
+
+        def archived_by_month() -> Iterator[Dict[str, Any]]:
+            by_period: Dict[str, List[str]] = {}
+            for segment in self.__archive_segments(first, last):
+                by_period.setdefault(segment['period'], []).append(segment['file'])
+            for period in sorted(by_period, key=lambda period: (period != 'unknown', period)):
+                month = {}
+                for name in by_period[period]:
+                    for record in self.__archive.stream_segment(name):
+                        if record['order_id'] not in self.__orders:
+                            month[record['order_id']] = record
+                yield from sorted(month.values(), key=time_key)
+
+        hot_ids = sorted(self.__orders, key=lambda oid: (self.__orders[oid].created_at, _id_sort_key(oid)))
+        hot = (self.__orders[oid].to_dict() for oid in hot_ids)
+        return heapq.merge(hot, archived_by_month(), key=time_key)
 
 
 # Alias for backward compatibility
@@ -18,10 +18,15 @@ Version: 3.0
 
 from abc import ABC, abstractmethod
 from typing import Dict, Any, List, Optional
-from collections import OrderedDict
-import json
 import os
 from InputHandler import InputHandler, BackToMainException, ExitApplicationException
+from stockReservation import StockReservationLedger
+from stockIndex import StockIndex
+from dataStore import PromoCodeStore
+from dataContext import DataContext
+from sessionCart import SessionCart
+from promotionSchedule import PROMOTIONS
+from cart import CartRules
 
 
 # Abstract base class for all pages
@@ -90,6 +95,9 @@ class CartDisplay:
         """
         Displays the contents of the shopping cart with formatted output.
 
+        Subtotals and totals come from the SessionCart's running totals; a
+        plain dictionary is wrapped first.
+
         :param cart: Dictionary containing cart items with product information.
         :param is_vip: Boolean indicating if the user has VIP status.
         :return: The total amount of all items in the cart.
@@ -97,19 +105,19 @@ class CartDisplay:
         if not cart:
             print("\n🛒 Your cart is empty.")
             return 0.0
+        if not isinstance(cart, SessionCart):
+            cart = SessionCart(cart)
+        PROMOTIONS.advance()  # Start and end any promotions that are due; the cart is repriced
 
         print("\n" + "="*60)
         print("🛒 YOUR SHOPPING CART")
         print("="*60)
 
-        total_amount = 0.0
-        total_items = 0
-
         for product_id, item_info in cart.items():
             product = item_info['product']
             quantity = item_info['quantity']
             price = CartDisplay._get_product_price(product, is_vip)
-            subtotal = price * quantity
+            subtotal = cart.line_subtotal(product_id, is_vip)
 
             regular_price = product['price']
             member_price = product.get('member_price', regular_price)
@@ -123,11 +131,9 @@ class CartDisplay:
                 print(f"   💎 VIP Discount Applied! You save: ${savings:.2f}")
             print()
 
-            total_amount += subtotal
-            total_items += quantity
-
+        total_amount = cart.total(is_vip)
         print("-" * 60)
-        print(f"Total Items: {total_items}")
+        print(f"Total Items: {cart.item_count}")
         print(f"Total Amount: ${total_amount:.2f}")
 
         if is_vip:
@@ -141,31 +147,42 @@ class CartDisplay:
         """
         Retrieves the appropriate price for a product based on VIP status.
 
+        An active promotion is used when it is lower; it is found with one
+        lookup in the promotion scheduler rather than a scan of promotions.
+
         :param product: Dictionary containing product information.
         :param is_vip: Boolean indicating if the user has VIP status.
         :return: The price to use for the product.
         """
-        if is_vip and 'member_price' in product:
-            return product['member_price']
-        return product['price']
+        return PROMOTIONS.resolve_price(product, is_vip)
 
     @staticmethod
-    def display_products(products_list: List[Dict[str, Any]]) -> None:
+    def display_products(products_list: List[Dict[str, Any]],
+                         reservations: Optional[StockReservationLedger] = None) -> None:
         """
         Displays a formatted list of products in a table format.
 
         Products are sorted to show in-stock items first, followed by out-of-stock items.
         This ensures better user experience by prioritizing available products.
+        When a reservation ledger is given, the quantity shown is the stock not
+        held in any cart.
 
         :param products_list: List of product dictionaries to display.
+        :param reservations: Optional ledger of active cart holds.
         """
         if not products_list:
             print("No products to display.")
             return
+        PROMOTIONS.advance()  # Start and end any promotions that are due before listing
+
+        def available(p: Dict[str, Any]) -> int:
+            if reservations is None:
+                return p.get('quantity', 0)
+            return reservations.available(p)
 
         # Separate in-stock and out-of-stock products
-        in_stock_products = [p for p in products_list if p.get('quantity', 0) > 0]
-        out_of_stock_products = [p for p in products_list if p.get('quantity', 0) == 0]
+        in_stock_products = [(p, available(p)) for p in products_list if available(p) > 0]
+        out_of_stock_products = [(p, 0) for p in products_list if available(p) == 0]
 
         # Combine: in-stock first, then out-of-stock
         sorted_products = in_stock_products + out_of_stock_products
@@ -173,9 +190,9 @@ class CartDisplay:
         print(f"{'ID':<8} {'Name':<25} {'Price':<12} {'Member Price':<12} {'Quantity':<10}")
         print("-" * 75)
 
-        for p in sorted_products:
+        for p, quantity in sorted_products:
             member_price = p.get('member_price', p['price'])
-            quantity_display = p['quantity'] if p['quantity'] > 0 else "OUT OF STOCK"
+            quantity_display = quantity if quantity > 0 else "OUT OF STOCK"
             print(f"{p['id']:<8} {p['name']:<25} ${p['price']:<11.2f} ${member_price:<11.2f} {quantity_display}")
 
         print(f"Total products: {len(products_list)}")
@@ -188,12 +205,13 @@ class PromoCodeManager:
     This class handles all promotion code operations including loading codes
     from storage, validating conditions, and calculating discounts. It provides
     centralized promotion code management with support for various discount types.
+    Codes come from the shared PromoCodeStore, which keeps them in memory.
 
     Author: Applied10_Group6
     Version: 1.0
     """
 
-    PROMO_CODE_FILE = 'promo_codes.json'
+    PROMO_CODE_FILE = DataContext.PROMO_CODE_FILE
 
     @staticmethod
     def load_promo_codes() -> Dict[str, Any]:
@@ -205,7 +223,13 @@ class PromoCodeManager:
 
         :return: Dictionary of promotion codes and their configurations.
         """
-        if not os.path.exists(PromoCodeManager.PROMO_CODE_FILE):
+        try:
+            promo_codes = PromoCodeStore.for_file(PromoCodeManager.PROMO_CODE_FILE).load()
+        except Exception as e:
+            print(f"Error loading promo codes: {e}")
+            return {}
+
+        if promo_codes is None:
             # Return default promo codes if file doesn't exist
             return {
                 'NEWMONASH20': {
@@ -235,13 +259,7 @@ class PromoCodeManager:
                     }
                 }
             }
-
-        try:
-            with open(PromoCodeManager.PROMO_CODE_FILE, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except Exception as e:
-            print(f"Error loading promo codes: {e}")
-            return {}
+        return promo_codes
 
     @staticmethod
     def validate_promo_code(promo_code: str, is_pickup: bool, is_first_pickup: bool,
@@ -363,45 +381,54 @@ class CheckoutProcessor:
         :param is_vip: Boolean indicating if the user has VIP status.
         :return: Total amount as float.
         """
-        total = 0.0
-        for item_info in cart.values():
-            product = item_info['product']
-            quantity = item_info['quantity']
-            price = CartDisplay._get_product_price(product, is_vip)
-            total += price * quantity
-        return total
+        if isinstance(cart, SessionCart):
+            return cart.total(is_vip)
+        return SessionCart(cart).total(is_vip)
 
     @staticmethod
-    def validate_stock(cart: Dict[str, Dict[str, Any]]) -> bool:
+    def validate_stock(cart: Dict[str, Dict[str, Any]],
+                       reservations: Optional[StockReservationLedger] = None,
+                       user_email: Optional[str] = None) -> bool:
         """
         Validate that all products in cart have sufficient stock.
 
+        Units held in other users' carts are not available to this checkout.
+
         :param cart: Dictionary containing cart items with product information.
+        :param reservations: Optional ledger of active cart holds.
+        :param user_email: The purchasing user, whose own holds remain available.
         :return: True if all products available, False otherwise.
         """
         for product_id, item_info in cart.items():
             product = item_info['product']
             quantity = item_info['quantity']
+            available = (reservations.available(product, exclude_user=user_email)
+                         if reservations is not None else product['quantity'])
 
-            if product['quantity'] < quantity:
-                print(f"\n❌ Insufficient stock for {product['name']}. Available: {product['quantity']}")
+            if available < quantity:
+                print(f"\n❌ Insufficient stock for {product['name']}. Available: {available}")
                 input("Press Enter to continue...")
                 return False
 
         return True
 
     @staticmethod
-    def update_stock(cart: Dict[str, Dict[str, Any]]) -> None:
+    def update_stock(cart: Dict[str, Dict[str, Any]],
+                     stock_index: Optional[StockIndex] = None, sign: int = -1) -> None:
         """
-        Update product quantities after purchase.
+        Update product quantities after purchase, or put them back.
 
         :param cart: Dictionary containing cart items with product information.
+        :param stock_index: Index of product quantities to keep in step, if any.
+        :param sign: -1 to take the cart's quantities from stock, 1 to return them.
         :return: None
         """
-        for item_info in cart.values():
+        for product_id, item_info in cart.items():
             product = item_info['product']
             quantity = item_info['quantity']
-            product['quantity'] -= quantity
+            product['quantity'] += sign * quantity
+            if stock_index is not None:
+                stock_index.update(product_id, product['quantity'])
 
 
 class Shopping(Page):
@@ -424,6 +451,8 @@ class Shopping(Page):
 
         :return: None
         """
+        if self.__context is not None:
+            self.__context.refresh_products()  # Reprice the cart if prices changed in another session
         CartDisplay.display_cart(self.__cart, self.__is_vip)
         #input("\nPress Enter to continue...")
 
@@ -436,7 +465,7 @@ class Shopping(Page):
         :param products_list: List of product dictionaries to display.
         :return: None
         """
-        CartDisplay.display_products(products_list)
+        CartDisplay.display_products(products_list, self.__reservations)
 
     def search_products(self) -> None:
         """
@@ -493,12 +522,18 @@ class Shopping(Page):
             input("\nPress Enter to continue...")
             return
         product = self.products[product_id]
+        in_cart = self.cart[product_id]['quantity'] if product_id in self.cart else 0
+        available = self.__reservations.available(product, exclude_user=self.__user_email) - in_cart
         if product['quantity'] == 0:
             print(f"❌ Sorry, '{product['name']}' is currently out of stock.")
             input("\nPress Enter to continue...")
             return
+        if available <= 0:
+            print(f"❌ Sorry, all remaining units of '{product['name']}' are reserved in carts.")
+            input("\nPress Enter to continue...")
+            return
         try:
-            quantity = int(input(f"Enter quantity (1-10, available: {product['quantity']}): ").strip())
+            quantity = int(input(f"Enter quantity (1-10, available: {available}): ").strip())
         except ValueError:
             print("❌ Quantity must be a number.")
             input("\nPress Enter to continue...")
@@ -511,8 +546,8 @@ class Shopping(Page):
             print("❌ Cannot add more than 10 of a single product.")
             input("\nPress Enter to continue...")
             return
-        if product['quantity'] < quantity:
-            print(f"❌ Only {product['quantity']} available in stock.")
+        if available < quantity:
+            print(f"❌ Only {available} available in stock.")
             input("\nPress Enter to continue...")
             return
         if len(self.cart) >= 20:
@@ -520,18 +555,35 @@ class Shopping(Page):
             input("\nPress Enter to continue...")
             return
         # Add to cart
-        if product_id in self.cart:
-            new_quantity = self.cart[product_id]['quantity'] + quantity
-            if new_quantity > 10:
-                print(f"❌ Cannot exceed 10 items total for this product. You already have {self.cart[product_id]['quantity']} in cart.")
-                input("\nPress Enter to continue...")
-                return
-            self.cart[product_id]['quantity'] = new_quantity
-        else:
-            self.cart[product_id] = {'product': product, 'quantity': quantity}
-        print(f"✅ Added {quantity} of '{product['name']}' to cart.")
+        if in_cart + quantity > 10:
+            print(f"❌ Cannot exceed 10 items total for this product. You already have {in_cart} in cart.")
+            input("\nPress Enter to continue...")
+            return
+        new_quantity = self.cart.add(product_id, product, quantity)
+        held = self.__hold(product_id, new_quantity)
+        if held > in_cart:
+            print(f"✅ Added {held - in_cart} of '{product['name']}' to cart.")
         input("\nPress Enter to continue...")  # Wait for user to read success message
 
+    def __hold(self, product_id: str, quantity: int) -> int:
+        """
+        Holds stock for a cart line and trims the line to the units actually held.
+
+        Another session may have held the last units since availability was
+        shown, so fewer units than requested may be held.
+
+        :param product_id: The product in the cart.
+        :param quantity: The line's new quantity.
+        :return: The units held, now the line's quantity (0 if the line was removed).
+        """
+        product = self.cart[product_id]['product']
+        held = self.__reservations.reserve(self.__user_email, product_id, quantity,
+                                           stock=product['quantity'])
+        if held < quantity:
+            self.cart.set_quantity(product_id, held)
+            print(f"⚠️  Only {held} of '{product['name']}' could be held; the rest are reserved in other carts.")
+        return held
+
     def get_cart(self):
         """
         Retrieves the current shopping cart.
@@ -540,6 +592,44 @@ class Shopping(Page):
         """
         return self.cart
 
+    def add_many(self, items: List[Any]) -> Dict[str, Any]:
+        """
+        Adds several products to the cart at once.
+
+        Stock available to this user (net of other carts' holds) is read once
+        for all lines, and every line is validated with CartRules before any
+        is added. Lines that fail validation are skipped and reported.
+
+        :param items: (product_id, quantity) pairs to add.
+        :return: Dictionary with 'added' (product ID to new quantity) and 'rejected'
+                 ((product_id, quantity, reason) triples).
+        """
+        items = list(items)
+        stock = {pid: self.__reservations.available(self.products[pid], exclude_user=self.__user_email)
+                 for pid in dict.fromkeys(pid for pid, _ in items) if pid in self.products}
+        current = {pid: line['quantity'] for pid, line in self.cart.items()}
+        accepted, rejected = CartRules.validate_bulk(current, items, stock)
+
+        for product_id, new_qty in accepted.items():
+            self.cart.set_quantity(product_id, new_qty, self.products[product_id])
+            accepted[product_id] = self.__hold(product_id, new_qty)
+
+        if accepted:
+            print(f"✅ Added {len(accepted)} product(s) to cart.")
+        for product_id, quantity, reason in rejected:
+            name = self.products[product_id]['name'] if product_id in self.products else product_id
+            print(f"❌ Skipped {quantity} x '{name}': {reason}.")
+        return {'added': dict(accepted), 'rejected': rejected}
+
+    def reorder(self, product_list: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Adds every line of a previous order to the cart.
+
+        :param product_list: The order's product_list (dicts with 'product_id' and 'quantity').
+        :return: The add_many() result.
+        """
+        return self.add_many([(line['product_id'], line['quantity']) for line in product_list])
+
     def browse_by_category(self):
         """
         Displays products organized by category for user browsing.
@@ -547,11 +637,17 @@ class Shopping(Page):
         This method shows all available product categories and allows users
         to select a category to view its products.
         """
-        categories = sorted(set(p['category'] for p in self.products.values()))
+        if self.__context is not None:
+            by_category = self.__context.products_by_category
+        else:
+            by_category = {}
+            for pid, p in self.products.items():
+                by_category.setdefault(p['category'], []).append(pid)
+        categories = sorted(by_category)
         print("\n📂 AVAILABLE CATEGORIES:")
         print("-" * 30)
         for i, category in enumerate(categories, 1):
-            product_count = sum(1 for p in self.products.values() if p['category'] == category)
+            product_count = len(by_category[category])
             print(f"{i}. {category} ({product_count} products)")
         try:
             choice = input("\nEnter category name or number: ").strip()
@@ -634,22 +730,30 @@ class Shopping(Page):
                 raise
 
     def __init__(self, products: Dict[str, Any], user_email: str,
-                 users: Dict[str, Any], cart: Dict[str, Dict[str, Any]]):
+                 users: Dict[str, Any], cart: Dict[str, Dict[str, Any]],
+                 reservations: Optional[StockReservationLedger] = None,
+                 context: Optional[DataContext] = None):
         """
         Constructs a Shopping instance with the specified data.
 
         :param products: Dictionary of all available products.
         :param user_email: Email address of the current user.
         :param users: Dictionary of all system users.
-        :param cart: User's shopping cart contents.
+        :param cart: User's shopping cart contents (wrapped in a SessionCart if needed).
+        :param reservations: Shared ledger of cart stock holds (a private one if None).
+        :param context: Shared DataContext providing the order manager and
+                        product indexes (standalone lookups if None).
         """
         # Use private attributes for encapsulation
         self.__products = products
         self.__user_email = user_email
         self.__users = users
-        # Ensure cart is OrderedDict to maintain insertion order (requirement 2.4)
-        if not isinstance(cart, OrderedDict):
-            self.__cart = OrderedDict(cart)
+        self.__reservations = reservations if reservations is not None else StockReservationLedger()
+        self.__context = context
+        # Ensure cart is an ordered SessionCart to maintain insertion order (requirement 2.4)
+        # and running totals
+        if not isinstance(cart, SessionCart):
+            self.__cart = SessionCart(cart)
         else:
             self.__cart = cart
         self.__is_vip = self.__users[self.__user_email].get('is_vip', False)
@@ -683,11 +787,11 @@ class Shopping(Page):
         return self.__users
 
     @property
-    def cart(self) -> Dict[str, Dict[str, Any]]:
+    def cart(self) -> SessionCart:
         """
         Get shopping cart.
 
-        :return: Dictionary containing cart items.
+        :return: SessionCart containing cart items.
         """
         return self.__cart
 
@@ -700,6 +804,15 @@ class Shopping(Page):
         """
         return self.__is_vip
 
+    @property
+    def reservations(self) -> StockReservationLedger:
+        """
+        Get the stock reservation ledger used by this shopping session.
+
+        :return: The StockReservationLedger holding cart reservations.
+        """
+        return self.__reservations
+
     def run(self) -> None:
         """
         Run the shopping page main loop.
@@ -710,11 +823,11 @@ class Shopping(Page):
         """
         self.browse()
 
-    def get_cart(self) -> Dict[str, Dict[str, Any]]:
+    def get_cart(self) -> SessionCart:
         """
         Get the cart dictionary.
 
-        :return: Shopping cart dictionary.
+        :return: Shopping cart as a SessionCart.
         """
         return self.__cart
 
@@ -775,13 +888,51 @@ class Shopping(Page):
         """
         self.__users[self.__user_email]['balance'] -= amount
 
-    def update_inventory(self) -> None:
+    def update_inventory(self, sign: int = -1) -> None:
         """
-        Update product inventory after purchase completion.
+        Update product inventory after purchase completion, or put the stock back.
 
+        :param sign: -1 to take the cart's quantities from stock, 1 to return them.
         :return: None
         """
-        CheckoutProcessor.update_stock(self.__cart)
+        stock_index = self.__context.stock_index if self.__context is not None else None
+        CheckoutProcessor.update_stock(self.__cart, stock_index, sign)
+
+    def __take_payment(self, amount: float) -> bool:
+        """
+        Takes the cart's stock and the payment, saving each before the next step.
+
+        Stock is saved first, so a purchase that another session has already
+        sold out fails before any money is taken; if the payment cannot be
+        saved, the stock is put back.
+
+        :param amount: Amount to charge.
+        :return: True if both were saved, False if nothing was changed.
+        """
+        self.update_inventory()
+        if self.__context is not None and not self.__context.save_products():
+            self.update_inventory(sign=1)
+            return False
+        self.deduct_funds(amount)
+        if self.__context is not None and not self.__context.save_users():
+            self.__users[self.__user_email]['balance'] += amount
+            self.update_inventory(sign=1)
+            self.__context.save_products()
+            return False
+        return True
+
+    def __return_payment(self, amount: float) -> None:
+        """
+        Refunds a payment taken by __take_payment and puts the stock back.
+
+        :param amount: Amount that was charged.
+        :return: None
+        """
+        self.__users[self.__user_email]['balance'] += amount
+        self.update_inventory(sign=1)
+        if self.__context is not None:
+            self.__context.save_users()
+            self.__context.save_products()
 
     def is_first_time_pickup(self) -> bool:
         """
@@ -976,14 +1127,15 @@ class Shopping(Page):
 
         choice = input("Enter your choice (1-3): ").strip()
 
+        available = self.__reservations.available
         if choice == '1':
-            filtered = [p for p in self.__products.values() if p.get('quantity', 0) > 0]
+            filtered = [p for p in self.__products.values() if available(p) > 0]
             title = "In Stock Products"
         elif choice == '2':
-            filtered = [p for p in self.__products.values() if p.get('quantity', 0) == 0]
+            filtered = [p for p in self.__products.values() if available(p) == 0]
             title = "Out of Stock Products"
         elif choice == '3':
-            filtered = [p for p in self.__products.values() if 0 < p.get('quantity', 0) <= 5]
+            filtered = [p for p in self.__products.values() if 0 < available(p) <= 5]
             title = "Low Stock Products (≤5)"
         else:
             print("❌ Invalid choice.")
@@ -1211,8 +1363,9 @@ class Shopping(Page):
         product = self.cart[product_id]['product']
         current_quantity = self.cart[product_id]['quantity']
 
+        available = self.__reservations.available(product, exclude_user=self.__user_email)
         print(f"Current quantity of '{product['name']}': {current_quantity}")
-        print(f"Available in stock: {product['quantity']}")
+        print(f"Available in stock: {available}")
 
         try:
             new_quantity = int(input("Enter new quantity (0 to remove): ").strip())
@@ -1223,6 +1376,7 @@ class Shopping(Page):
 
         if new_quantity == 0:
             del self.cart[product_id]
+            self.__reservations.release(self.__user_email, product_id)
             print("✅ Item removed from cart.")
             input("\nPress Enter to continue...")
             return
@@ -1237,13 +1391,14 @@ class Shopping(Page):
             input("\nPress Enter to continue...")
             return
 
-        if product['quantity'] < new_quantity:
-            print(f"❌ Only {product['quantity']} available in stock.")
+        if available < new_quantity:
+            print(f"❌ Only {available} available in stock.")
             input("\nPress Enter to continue...")
             return
 
-        self.cart[product_id]['quantity'] = new_quantity
-        print(f"✅ Quantity updated to {new_quantity}.")
+        self.cart.set_quantity(product_id, new_quantity)
+        if self.__hold(product_id, new_quantity) == new_quantity:
+            print(f"✅ Quantity updated to {new_quantity}.")
         input("\nPress Enter to continue...")
 
     def remove_cart_item(self):
@@ -1263,6 +1418,7 @@ class Shopping(Page):
         if product_id in self.cart:
             product_name = self.cart[product_id]['product']['name']
             del self.cart[product_id]
+            self.__reservations.release(self.__user_email, product_id)
             print(f"✅ '{product_name}' removed from cart.")
             input("\nPress Enter to continue...")
         else:
@@ -1283,6 +1439,7 @@ class Shopping(Page):
 
         confirm = input("⚠️  Are you sure you want to empty the entire cart? (y/n): ").lower().strip()
         if confirm == 'y':
+            self.__reservations.release_user(self.__user_email, list(self.cart.keys()))
             self.cart.clear()
             print("✅ Cart emptied.")
             input("\nPress Enter to continue...")
@@ -1367,15 +1524,17 @@ class Shopping(Page):
                 delivery_address = input("Enter delivery address (not saved): ").strip()
 
         # 3. Calculate total price
+        if self.__context is not None:
+            self.__context.refresh_products()  # Charge prices saved in other sessions
+        PROMOTIONS.advance()
         item_list = []
-        total_price = 0
         for product_id, item_info in self.cart.items():
             product = item_info['product']
             quantity = item_info['quantity']
-            price = product.get('member_price', product['price']) if is_vip else product['price']
-            subtotal = price * quantity
+            price = CartDisplay._get_product_price(product, is_vip)
+            subtotal = self.cart.line_subtotal(product_id, is_vip)
             item_list.append({'product_id': product_id, 'name': product['name'], 'quantity': quantity, 'unit_price': price, 'subtotal': subtotal})
-            total_price += subtotal
+        total_price = CheckoutProcessor.calculate_total(self.cart, is_vip)
 
         # 4. Promotions and discounts
         is_first_pickup = self.is_first_time_pickup()
@@ -1486,19 +1645,35 @@ class Shopping(Page):
             return
 
         # 8. Payment processing, inventory update, and order saving
-        self.deduct_funds(final_total)
-        self.update_inventory()
+        if not CheckoutProcessor.validate_stock(self.cart, self.__reservations, email):
+            print("❌ Order failed. Your cart has been preserved.")
+            return
+        if not self.__take_payment(final_total):
+            print("\n❌ Order failed: the purchase could not be saved. Your cart has been preserved.")
+            input("\nPress Enter to continue...")
+            return
         # Save order
+        order = None
         try:
-            from Order import Order as OrderManager
-            order_manager = OrderManager()
-            order_manager.create_order(
+            if self.__context is not None:
+                order_manager = self.__context.order_manager
+            else:
+                from Order import Order as OrderManager
+                order_manager = OrderManager()
+            order = order_manager.create_order(
                 user_email=email,
                 product_list=item_list,
                 total_price=final_total
             )
         except Exception as e:
             print(f"⚠️  Order saving failed: {e}")
+        if order is None:
+            self.__return_payment(final_total)
+            print("\n❌ Order failed: you have not been charged. Your cart has been preserved.")
+            input("\nPress Enter to continue...")
+            return
+        # The user's cart holds are converted into the sale
+        self.__reservations.commit(email, list(self.cart.keys()))
         # Clear shopping cart
         self.cart.clear()
         print("\n✅ Order placed successfully! Thank you for shopping.")
@@ -13,12 +13,15 @@ Version: 3.0
 
 from abc import ABC, abstractmethod
 from datetime import datetime
-from typing import Dict, Any, Optional
-from collections import OrderedDict
+from typing import TYPE_CHECKING, Dict, Any, Optional
+from sessionCart import SessionCart
 import os
-from ShoppingPage import Shopping
+from dataContext import DataContext
 from InputHandler import InputHandler, BackToMainException, ExitApplicationException
 
+if TYPE_CHECKING:
+    from ShoppingPage import Shopping
+
 
 class Page(ABC):
     """
@@ -161,18 +164,20 @@ class UserPage(Page):
     edit profiles, top up funds, and handle VIP membership activities.
     """
 
-    def __init__(self, user_email: str, users_data: Dict[str, Any], products_data: Dict[str, Any]):
+    def __init__(self, user_email: str, context: DataContext):
         """
-        Constructs a UserPage with user and product data.
+        Constructs a UserPage over the shared data context.
 
         :param user_email: The logged-in user's email address.
-        :param users_data: A dictionary containing all users' data.
-        :param products_data: A dictionary containing all products' data.
+        :param context: The application's DataContext, which owns user, product,
+                        order and stock hold data.
         """
         self.__user_email = user_email
-        self.__users = users_data
-        self.__products = products_data
-        self.__cart: OrderedDict = OrderedDict()
+        self.__context = context
+        self.__users = context.users
+        self.__products = context.products
+        self.__cart: SessionCart = SessionCart()
+        self.__reservations = context.reservations
         VIPManager.check_vip_expiry(self.__users[self.__user_email])
 
     def run(self) -> None:
@@ -242,6 +247,7 @@ class UserPage(Page):
             '9': self.__update_vip_status
         }
         if choice == '10':
+            self.__reservations.release_user(self.__user_email, list(self.__cart.keys()))
             self.__cart.clear()
             print("Logging out... Your cart has been cleared.")
             input("\nPress Enter to continue...")
@@ -259,7 +265,7 @@ class UserPage(Page):
 
         :return: None
         """
-        shopping_page = Shopping(self.__products, self.__user_email, self.__users, self.__cart)
+        shopping_page = self.__shopping_page()
         shopping_page.browse()
         self.__cart = shopping_page.get_cart()
 
@@ -269,7 +275,7 @@ class UserPage(Page):
 
         :return: None
         """
-        shopping_page = Shopping(self.__products, self.__user_email, self.__users, self.__cart)
+        shopping_page = self.__shopping_page()
         shopping_page.view_cart()
         if self.__cart:
             shopping_page.cart_actions()
@@ -287,7 +293,7 @@ class UserPage(Page):
 
         :return: None
         """
-        shopping_page = Shopping(self.__products, self.__user_email, self.__users, self.__cart)
+        shopping_page = self.__shopping_page()
         shopping_page.checkout()
         self.__cart = shopping_page.get_cart()
         self.__users = shopping_page.get_users()
@@ -435,8 +441,8 @@ class UserPage(Page):
         """
         Displays the user's order and VIP membership history.
 
-        This method loads orders from the Order system and displays them
-        along with VIP membership history.
+        This method reads orders from the shared order manager and displays
+        them along with VIP membership history.
 
         :return: None
         """
@@ -447,10 +453,9 @@ class UserPage(Page):
         print("  📦 ORDER HISTORY")
         print("="*60)
 
+        user_orders = []
         try:
-            from Order import Order as OrderManager
-            order_manager = OrderManager()
-            user_orders = order_manager.list_orders(self.__user_email)
+            user_orders = self.__context.order_manager.list_orders(self.__user_email)
 
             if not user_orders:
                 print("\nNo orders found.")
@@ -473,6 +478,12 @@ class UserPage(Page):
                 for order in user['orders']:
                     print(f"Order ID: {order.get('id', 'N/A')} | Date: {order.get('date', 'N/A')} | Total: ${order.get('total_price', 0):.2f}")
 
+        if user_orders:
+            try:
+                self.__offer_reorder(user_orders)
+            except Exception as e:
+                print(f"\n⚠️  Reorder failed: {e}")
+
         # Display membership history
         print("\n" + "="*60)
         print("  👑 MEMBERSHIP HISTORY")
@@ -485,12 +496,42 @@ class UserPage(Page):
 
         input("\nPress Enter to continue...")
 
+    def __offer_reorder(self, user_orders: list) -> None:
+        """
+        Offers to add the items of one of the user's past orders to the cart.
+
+        :param user_orders: The user's orders, as listed in the order history.
+        :return: None
+        """
+        order_id = input("\nEnter an Order ID to reorder its items (or press Enter to skip): ").strip()
+        if not order_id:
+            return
+        order = next((o for o in user_orders if str(o.order_id) == order_id), None)
+        if order is None:
+            print("❌ Order not found.")
+            return
+        shopping_page = self.__shopping_page()
+        shopping_page.reorder(order.product_list)
+        self.__cart = shopping_page.get_cart()
+
+    def __shopping_page(self) -> 'Shopping':
+        """
+        Builds a shopping page over this session's cart.
+
+        ShoppingPage is imported here rather than at module level, so logging
+        in does not pay for the shopping code until the user first uses it.
+
+        :return: A Shopping page sharing this session's data.
+        """
+        from ShoppingPage import Shopping
+        return Shopping(self.__products, self.__user_email, self.__users, self.__cart,
+                        self.__reservations, self.__context)
+
     def __save_data(self) -> None:
         """
         Saves all user and product data.
 
         :return: None
         """
-        from mainPage import DataManager
-        DataManager.save_data('users.txt', self.__users)
-        DataManager.save_data('products.txt', self.__products)
\ No newline at end of file
+        self.__context.save_users()
+        self.__context.save_products()
\ No newline at end of file
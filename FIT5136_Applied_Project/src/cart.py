@@ -9,10 +9,17 @@ Author: Applied10_Group6
 Version: 1.0
 """
 
+import atexit
+import hashlib
 import json
+import os
+import queue
+import threading
+import time
 from collections import OrderedDict
-from typing import Dict, List, Optional, Any
+from typing import Callable, Dict, Iterable, List, Mapping, Optional, Any, Tuple
 from abc import ABC, abstractmethod
+from fileLock import FileLockManager
 
 
 class CartRules:
@@ -49,6 +56,48 @@ class CartRules:
         """
         return 0 < quantity <= cls.MAX_PRODUCT_QUANTITY
 
+    @classmethod
+    def validate_bulk(cls, current: Mapping[str, int], items: Iterable[Tuple[str, int]],
+                      stock: Optional[Mapping[str, int]] = None
+                      ) -> Tuple['OrderedDict[str, int]', List[Tuple[str, int, str]]]:
+        """
+        Validates many additions to a cart in one pass.
+
+        Repeated product IDs are combined first. Every line is checked against
+        the quantity limit, the cart capacity and, if given, a single stock
+        snapshot, so the result does not depend on stock moving mid-way.
+
+        :param current: The cart's current quantities by product ID.
+        :param items: (product_id, quantity) pairs to add.
+        :param stock: Optional units available per product ID; products missing from it are rejected.
+        :return: Tuple of (accepted new quantities by product ID, rejected (product_id, quantity, reason) triples).
+        """
+        requested: 'OrderedDict[str, int]' = OrderedDict()
+        for product_id, quantity in items:
+            requested[product_id] = requested.get(product_id, 0) + quantity
+
+        accepted: 'OrderedDict[str, int]' = OrderedDict()
+        rejected: List[Tuple[str, int, str]] = []
+        lines = len(current)
+        for product_id, quantity in requested.items():
+            new_qty = current.get(product_id, 0) + quantity
+            if quantity <= 0:
+                rejected.append((product_id, quantity, "invalid quantity"))
+            elif stock is not None and product_id not in stock:
+                rejected.append((product_id, quantity, "unknown product"))
+            elif not cls.validate_product_quantity(new_qty):
+                rejected.append((product_id, quantity,
+                                 f"more than {cls.MAX_PRODUCT_QUANTITY} of a single product"))
+            elif stock is not None and new_qty > stock[product_id]:
+                rejected.append((product_id, quantity, f"only {stock[product_id]} available"))
+            elif product_id not in current and not cls.validate_cart_capacity(lines):
+                rejected.append((product_id, quantity, f"cart limit of {cls.MAX_CART_ITEMS} items reached"))
+            else:
+                accepted[product_id] = new_qty
+                if product_id not in current:
+                    lines += 1
+        return accepted, rejected
+
 
 class CartItem:
     """
@@ -135,10 +184,39 @@ class ShoppingCart:
     maintains the order of items as they are added. The class supports filtering
     cart contents and clearing carts on user logout.
 
+    Each user's cart lives in its own hash-sharded file and is only read when
+    that user's cart is first accessed, so startup and memory do not grow with
+    the number of registered users. A shard stores the cart as an ordered list
+    of [product_id, quantity] pairs, so the addition order needs no side file.
+
+    Persistence is write-behind by default: mutations only mark the user's cart
+    dirty and return, while a background writer thread coalesces dirty carts and
+    writes them out every flush_interval seconds, or sooner once flush_threshold
+    carts are pending. The pending queue is bounded, so callers are slowed down
+    rather than buffering without limit if the disk cannot keep up. Call flush()
+    to force pending changes to disk and close() on shutdown.
+
+    At most max_cached_carts carts are kept in memory; the least recently used
+    cart is written to its shard and dropped when the cache is full, and is
+    reloaded transparently on its next access. A sweeper thread deletes carts,
+    in memory and on disk, that have been idle for longer than cart_ttl.
+
     Author: Applied10_Group6
     Version: 1.0
     """
 
+    DEFAULT_FLUSH_INTERVAL: float = 0.5
+    DEFAULT_FLUSH_THRESHOLD: int = 32
+    MAX_PENDING: int = 1024
+
+    SHARD_DIR_SUFFIX: str = '.d'
+
+    DEFAULT_MAX_CACHED_CARTS: int = 1000
+    DEFAULT_CART_TTL: float = 30 * 24 * 60 * 60  # Abandoned after 30 idle days
+    DEFAULT_SWEEP_INTERVAL: float = 60 * 60
+
+    _STOP = object()  # Writer queue sentinel: flush and exit
+
     def filter_cart(self, user_email: str, products: Dict, name: Optional[str] = None,
                    brand: Optional[str] = None, category: Optional[str] = None,
                    min_price: Optional[float] = None, max_price: Optional[float] = None) -> List[Dict]:
@@ -180,16 +258,66 @@ class ShoppingCart:
 
             filtered.append({'product': prod_dict, 'quantity': qty})
         return filtered
-    def __init__(self, filename: str = 'carts.txt'):
+    def __init__(self, filename: str = 'carts.txt', write_behind: bool = True,
+                 flush_interval: float = DEFAULT_FLUSH_INTERVAL,
+                 flush_threshold: int = DEFAULT_FLUSH_THRESHOLD,
+                 max_cached_carts: int = DEFAULT_MAX_CACHED_CARTS,
+                 cart_ttl: float = DEFAULT_CART_TTL,
+                 sweep_interval: Optional[float] = DEFAULT_SWEEP_INTERVAL,
+                 clock: Callable[[], float] = time.time):
         """
         Constructs a ShoppingCart with file-based persistence.
 
+        Carts are stored one user per shard file under '<name>.d/' next to
+        filename, and loaded lazily the first time a user's cart is touched.
+        A legacy single-file carts.txt is split into shards on first use.
+
         :param filename: The file name to store cart data (default: 'carts.txt').
-        """
+        :param write_behind: Persist from a background thread instead of on every change.
+        :param flush_interval: Maximum seconds a change waits before being written.
+        :param flush_threshold: Number of dirty carts that triggers an early write.
+        :param max_cached_carts: Maximum number of carts kept in memory.
+        :param cart_ttl: Seconds a cart may sit idle before it is expired.
+        :param sweep_interval: Seconds between expiry sweeps; None disables the sweeper thread.
+        :param clock: Wall-clock time source (injectable for testing).
+        :raises ValueError: If any interval, threshold or limit is not positive.
+        """
+        if flush_interval <= 0 or flush_threshold <= 0:
+            raise ValueError("Flush interval and threshold must be positive")
+        if max_cached_carts <= 0 or cart_ttl <= 0 or (sweep_interval is not None and sweep_interval <= 0):
+            raise ValueError("Cache size, cart TTL and sweep interval must be positive")
         self.__filename = filename  # Private attribute (encapsulation)
-        self.__carts: Dict[str, OrderedDict] = {}  # Private attribute
-        self.__cart_order: Dict[str, List[str]] = {}  # Track addition order
-        self.__load_carts()
+        self.__shard_dir = os.path.splitext(filename)[0] + self.SHARD_DIR_SUFFIX
+        self.__carts: OrderedDict = OrderedDict()  # Loaded carts, least recently used first
+        self.__last_access: Dict[str, float] = {}
+        self.__max_cached = max_cached_carts
+        self.__cart_ttl = cart_ttl
+        self.__clock = clock
+        self.__evicted = 0
+        self.__expired = 0
+        self.__lock = threading.RLock()
+        os.makedirs(self.__shard_dir, exist_ok=True)
+        self.__migrate_legacy_file()
+
+        self.__dirty: set = set()
+        self.__flush_interval = flush_interval
+        self.__flush_threshold = flush_threshold
+        self.__queue: Optional[queue.Queue] = None
+        self.__writer: Optional[threading.Thread] = None
+        if write_behind:
+            self.__queue = queue.Queue(maxsize=self.MAX_PENDING)
+            self.__writer = threading.Thread(target=self.__writer_loop,
+                                             name=f"cart-writer-{filename}", daemon=True)
+            self.__writer.start()
+            atexit.register(self.close)
+
+        self.__stop_sweeper = threading.Event()
+        self.__sweeper: Optional[threading.Thread] = None
+        if sweep_interval is not None:
+            self.__sweeper = threading.Thread(target=self.__sweeper_loop, args=(sweep_interval,),
+                                              name=f"cart-sweeper-{filename}", daemon=True)
+            self.__sweeper.start()
+            atexit.register(self.close)
 
     @property
     def filename(self) -> str:
@@ -200,40 +328,381 @@ class ShoppingCart:
         """
         return self.__filename
 
-    def __load_carts(self):
+    @property
+    def stats(self) -> Dict[str, int]:
         """
-        Loads cart data from the storage file.
+        Returns cache counters: carts live in memory, evicted to disk and expired.
 
-        This private method reads cart data and order information from JSON files.
-        If files don't exist or are corrupted, it starts with empty carts.
+        :return: Dictionary with 'live', 'evicted' and 'expired' counts.
         """
-        try:
-            with open(self.__filename, 'r') as f:
-                data = json.load(f)
-                for user, items in data.items():
-                    self.__carts[user] = OrderedDict(items)
-        except FileNotFoundError:
-            print(f"Warning: {self.__filename} not found, starting with empty carts.")
-        except json.JSONDecodeError:
-            print(f"Error: {self.__filename} is invalid, starting with empty carts.")
+        with self.__lock:
+            return {'live': len(self.__carts), 'evicted': self.__evicted, 'expired': self.__expired}
 
-        try:
-            with open(self.__filename + '.order', 'r') as f:
-                self.__cart_order = json.load(f)
-        except Exception:
-            pass
+    @property
+    def shard_dir(self) -> str:
+        """
+        Returns the directory holding the per-user cart shards.
+
+        :return: The shard directory path.
+        """
+        return self.__shard_dir
+
+    def __shard_path(self, user_email: str) -> str:
+        """
+        Returns the shard file for a user.
+
+        Emails are hashed so any address maps to a safe file name, and the
+        first two hex digits pick one of 256 bucket directories so no single
+        directory grows with the number of users.
+
+        :param user_email: The user's email address.
+        :return: Path of the user's cart shard.
+        """
+        digest = hashlib.sha1(user_email.encode('utf-8')).hexdigest()
+        return os.path.join(self.__shard_dir, digest[:2], digest + '.json')
+
+    def __ensure_loaded(self, user_email: str):
+        """
+        Loads a user's cart from its shard the first time it is accessed.
+
+        :param user_email: The user's email address.
+        """
+        with self.__lock:
+            if user_email in self.__carts:
+                self.__touch(user_email)
+                return
+            path = self.__shard_path(user_email)
+            with FileLockManager.shared(os.path.dirname(path)):
+                try:
+                    with open(path, 'r') as f:
+                        items = json.load(f)['items']
+                except FileNotFoundError:
+                    return
+                except (json.JSONDecodeError, KeyError):
+                    print(f"Error: cart shard for {user_email} is invalid, starting with an empty cart.")
+                    return
+                legacy_layout = isinstance(items, dict)
+                if legacy_layout:
+                    try:
+                        with open(path + '.order', 'r') as f:
+                            order = json.load(f)
+                    except Exception:
+                        order = []
+                    cart = self._ordered_cart(items, order)
+                else:
+                    cart = OrderedDict((pid, qty) for pid, qty in items)
+            self.__carts[user_email] = cart
+            self.__touch(user_email)
+            if legacy_layout:
+                self.__mark_dirty(user_email)  # Rewritten in the new encoding
+
+    @staticmethod
+    def _ordered_cart(items: Dict[str, int], order: List[str]) -> OrderedDict:
+        """
+        Rebuilds an ordered cart from the old items-plus-order-list layout.
+
+        Products listed in the order come first, in that order; any the order
+        list missed follow in their stored order.
+
+        :param items: Quantities by product ID.
+        :param order: Product IDs in the order they were added.
+        :return: The cart as an OrderedDict.
+        """
+        cart = OrderedDict((pid, items[pid]) for pid in order if pid in items)
+        for pid, qty in items.items():
+            cart.setdefault(pid, qty)
+        return cart
+
+    def __touch(self, user_email: str):
+        """
+        Marks a loaded cart as most recently used, evicting the least recently
+        used carts if the cache is over capacity.
+
+        :param user_email: The user whose cart was accessed.
+        """
+        with self.__lock:
+            self.__carts.move_to_end(user_email)
+            self.__last_access[user_email] = self.__clock()
+            while len(self.__carts) > self.__max_cached:
+                victim = next(iter(self.__carts))
+                self.__unload(victim)
+                self.__evicted += 1
+
+    def __unload(self, user_email: str, persist: bool = True):
+        """
+        Drops a cart from memory, first writing it to its shard if it has
+        unsaved changes.
+
+        An unchanged cart's shard is given the cart's last access time as its
+        modification time instead, since that is what the expiry sweep judges
+        carts on disk by.
+
+        :param user_email: The user whose cart is dropped.
+        :param persist: Whether unsaved changes (or the last access) are written before dropping.
+        """
+        with self.__lock:
+            items = self.__carts.pop(user_email)
+            last_access = self.__last_access.pop(user_email, None)
+            dirty = user_email in self.__dirty
+            self.__dirty.discard(user_email)
+            if not persist:
+                return
+            if dirty:
+                self.__write_shard(user_email, list(items.items()))
+            elif last_access is not None:
+                path = self.__shard_path(user_email)
+                with FileLockManager.exclusive(os.path.dirname(path)):
+                    try:
+                        if os.stat(path).st_mtime < last_access:
+                            os.utime(path, (last_access, last_access))
+                    except FileNotFoundError:
+                        pass
+
+    def expire_idle_carts(self) -> int:
+        """
+        Deletes carts idle for longer than the cart TTL.
+
+        Loaded carts are judged by their last access, carts only on disk by
+        their shard's modification time. Shards are deleted under the cart
+        lock and their bucket's lock, after checking that the cart has not
+        been loaded again, so a cart being reloaded is never deleted.
+
+        :return: Number of carts expired.
+        """
+        cutoff = self.__clock() - self.__cart_ttl
+        with self.__lock:
+            idle = [user for user in self.__carts if self.__last_access.get(user, cutoff) < cutoff]
+            for user in idle:
+                self.__unload(user, persist=False)
+        expired = 0
+        for user in idle:
+            with self.__lock:
+                if user in self.__carts:
+                    continue  # Used again since it was unloaded
+                self.__write_shard(user, None)
+            expired += 1
+
+        shard_paths: Dict[str, str] = {}
+        for bucket in os.scandir(self.__shard_dir):
+            if not bucket.is_dir():
+                continue
+            # Loads take the cart lock, then the bucket lock: the same order is kept here
+            with self.__lock, FileLockManager.exclusive(bucket.path):
+                for user in self.__carts:
+                    if user not in shard_paths:
+                        shard_paths[user] = self.__shard_path(user)
+                live_shards = {shard_paths[user] for user in self.__carts}
+                for entry in os.scandir(bucket.path):
+                    if not entry.name.endswith('.json') or entry.path in live_shards:
+                        continue
+                    try:
+                        if entry.stat().st_mtime >= cutoff:
+                            continue
+                        os.remove(entry.path)
+                        if os.path.exists(entry.path + '.order'):
+                            os.remove(entry.path + '.order')  # Left over from the two-file layout
+                    except FileNotFoundError:
+                        continue
+                    expired += 1
+
+        with self.__lock:
+            self.__expired += expired
+        return expired
+
+    def __sweeper_loop(self, interval: float):
+        """
+        Background sweeper: expires idle carts every interval seconds until closed.
+
+        :param interval: Seconds between sweeps.
+        """
+        while not self.__stop_sweeper.wait(interval):
+            try:
+                self.expire_idle_carts()
+            except OSError as e:
+                print(f"Error expiring carts in {self.__shard_dir}: {e}")
+
+    def __write_shard(self, user_email: str, items: Optional[List[Tuple[str, int]]]):
+        """
+        Writes (or deletes, when items is None) one user's cart shard.
+
+        The shard is written to a temporary name and renamed into place, so a
+        reader never sees a partially written cart. Any .order file left by
+        the old two-file layout is removed.
+
+        :param user_email: The user's email address.
+        :param items: The cart as ordered (product_id, quantity) pairs, or None if it no longer exists.
+        """
+        path = self.__shard_path(user_email)
+        bucket = os.path.dirname(path)
+        with FileLockManager.exclusive(bucket):
+            if items is not None:
+                os.makedirs(bucket, exist_ok=True)
+                tmp_path = f"{path}.{os.getpid()}.tmp"
+                with open(tmp_path, 'w') as f:
+                    json.dump({'email': user_email, 'items': [[pid, qty] for pid, qty in items]},
+                              f, separators=(',', ':'))
+                os.replace(tmp_path, path)
+            for stale in ((path,) if items is None else ()) + (path + '.order',):
+                try:
+                    os.remove(stale)
+                except FileNotFoundError:
+                    pass
+
+    def __migrate_legacy_file(self):
+        """
+        Splits a legacy single-file carts.txt (and its .order file) into shards.
+
+        Runs once: the legacy files are renamed with a '.migrated' suffix
+        afterwards, so later startups never read them.
+        """
+        if not os.path.exists(self.__filename):
+            return
+        with FileLockManager.exclusive(self.__filename):
+            try:
+                with open(self.__filename, 'r') as f:
+                    data = json.load(f)
+            except FileNotFoundError:
+                return  # Another process migrated it first
+            except json.JSONDecodeError:
+                print(f"Error: {self.__filename} is invalid, not migrating carts.")
+                return
+            try:
+                with open(self.__filename + '.order', 'r') as f:
+                    orders = json.load(f)
+            except Exception:
+                orders = {}
+
+            for user, items in data.items():
+                self.__write_shard(user, list(self._ordered_cart(items, orders.get(user, [])).items()))
+            for legacy in (self.__filename, self.__filename + '.order'):
+                if os.path.exists(legacy):
+                    os.replace(legacy, legacy + '.migrated')
+        print(f"Migrated {len(data)} carts from {self.__filename} to {self.__shard_dir}.")
 
     def __save_carts(self):
         """
-        Saves cart data to the storage file.
+        Saves every dirty cart to its shard.
+
+        This private method persists each changed user's cart, in addition
+        order. The dirty carts are copied under the cart lock and written
+        afterwards, so cart operations are not held up by disk I/O.
+        """
+        with self.__lock:
+            snapshot = {user: list(self.__carts[user].items()) if user in self.__carts else None
+                        for user in self.__dirty}
+            self.__dirty.clear()
+
+        for user, items in snapshot.items():
+            self.__write_shard(user, items)
+
+    def __mark_dirty(self, user_email: str):
+        """
+        Records that a user's cart changed and schedules it for persistence.
 
-        This private method persists both cart contents and item order
-        information to JSON files for data persistence.
+        In synchronous mode the carts are saved immediately. Otherwise the user
+        is queued for the writer thread once until the next flush, so repeated
+        edits to one cart coalesce into a single write.
+
+        :param user_email: The user whose cart changed.
+        """
+        with self.__lock:
+            already_pending = user_email in self.__dirty
+            self.__dirty.add(user_email)
+            writer_queue = self.__queue
+        if writer_queue is None:
+            self.__save_carts()
+        elif not already_pending:
+            writer_queue.put(user_email)  # Blocks only when MAX_PENDING carts are waiting
+
+    def __writer_loop(self):
+        """
+        Background writer: batches dirty carts and flushes them to disk.
+
+        Runs until the stop sentinel is received. Flush requests carry an
+        Event that is set once the write has completed.
+        """
+        pending = 0
+        deadline = None
+        while True:
+            timeout = None if deadline is None else max(0.0, deadline - time.monotonic())
+            try:
+                item = self.__queue.get(timeout=timeout)
+            except queue.Empty:
+                item = None
+
+            if isinstance(item, str):
+                pending += 1
+                if deadline is None:
+                    deadline = time.monotonic() + self.__flush_interval
+                if pending < self.__flush_threshold:
+                    continue
+
+            self.__write_pending()
+            pending = 0
+            deadline = None
+            if isinstance(item, threading.Event):
+                item.set()
+            elif item is self._STOP:
+                return
+
+    def __write_pending(self):
+        """
+        Writes dirty carts if there are any, reporting rather than raising errors.
+        """
+        with self.__lock:
+            if not self.__dirty:
+                return
+        try:
+            self.__save_carts()
+        except OSError as e:
+            print(f"Error saving carts to {self.__filename}: {e}")
+
+    def flush(self):
+        """
+        Blocks until every cart change made so far has been written to disk.
         """
-        with open(self.__filename, 'w') as f:
-            json.dump(self.__carts, f, indent=4)
-        with open(self.__filename + '.order', 'w') as f:
-            json.dump(self.__cart_order, f, indent=4)
+        writer, writer_queue = self.__writer, self.__queue
+        if writer is None or not writer.is_alive():
+            self.__write_pending()
+            return
+        done = threading.Event()
+        writer_queue.put(done)
+        done.wait()
+
+    def close(self):
+        """
+        Flushes pending changes and stops the writer and sweeper threads.
+
+        Safe to call more than once; the cart keeps working afterwards with
+        synchronous saves.
+        """
+        self.__stop_sweeper.set()
+        if self.__sweeper is not None and self.__sweeper is not threading.current_thread():
+            self.__sweeper.join()
+        self.__sweeper = None
+        writer, writer_queue = self.__writer, self.__queue
+        if writer is not None and writer.is_alive():
+            writer_queue.put(self._STOP)
+            writer.join()
+        with self.__lock:
+            self.__writer = None
+            self.__queue = None
+        self.__write_pending()
+        atexit.unregister(self.close)
+
+    def __enter__(self) -> 'ShoppingCart':
+        """
+        Returns the cart for use in a with-block.
+
+        :return: This ShoppingCart.
+        """
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        """
+        Flushes and stops the writer when leaving a with-block.
+        """
+        self.close()
 
     def add_to_cart(self, user_email: str, product_id: str, quantity: int) -> bool:
         """
@@ -244,33 +713,75 @@ class ShoppingCart:
         :param quantity: The quantity to add.
         :return: True if product was successfully added, False otherwise.
         """
-        # Initialize cart if doesn't exist
-        if user_email not in self.__carts:
-            self.__carts[user_email] = OrderedDict()
-            self.__cart_order[user_email] = []
-
-        # Check if product already in cart
-        if product_id in self.__carts[user_email]:
-            new_qty = self.__carts[user_email][product_id] + quantity
-            if not CartRules.validate_product_quantity(new_qty):
-                print(f"Cannot add more than {CartRules.MAX_PRODUCT_QUANTITY} of a single product.")
-                return False
-            self.__carts[user_email][product_id] = new_qty
-        else:
-            # Check cart capacity
-            if not CartRules.validate_cart_capacity(len(self.__carts[user_email])):
-                print(f"Cannot have more than {CartRules.MAX_CART_ITEMS} items in the cart.")
-                return False
-            if not CartRules.validate_product_quantity(quantity):
-                print(f"Invalid quantity: {quantity}")
-                return False
-            self.__carts[user_email][product_id] = quantity
-            self.__cart_order[user_email].append(product_id)
-
-        self.__save_carts()
+        with self.__lock:
+            self.__ensure_loaded(user_email)
+            # Initialize cart if doesn't exist
+            if user_email not in self.__carts:
+                self.__carts[user_email] = OrderedDict()
+                self.__touch(user_email)
+
+            # Check if product already in cart
+            if product_id in self.__carts[user_email]:
+                new_qty = self.__carts[user_email][product_id] + quantity
+                if not CartRules.validate_product_quantity(new_qty):
+                    print(f"Cannot add more than {CartRules.MAX_PRODUCT_QUANTITY} of a single product.")
+                    return False
+                self.__carts[user_email][product_id] = new_qty
+            else:
+                # Check cart capacity
+                if not CartRules.validate_cart_capacity(len(self.__carts[user_email])):
+                    print(f"Cannot have more than {CartRules.MAX_CART_ITEMS} items in the cart.")
+                    return False
+                if not CartRules.validate_product_quantity(quantity):
+                    print(f"Invalid quantity: {quantity}")
+                    return False
+                self.__carts[user_email][product_id] = quantity
+
+        self.__mark_dirty(user_email)
         print(f"Added {quantity} of product {product_id} to {user_email}'s cart.")
         return True
 
+    def add_many(self, user_email: str, items: Iterable[Tuple[str, int]],
+                 stock: Optional[Mapping[str, int]] = None) -> Dict[str, Any]:
+        """
+        Adds many products to the user's cart with one validation pass and one write.
+
+        Valid lines are added even if others are rejected.
+
+        :param user_email: The user's email address.
+        :param items: (product_id, quantity) pairs to add.
+        :param stock: Optional snapshot of units available per product ID.
+        :return: Dictionary with 'added' (product ID to new quantity) and 'rejected'
+                 ((product_id, quantity, reason) triples).
+        """
+        with self.__lock:
+            self.__ensure_loaded(user_email)
+            if user_email not in self.__carts:
+                self.__carts[user_email] = OrderedDict()
+                self.__touch(user_email)
+            cart = self.__carts[user_email]
+            accepted, rejected = CartRules.validate_bulk(cart, items, stock)
+            cart.update(accepted)
+
+        if accepted:
+            self.__mark_dirty(user_email)
+        print(f"Added {len(accepted)} product(s) to {user_email}'s cart.")
+        for product_id, quantity, reason in rejected:
+            print(f"Skipped {quantity} of product {product_id}: {reason}.")
+        return {'added': dict(accepted), 'rejected': rejected}
+
+    def reorder(self, user_email: str, product_list: List[Dict[str, Any]],
+                stock: Optional[Mapping[str, int]] = None) -> Dict[str, Any]:
+        """
+        Adds the lines of a previous order to the user's cart.
+
+        :param user_email: The user's email address.
+        :param product_list: An order's product_list (dicts with 'product_id' and 'quantity').
+        :param stock: Optional snapshot of units available per product ID.
+        :return: The add_many() result.
+        """
+        return self.add_many(user_email, [(line['product_id'], line['quantity']) for line in product_list], stock)
+
     def remove_from_cart(self, user_email: str, product_id: str) -> bool:
         """
         Removes a product from the user's cart.
@@ -279,11 +790,13 @@ class ShoppingCart:
         :param product_id: The unique identifier of the product to remove.
         :return: True if product was successfully removed, False otherwise.
         """
-        if user_email in self.__carts and product_id in self.__carts[user_email]:
-            del self.__carts[user_email][product_id]
-            if user_email in self.__cart_order and product_id in self.__cart_order[user_email]:
-                self.__cart_order[user_email].remove(product_id)
-            self.__save_carts()
+        with self.__lock:
+            self.__ensure_loaded(user_email)
+            removed = user_email in self.__carts and product_id in self.__carts[user_email]
+            if removed:
+                del self.__carts[user_email][product_id]
+        if removed:
+            self.__mark_dirty(user_email)
             print(f"Removed product {product_id} from {user_email}'s cart.")
             return True
         print(f"Product {product_id} not found in {user_email}'s cart.")
@@ -297,17 +810,16 @@ class ShoppingCart:
         :param products: Optional product dictionary to include detailed product information.
         :return: List of cart items with product details and pricing.
         """
+        self.__ensure_loaded(user_email)
         if user_email not in self.__carts or not self.__carts[user_email]:
             print(f"No cart found for {user_email}.")
             return []
 
         cart_items = self.__carts[user_email]
-        order = self.__cart_order.get(user_email, list(cart_items.keys()))
         result = []
         total_price = 0.0
 
-        for pid in order:
-            qty = cart_items.get(pid, 0)
+        for pid, qty in cart_items.items():
             if qty == 0:
                 continue
 
@@ -338,10 +850,13 @@ class ShoppingCart:
 
         :param user_email: The user's email address.
         """
-        if user_email in self.__carts:
-            self.__carts[user_email] = OrderedDict()
-            self.__cart_order[user_email] = []
-            self.__save_carts()
+        with self.__lock:
+            self.__ensure_loaded(user_email)
+            found = user_email in self.__carts
+            if found:
+                self.__carts[user_email] = OrderedDict()
+        if found:
+            self.__mark_dirty(user_email)
             print(f"Cleared cart for {user_email}.")
         else:
             print(f"No cart found for {user_email}.")
@@ -353,6 +868,7 @@ class ShoppingCart:
         :param user_email: The user's email address.
         :return: OrderedDict containing the user's cart items.
         """
+        self.__ensure_loaded(user_email)
         if user_email in self.__carts:
             return self.__carts[user_email]
         print(f"No cart found for {user_email}. please create one first.")
@@ -367,6 +883,7 @@ class ShoppingCart:
         :param new_quantity: The new quantity to set (0 removes the item).
         :return: True if edit was successful, False otherwise.
         """
+        self.__ensure_loaded(user_email)
         if user_email not in self.__carts or product_id not in self.__carts[user_email]:
             print(f"Product {product_id} not found in {user_email}'s cart.")
             return False
@@ -378,8 +895,12 @@ class ShoppingCart:
             print(f"Cannot set quantity greater than {CartRules.MAX_PRODUCT_QUANTITY}.")
             return False
 
-        self.__carts[user_email][product_id] = new_quantity
-        self.__save_carts()
+        with self.__lock:
+            if product_id not in self.__carts.get(user_email, {}):
+                print(f"Product {product_id} not found in {user_email}'s cart.")
+                return False
+            self.__carts[user_email][product_id] = new_quantity
+        self.__mark_dirty(user_email)
         print(f"Updated {product_id} quantity to {new_quantity} in {user_email}'s cart.")
         return True
 
@@ -418,9 +939,41 @@ if __name__ == '__main__':
     cart_manager.remove_from_cart('test@monash.edu', '1')
     cart_manager.clear_cart('test@monash.edu')
     cart_manager.session_logout('test@monash.edu')
+    cart_manager.close()
+
+    # Write-behind: time cart edits against synchronous saves
+    import contextlib
+    import io
+    import tempfile
+
+    bench_dir = tempfile.mkdtemp()
+    for mode, write_behind in (('synchronous', False), ('write-behind', True)):
+        bench_cart = ShoppingCart(os.path.join(bench_dir, f'{mode}.txt'), write_behind=write_behind)
+        start = time.perf_counter()
+        with contextlib.redirect_stdout(io.StringIO()):
+            for i in range(2000):
+                bench_cart.add_to_cart(f'user{i % 200}@monash.edu', str(i % 15), 1)
+                bench_cart.edit_cart(f'user{i % 200}@monash.edu', str(i % 15), 1)
+        elapsed = time.perf_counter() - start
+        bench_cart.close()
+        print(f"{mode:>12}: {elapsed / 4000 * 1e6:8.1f} us per cart operation")
+
+    # LRU eviction and TTL expiry with a controllable clock
+    now = [time.time()]
+    lru_cart = ShoppingCart(os.path.join(bench_dir, 'lru.txt'), max_cached_carts=50,
+                            cart_ttl=3600, sweep_interval=None, clock=lambda: now[0])
+    with contextlib.redirect_stdout(io.StringIO()):
+        for i in range(500):
+            lru_cart.add_to_cart(f'user{i}@monash.edu', '1', 1)
+    lru_cart.flush()
+    print(f"After 500 carts: {lru_cart.stats}")
+    now[0] += 7200
+    lru_cart.expire_idle_carts()
+    print(f"After 2 idle hours: {lru_cart.stats}")
+    lru_cart.close()
 
     print("\n=== OOP Principles Demonstrated ===")
-    print("1. Encapsulation: Private attributes (__carts, __cart_order)")
+    print("1. Encapsulation: Private attributes (__carts, __dirty)")
     print("2. Abstraction: CartRules class abstracts business logic")
     print("3. Validation: CartRules validates inputs before processing")
     print("4. Type Hints: Clear interfaces with type annotations")
@@ -0,0 +1,546 @@
+"""
+DataContext Module - The single owner of every data store in one process.
+
+MainPage creates one DataContext at startup and hands it to the customer and
+administrator pages. Each store is read from disk the first time it is
+needed and then shared, so no page re-reads users, orders or promo codes the
+process already holds. Indexes derived from the stores (such as products by
+category) are built once and rebuilt only after the underlying store changes.
+The stock index is the exception: it is updated in place with every stock
+change, so saving the products does not rebuild it.
+
+Each store sits behind a LazyStore, which records how long it took to load and
+which thread loaded it. prewarm() loads the likely stores on background
+threads, e.g. while the welcome banner waits for Enter. The modules behind
+the stores (the data store, snapshot, order, cart, stock index and stock
+hold modules) are only imported when their stores are first loaded, so
+importing this module costs almost nothing at startup.
+
+Users, admins, products, orders and the category index are also kept in a
+StartupSnapshot, rewritten whenever the stores are saved. A store whose data
+file is unchanged since then is restored from the snapshot instead of being
+parsed from JSON.
+
+Author: Applied10_Group6
+Version: 1.0
+"""
+
+import threading
+import time
+from typing import TYPE_CHECKING, Any, Callable, Dict, Iterable, List, Optional
+
+if TYPE_CHECKING:
+    from cart import ShoppingCart
+    from dataStore import PromoCodeStore
+    from Order import OrderManager
+    from snapshot import StartupSnapshot
+    from stockIndex import StockIndex
+    from stockReservation import StockReservationLedger
+
+
+class LazyStore:
+    """
+    LazyStore - Loads one store on first access, exactly once.
+
+    Concurrent first accesses (a foreground page and a pre-warming thread) are
+    serialised, so the loader runs once and later callers get the same object.
+
+    Author: Applied10_Group6
+    Version: 1.0
+    """
+
+    def __init__(self, name: str, loader: Callable[[], Any]):
+        """
+        Constructs an unloaded store.
+
+        :param name: Store name used in reports.
+        :param loader: Callable returning the loaded store.
+        """
+        self.__name = name
+        self.__loader = loader
+        self.__lock = threading.Lock()
+        self.__value: Any = None
+        self.__loaded = False
+        self.__load_seconds = 0.0
+        self.__wait_seconds = 0.0
+        self.__loaded_by: Optional[str] = None
+
+    @property
+    def name(self) -> str:
+        """
+        Returns the store name.
+
+        :return: The name given at construction.
+        """
+        return self.__name
+
+    @property
+    def loaded(self) -> bool:
+        """
+        Returns whether the store has been loaded.
+
+        :return: True once the loader has run.
+        """
+        return self.__loaded
+
+    @property
+    def profile(self) -> Dict[str, Any]:
+        """
+        Returns load timings for the startup report.
+
+        :return: Dictionary with 'name', 'loaded', 'load_seconds', 'wait_seconds'
+                 (time other threads spent blocked on the load) and 'loaded_by' (thread name).
+        """
+        return {'name': self.__name, 'loaded': self.__loaded,
+                'load_seconds': self.__load_seconds, 'wait_seconds': self.__wait_seconds,
+                'loaded_by': self.__loaded_by}
+
+    def get(self) -> Any:
+        """
+        Returns the store, loading it first if this is the first access.
+
+        :return: The loaded store.
+        """
+        if self.__loaded:
+            return self.__value
+        started = time.perf_counter()
+        with self.__lock:
+            if self.__loaded:
+                # Another thread finished the load while this one waited
+                self.__wait_seconds += time.perf_counter() - started
+            else:
+                self.__value = self.__loader()
+                self.__load_seconds = time.perf_counter() - started
+                self.__loaded_by = threading.current_thread().name
+                self.__loaded = True
+        return self.__value
+
+
+class DataContext:
+    """
+    DataContext - Lazily loaded, shared application data.
+
+    Author: Applied10_Group6
+    Version: 1.0
+    """
+
+    # Data files, relative to the working directory
+    USERS_FILE = 'users.txt'
+    ADMINS_FILE = 'admins.txt'
+    PRODUCTS_FILE = 'products.txt'
+    ORDERS_FILE = 'orders.txt'
+    CARTS_FILE = 'carts.txt'
+    PROMO_CODE_FILE = 'promo_codes.json'
+    HOLDS_FILE = 'products_holds.json'
+    SNAPSHOT_FILE = 'startup.snapshot'
+
+    # Stores kept in the startup snapshot, by name
+    SNAPSHOT_STORES = {'users': USERS_FILE, 'admins': ADMINS_FILE,
+                       'products': PRODUCTS_FILE, 'orders': ORDERS_FILE}
+
+    # Stores a session is most likely to need: logging in reads users, then browsing reads products
+    PREWARM_STORES = ('users', 'products')
+
+    # Least time between startup snapshot writes made by save_all
+    SNAPSHOT_INTERVAL_SECONDS = 300
+
+    def __init__(self, snapshot_file: Optional[str] = SNAPSHOT_FILE):
+        """
+        Constructs a DataContext; no store is read until it is first used.
+
+        :param snapshot_file: Path of the startup snapshot, or None to always parse the data files.
+        """
+        self.__lock = threading.RLock()
+        self.__snapshot = LazyStore('snapshot', lambda: self.__open_snapshot(snapshot_file))
+        self.__snapshot_written_at = time.monotonic()
+        self.__users = LazyStore('users', lambda: self.__load_records('users'))
+        self.__admins = LazyStore('admins', lambda: self.__load_records('admins'))
+        self.__products = LazyStore('products', lambda: self.__load_records('products'))
+        self.__order_manager = LazyStore('orders', self.__load_orders)
+        self.__carts = LazyStore('carts', self.__load_carts)
+        self.__promo_codes = LazyStore('promo_codes', self.__load_promo_codes)
+        self.__stores = {store.name: store for store in (self.__users, self.__admins, self.__products,
+                                                         self.__order_manager, self.__carts,
+                                                         self.__promo_codes)}
+        self.__category_index: Optional[Dict[str, List[str]]] = None
+        self.__stock_index: Optional['StockIndex'] = None
+        # Cart stock holds shared by every customer session, in this process and others
+        self.__reservations = LazyStore('reservations', self.__load_reservations)
+
+    @property
+    def users(self) -> Dict[str, Any]:
+        """
+        Returns all users, loading users.txt on first access.
+
+        :return: Dictionary mapping email addresses to user records.
+        """
+        return self.__users.get()
+
+    @property
+    def admins(self) -> Dict[str, Any]:
+        """
+        Returns all administrators, loading admins.txt on first access.
+
+        :return: Dictionary mapping email addresses to administrator records.
+        """
+        return self.__admins.get()
+
+    @property
+    def products(self) -> Dict[str, Any]:
+        """
+        Returns all products, loading products.txt on first access.
+
+        :return: Dictionary mapping product IDs to product records.
+        """
+        return self.__products.get()
+
+    @property
+    def order_manager(self) -> 'OrderManager':
+        """
+        Returns the order manager, loading orders.txt on first access.
+
+        :return: The process-wide OrderManager.
+        """
+        return self.__order_manager.get()
+
+    @property
+    def carts(self) -> 'ShoppingCart':
+        """
+        Returns the persistent cart store, created on first access.
+
+        :return: ShoppingCart holding every user's cart.
+        """
+        return self.__carts.get()
+
+    @property
+    def promo_codes(self) -> 'PromoCodeStore':
+        """
+        Returns the cached promo code store, reading the file on first access.
+
+        :return: The PromoCodeStore shared with the promo code managers.
+        """
+        return self.__promo_codes.get()
+
+    @property
+    def reservations(self) -> 'StockReservationLedger':
+        """
+        Returns the ledger of cart stock holds, shared with other processes through HOLDS_FILE.
+
+        :return: The shared StockReservationLedger.
+        """
+        return self.__reservations.get()
+
+    @property
+    def products_by_category(self) -> Dict[str, List[str]]:
+        """
+        Returns product IDs grouped by category, building the index on first use.
+
+        :return: Dictionary mapping each category to the IDs of its products.
+        """
+        with self.__lock:
+            if self.__category_index is None:
+                products = self.products
+                snapshot = self.__snapshot.get()
+                restored = None
+                if snapshot is not None:
+                    from dataStore import DataManager
+                    stamp = DataManager.store_for(self.PRODUCTS_FILE).stamp
+                    restored = snapshot.restore('products_by_category', stamp)
+                if restored is not None:
+                    self.__category_index = restored[0]
+                else:
+                    self.__category_index = self.__build_category_index(products)
+            return self.__category_index
+
+    @property
+    def stock_index(self) -> 'StockIndex':
+        """
+        Returns products ordered by quantity, building the index on first use.
+
+        Code that changes a product's quantity reports it to this index.
+
+        :return: The shared StockIndex.
+        """
+        with self.__lock:
+            if self.__stock_index is None:
+                from stockIndex import StockIndex
+                self.__stock_index = StockIndex(self.products)
+            return self.__stock_index
+
+    @property
+    def snapshot_report(self) -> Dict[str, Any]:
+        """
+        Returns how the startup snapshot was used.
+
+        :return: Dictionary with 'status' and the 'restored' and 'rebuilt' entry names.
+        """
+        snapshot = self.__snapshot.get()
+        if snapshot is None:
+            return {'status': 'disabled', 'restored': [], 'rebuilt': []}
+        return {'status': snapshot.status, **snapshot.report}
+
+    def prewarm(self, names: Iterable[str] = PREWARM_STORES) -> List[threading.Thread]:
+        """
+        Starts loading stores on background threads.
+
+        Pages that reach a store before its thread finishes simply wait for
+        that load instead of starting another.
+
+        :param names: Names of the stores to load.
+        :return: The started daemon threads.
+        :raises KeyError: If a name is not a known store.
+        """
+        threads = []
+        for name in names:
+            store = self.__stores[name]
+            if store.loaded:
+                continue
+            thread = threading.Thread(target=store.get, name=f"prewarm-{name}", daemon=True)
+            thread.start()
+            threads.append(thread)
+        return threads
+
+    def startup_profile(self) -> List[Dict[str, Any]]:
+        """
+        Returns load timings for every store.
+
+        :return: One LazyStore.profile dictionary per store.
+        """
+        return [store.profile for store in self.__stores.values()]
+
+    def find_account(self, email: str) -> Optional[Dict[str, Any]]:
+        """
+        Looks up an account among the users, then the administrators.
+
+        :param email: The account's email address.
+        :return: The account record, or None if there is none.
+        """
+        return self.users.get(email) or self.admins.get(email)
+
+    def invalidate_indexes(self) -> None:
+        """
+        Drops derived indexes so they are rebuilt from the current stores.
+        """
+        with self.__lock:
+            self.__category_index = None
+
+    def save_users(self) -> bool:
+        """
+        Saves the users store if it has been loaded.
+
+        :return: True if saved (or nothing to save), False otherwise.
+        """
+        if not self.__users.loaded:
+            return True
+        from dataStore import DataManager
+        return DataManager.save_data(self.USERS_FILE, self.users)
+
+    def save_products(self) -> bool:
+        """
+        Saves the products store if it has been loaded and refreshes its indexes.
+
+        The save merges in other processes' changes, so the stock index is
+        synced with the saved catalog afterwards.
+
+        :return: True if saved (or nothing to save), False otherwise.
+        """
+        if not self.__products.loaded:
+            return True
+        self.invalidate_indexes()
+        from dataStore import DataManager
+        saved = DataManager.save_data(self.PRODUCTS_FILE, self.products)
+        if saved and self.__stock_index is not None:
+            self.__stock_index.sync(self.products)
+        return saved
+
+    def refresh_products(self) -> List[str]:
+        """
+        Picks up product changes saved by other processes, e.g. an
+        administrator's price edit in another terminal.
+
+        The price-change bus only reaches carts in this process, so pages call
+        this before showing a cart or checking out. Each changed product is
+        published on the bus, so the carts holding it are repriced, and the
+        indexes are brought up to date.
+
+        :return: IDs of the products that changed.
+        """
+        if not self.__products.loaded:
+            return []
+        from dataStore import DataManager
+        from priceEvents import PRICE_CHANGES
+        products = self.products
+        changed = DataManager.store_for(self.PRODUCTS_FILE).refresh(products)
+        if changed:
+            self.invalidate_indexes()
+            if self.__stock_index is not None:
+                self.__stock_index.sync(products)
+            for product_id in changed:
+                if product_id in products:
+                    PRICE_CHANGES.publish(product_id, products[product_id])
+        return changed
+
+    def save_all(self, final: bool = False) -> None:
+        """
+        Saves every loaded store, flushes pending cart writes and refreshes the startup snapshot.
+
+        Orders are saved by the OrderManager as each change is made; here
+        cold orders are moved into the order archive once enough have built up
+        and the sales counters are saved. The snapshot is only written at exit
+        or once SNAPSHOT_INTERVAL_SECONDS have passed since it was last written.
+
+        :param final: Whether the application is exiting.
+        """
+        self.save_users()
+        if self.__admins.loaded:
+            from dataStore import DataManager
+            DataManager.save_data(self.ADMINS_FILE, self.admins)
+        self.save_products()
+        if self.__carts.loaded:
+            self.carts.flush()
+        if self.__order_manager.loaded:
+            self.order_manager.archive_orders()
+            self.order_manager.flush_sales()
+        if final or time.monotonic() - self.__snapshot_written_at >= self.SNAPSHOT_INTERVAL_SECONDS:
+            self.write_snapshot()
+
+    def write_snapshot(self) -> bool:
+        """
+        Writes the on-disk state of every loaded store, and its indexes, to the startup snapshot.
+
+        Only what is already saved is written, so the snapshot always matches
+        the data files it was taken from. Stores whose data file is unchanged
+        since the snapshot was taken are not pickled again.
+
+        :return: True if written (or already current), False if disabled or the write failed.
+        """
+        snapshot = self.__snapshot.get()
+        if snapshot is None:
+            return False
+        from dataStore import DataManager
+        self.__snapshot_written_at = time.monotonic()
+        entries = {}
+        for name, filename in self.SNAPSHOT_STORES.items():
+            if not self.__stores[name].loaded:
+                continue
+            checkpoint = DataManager.store_for(filename).checkpoint()
+            if checkpoint is None:
+                continue
+            stamp, records = checkpoint
+            if snapshot.is_current(name, stamp):
+                continue
+            entries[name] = (filename, stamp, records)
+            if name == 'products':
+                entries['products_by_category'] = (filename, stamp, self.__build_category_index(records))
+        return not entries or snapshot.write(entries)
+
+    @staticmethod
+    def __build_category_index(products: Dict[str, Any]) -> Dict[str, List[str]]:
+        """
+        Groups product IDs by category.
+
+        :param products: Product records by ID.
+        :return: Dictionary mapping each category to the IDs of its products.
+        """
+        index: Dict[str, List[str]] = {}
+        for product_id, product in products.items():
+            index.setdefault(product.get('category', 'Unknown'), []).append(product_id)
+        return index
+
+    def __load_records(self, name: str) -> Dict[str, Any]:
+        """
+        Loads a JSON store, from the startup snapshot if its data file is unchanged.
+
+        :param name: A key of SNAPSHOT_STORES.
+        :return: The store's records.
+        """
+        from dataStore import DataManager
+        filename = self.SNAPSHOT_STORES[name]
+        self.__restore(name, filename)
+        return DataManager.load_data(filename)
+
+    def __restore(self, name: str, filename: str) -> None:
+        """
+        Primes a file's versioned store from the startup snapshot when the entry is current.
+
+        :param name: The snapshot entry name.
+        :param filename: The store's data file.
+        """
+        snapshot = self.__snapshot.get()
+        if snapshot is None:
+            return
+        from dataStore import DataManager
+        from snapshot import file_stamp
+        stamp = file_stamp(filename)
+        restored = snapshot.restore(name, stamp)
+        if restored is not None:
+            records, copy_loader = restored
+            DataManager.store_for(filename).prime(records, stamp, copy_loader)
+
+    def __load_orders(self) -> 'OrderManager':
+        """
+        Imports the order module and loads the order store.
+
+        :return: An OrderManager over ORDERS_FILE.
+        """
+        from Order import OrderManager
+        self.__restore('orders', self.ORDERS_FILE)
+        return OrderManager(self.ORDERS_FILE,
+                            category_of=lambda product_id: self.products.get(product_id, {}).get('category'))
+
+    def __load_carts(self) -> 'ShoppingCart':
+        """
+        Imports the cart module and opens the sharded cart store.
+
+        :return: A ShoppingCart over CARTS_FILE.
+        """
+        from cart import ShoppingCart
+        return ShoppingCart(self.CARTS_FILE)
+
+    def __load_promo_codes(self) -> 'PromoCodeStore':
+        """
+        Returns the shared promo code store with the file read into its cache.
+
+        :return: The PromoCodeStore for PROMO_CODE_FILE.
+        """
+        from dataStore import PromoCodeStore
+        store = PromoCodeStore.for_file(self.PROMO_CODE_FILE)
+        try:
+            store.load()
+        except Exception as e:
+            print(f"Error loading promo codes: {e}")
+        return store
+
+    def __load_reservations(self) -> 'StockReservationLedger':
+        """
+        Imports the stock hold module and opens the shared ledger.
+
+        :return: A StockReservationLedger over HOLDS_FILE.
+        """
+        from stockReservation import StockReservationLedger
+        return StockReservationLedger(filename=self.HOLDS_FILE)
+
+    @staticmethod
+    def __open_snapshot(snapshot_file: Optional[str]) -> Optional['StartupSnapshot']:
+        """
+        Imports the snapshot module and opens the startup snapshot.
+
+        :param snapshot_file: Path of the startup snapshot, or None when disabled.
+        :return: The StartupSnapshot, or None when disabled.
+        """
+        if not snapshot_file:
+            return None
+        from snapshot import StartupSnapshot
+        return StartupSnapshot(snapshot_file)
+
+
+if __name__ == '__main__':
+    # Demonstration: stores are read once, on first use
+    context = DataContext()
+    for thread in context.prewarm():
+        thread.join()
+    print(f"Users loaded: {len(context.users)}")
+    print(f"Same dictionary on second access: {context.users is context.users}")
+    print(f"Categories: {sorted(context.products_by_category)}")
+    for entry in context.startup_profile():
+        print(f"{entry['name']:<12} loaded={entry['loaded']!s:<5} {entry['load_seconds'] * 1000:.2f} ms")
@@ -0,0 +1,757 @@
+"""
+DataStore Module - Versioned JSON record stores with optimistic concurrency.
+
+Every JSON store in the system (users, products, orders) is a top-level object
+mapping a key to a record dictionary. This module stamps each record with a
+version number and saves with compare-and-swap semantics: on save the file is
+re-read, records nobody else touched are written directly, and records changed
+concurrently by another process are merged field by field against the copy
+that was originally loaded. Several store front-ends can therefore share one
+data directory without the last writer silently discarding everyone else's
+balance and stock changes.
+
+DataManager is the entry point the pages use to load and save these stores;
+PromoCodeStore keeps the promo code file in memory between reads.
+
+Author: Applied10_Group6
+Version: 1.0
+"""
+
+import copy
+import json
+import os
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Tuple
+from fileLock import FileLockManager
+from jsonStream import iter_object_items, read_object
+
+
+# Per-file merge policies for the stores managed through DataManager.
+# delta_fields are numeric counters merged as theirs + (mine - base);
+# list_fields are append-only histories merged by appending new entries;
+# nonnegative_fields may not be taken below zero by a save.
+STORE_POLICIES: Dict[str, Dict[str, Tuple[str, ...]]] = {
+    'users.txt': {'delta_fields': ('balance',), 'list_fields': ('orders', 'membership_history'),
+                  'nonnegative_fields': ('balance',)},
+    'admins.txt': {},
+    'products.txt': {'delta_fields': ('quantity',), 'nonnegative_fields': ('quantity',)},
+    'orders.txt': {},
+}
+
+_MISSING = object()
+
+# A record as remembered in the merge base: (version, compact JSON text)
+BaseRecord = Tuple[int, str]
+
+
+def _freeze(record: Any) -> BaseRecord:
+    """
+    Returns the compact merge-base form of a record.
+
+    :param record: A record as loaded or written.
+    :return: Tuple of (version, compact JSON text).
+    """
+    version = record.get(VersionedJSONStore.VERSION_FIELD, 0) if isinstance(record, dict) else 0
+    return version, json.dumps(record, separators=(',', ':'))
+
+
+class SaveConflict:
+    """
+    SaveConflict - Describes a field that was changed by two writers at once.
+
+    Author: Applied10_Group6
+    Version: 1.0
+    """
+    __slots__ = ('key', 'field', 'mine', 'theirs')
+
+    def __init__(self, key: str, field: Optional[str], mine: Any, theirs: Any):
+        """
+        Constructs a SaveConflict.
+
+        :param key: Key of the conflicting record.
+        :param field: Conflicting field name, or None for a whole-record conflict.
+        :param mine: This process's value (the one kept).
+        :param theirs: The other writer's value (the one overwritten).
+        """
+        self.key = key
+        self.field = field
+        self.mine = mine
+        self.theirs = theirs
+
+    def __str__(self) -> str:
+        """
+        Returns a one-line description of the conflict.
+
+        :return: Human-readable conflict summary.
+        """
+        where = f"{self.key}.{self.field}" if self.field else self.key
+        return f"{where}: kept {self.mine!r}, overwrote {self.theirs!r}"
+
+
+class VersionedJSONStore:
+    """
+    VersionedJSONStore - A JSON file of versioned records saved with compare-and-swap.
+
+    The store remembers the records as they were last read from or written to
+    disk (the base). A save re-reads the file and performs a three-way merge
+    per record: untouched local records adopt the on-disk copy, local edits
+    to records whose on-disk version still equals the base version are written
+    with the version bumped, and concurrent edits are merged field by field.
+    The merged result is written atomically under the store's exclusive lock;
+    if the file still changed between the read and the write (e.g. a writer
+    that does not take the lock), the whole merge is retried. A save that
+    would leave the file as it is does not write it, so its stamp holds.
+    A save that would take a nonnegative field below zero, e.g. two
+    sessions each selling the last unit, writes nothing and fails.
+
+    After a save the caller's dictionary is refreshed in place, so record
+    objects held elsewhere (e.g. a product inside a cart) stay valid.
+
+    The base is kept compact: each record is held as its version and its
+    compact JSON text, not as a second copy of the decoded record. A record
+    is only decoded from the base when both writers changed it.
+
+    Author: Applied10_Group6
+    Version: 1.0
+    """
+
+    VERSION_FIELD = 'version'
+    MAX_RETRIES = 5
+
+    def __init__(self, filename: str, delta_fields: Iterable[str] = (),
+                 list_fields: Iterable[str] = (), nonnegative_fields: Iterable[str] = ()):
+        """
+        Constructs a store for one JSON file.
+
+        :param filename: Path of the JSON file.
+        :param delta_fields: Numeric fields merged by applying the local delta.
+        :param list_fields: List fields merged by appending local additions.
+        :param nonnegative_fields: Numeric fields a local change may not take below zero.
+        """
+        self.__filename = filename
+        self.__delta_fields = frozenset(delta_fields)
+        self.__list_fields = frozenset(list_fields)
+        self.__nonnegative_fields = frozenset(nonnegative_fields)
+        self.__violations: List[Tuple[str, str, Any]] = []
+        self.__base: Dict[str, BaseRecord] = {}
+        self.__base_loader: Optional[Callable[[], Dict[str, Any]]] = None
+        self.__primed: Optional[Dict[str, Any]] = None
+        self.__stamp: Optional[Tuple[int, int, int]] = None
+        self.__conflicts: List[SaveConflict] = []
+
+    @property
+    def filename(self) -> str:
+        """
+        Returns the path of the underlying JSON file.
+
+        :return: File path.
+        """
+        return self.__filename
+
+    @property
+    def last_conflicts(self) -> List[SaveConflict]:
+        """
+        Returns the conflicts resolved by the most recent save.
+
+        :return: List of SaveConflict entries (empty if none).
+        """
+        return list(self.__conflicts)
+
+    @property
+    def stamp(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Returns the stamp of the file version the merge base was read from or written as.
+
+        :return: Tuple of (inode, mtime_ns, size), or None if nothing has been read from disk.
+        """
+        return self.__stamp
+
+    def prime(self, data: Dict[str, Any], stamp: Tuple[int, int, int],
+              base_loader: Callable[[], Dict[str, Any]]) -> None:
+        """
+        Supplies records obtained elsewhere (e.g. a startup snapshot) for the next load.
+
+        The caller vouches that the records match the file version identified
+        by stamp. The merge base is only built, via base_loader, when the
+        store is first saved.
+
+        :param data: The records the next load() returns.
+        :param stamp: Stamp of the file version the records came from.
+        :param base_loader: Callable returning an independent copy of the records.
+        """
+        self.__primed = data
+        self.__stamp = stamp
+        self.__base_loader = base_loader
+
+    def checkpoint(self) -> Optional[Tuple[Tuple[int, int, int], Dict[str, Any]]]:
+        """
+        Returns the records as they are on disk, with the stamp of that file version.
+
+        Unsaved in-memory changes are never included, because the merge base
+        only changes when the file is read or written.
+
+        :return: Tuple of (stamp, records), or None if the on-disk state is not held in memory.
+        """
+        if self.__stamp is None or self.__base_loader is not None:
+            return None
+        return self.__stamp, {key: json.loads(text) for key, (_, text) in self.__base.items()}
+
+    def load(self) -> Dict[str, Any]:
+        """
+        Loads all records and remembers them as the merge base.
+
+        :return: Dictionary of records, or an empty dictionary if missing or corrupt.
+        """
+        if self.__primed is not None:
+            data, self.__primed = self.__primed, None
+            return data
+        try:
+            with FileLockManager.shared(self.__filename):
+                data, self.__stamp = self._read()
+        except FileNotFoundError:
+            print(f"Warning: {self.__filename} not found, starting with empty data.")
+            data, self.__stamp = {}, None
+        except json.JSONDecodeError:
+            print(f"Error: {self.__filename} is corrupted, starting with empty data.")
+            data, self.__stamp = {}, None
+        self.__base = {key: _freeze(record) for key, record in data.items()}
+        self.__base_loader = None
+        return data
+
+    def iter_load(self) -> Iterator[Tuple[str, Any]]:
+        """
+        Loads the records one at a time, remembering each as part of the merge base.
+
+        The file is streamed, so a caller that converts each record as it
+        arrives never holds the whole file in decoded form. The store's
+        shared lock is held until the iterator is exhausted or closed.
+
+        :return: Iterator of (key, record) pairs in file order.
+        """
+        if self.__primed is not None:
+            data, self.__primed = self.__primed, None
+            yield from data.items()
+            return
+        self.__base, self.__base_loader, self.__stamp = {}, None, None
+        count = 0
+        try:
+            with FileLockManager.shared(self.__filename), open(self.__filename, 'r') as f:
+                stat = os.fstat(f.fileno())
+                self.__stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+                for key, record in iter_object_items(f):
+                    self.__base[key] = _freeze(record)
+                    count += 1
+                    yield key, record
+        except FileNotFoundError:
+            print(f"Warning: {self.__filename} not found, starting with empty data.")
+        except json.JSONDecodeError:
+            print(f"Error: {self.__filename} is corrupted after {count} records, "
+                  f"starting with the records read so far.")
+            self.__stamp = None
+
+    def save(self, data: Dict[str, Any],
+             rekey: Optional[Callable[[str, Dict[str, Any], Iterable[str]], str]] = None) -> bool:
+        """
+        Saves the records with compare-and-swap, merging concurrent changes.
+
+        :param data: The in-memory records; refreshed in place with the merged result.
+        :param rekey: Optional callback used when a newly created local record
+                      collides with a record another writer created under the
+                      same key. It receives (key, record, taken_keys), may
+                      update the record, and returns the new key.
+        :return: True if the data was written, False otherwise (nothing is
+                 written if a nonnegative field would go below zero).
+        """
+        if self.__base_loader is not None:
+            self.__base = {key: _freeze(record) for key, record in self.__base_loader().items()}
+            self.__base_loader = None
+        try:
+            with FileLockManager.exclusive(self.__filename):
+                for _ in range(self.MAX_RETRIES):
+                    corrupt = False
+                    try:
+                        disk, stamp = self._read()
+                    except FileNotFoundError:
+                        disk, stamp = {}, None
+                    except json.JSONDecodeError:
+                        print(f"Error: {self.__filename} is corrupted, overwriting with current data.")
+                        disk, stamp, corrupt = {}, self._stamp(), True
+                    merged = self.__merge(data, disk, rekey)
+                    if self.__violations:
+                        for key, field, value in self.__violations:
+                            print(f"Error saving to {self.__filename}: {key}.{field} would become {value}.")
+                        return False
+                    if stamp is not None and not corrupt and merged == disk:
+                        self.__stamp = stamp  # Nothing to write; the file keeps its stamp
+                        break
+                    if self._commit(merged, stamp):
+                        self.__stamp = self._stamp()
+                        break
+                else:
+                    print(f"Error saving to {self.__filename}: too many concurrent writers, giving up.")
+                    return False
+        except OSError as e:
+            print(f"Error saving to {self.__filename}: {e}")
+            return False
+
+        for conflict in self.__conflicts:
+            print(f"Warning: concurrent edit in {self.__filename} ({conflict})")
+        self.__refresh(data, merged)
+        self.__base = {key: _freeze(record) for key, record in merged.items()}
+        return True
+
+    def refresh(self, data: Dict[str, Any]) -> List[str]:
+        """
+        Merges changes other writers have saved into the in-memory records, without writing.
+
+        Unsaved local changes are kept on top of the file's records, which
+        become the new merge base, so they are still saved by the next save().
+        Nothing is read while the file is unchanged.
+
+        :param data: The in-memory records; refreshed in place.
+        :return: Keys of the records that changed, were added or were removed.
+        """
+        if self.__stamp is not None and self.__stamp == self._stamp():
+            return []
+        if self.__base_loader is not None:
+            self.__base = {key: _freeze(record) for key, record in self.__base_loader().items()}
+            self.__base_loader = None
+        try:
+            with FileLockManager.shared(self.__filename):
+                disk, stamp = self._read()
+        except (OSError, json.JSONDecodeError):
+            return []
+        merged = self.__merge(data, disk, None)
+        for key, record in merged.items():
+            # Versions stay those of the new base, as if the local changes were just made
+            version = self.__version_of(disk.get(key, data.get(key)))
+            if self.__version_of(record) != version:
+                merged[key] = self.__stamp_version(record, version)
+        changed = [key for key in {**data, **merged} if data.get(key) != merged.get(key)]
+        self.__refresh(data, merged)
+        self.__base = {key: _freeze(record) for key, record in disk.items()}
+        self.__stamp = stamp
+        return changed
+
+    def _read(self) -> Tuple[Dict[str, Any], Optional[Tuple[int, int, int]]]:
+        """
+        Reads the file together with the stamp identifying that exact version of it.
+
+        :return: Tuple of (records, stamp).
+        :raises FileNotFoundError: If the file does not exist.
+        :raises json.JSONDecodeError: If the file is not valid JSON.
+        """
+        with open(self.__filename, 'r') as f:
+            stat = os.fstat(f.fileno())
+            data = read_object(f)
+        return data, (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+
+    def _stamp(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Returns the current stamp of the file.
+
+        :return: Tuple of (inode, mtime_ns, size), or None if the file is absent.
+        """
+        try:
+            stat = os.stat(self.__filename)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+    def _commit(self, merged: Dict[str, Any], stamp: Optional[Tuple[int, int, int]]) -> bool:
+        """
+        Atomically replaces the file if it still matches the stamp that was read.
+
+        :param merged: The records to write.
+        :param stamp: Stamp of the file the merge was based on.
+        :return: True if written, False if another writer got there first.
+        """
+        tmp_name = f"{self.__filename}.{os.getpid()}.tmp"
+        with open(tmp_name, 'w') as f:
+            json.dump(merged, f, indent=4)
+        if self._stamp() != stamp:
+            os.remove(tmp_name)
+            return False
+        os.replace(tmp_name, self.__filename)
+        return True
+
+    def __merge(self, data: Dict[str, Any], disk: Dict[str, Any],
+                rekey: Optional[Callable[[str, Dict[str, Any], Iterable[str]], str]]) -> Dict[str, Any]:
+        """
+        Three-way merges local records, the on-disk records and the base.
+
+        :param data: Local records.
+        :param disk: Records currently on disk.
+        :param rekey: Optional callback for colliding new records.
+        :return: The merged records to write.
+        """
+        self.__conflicts = []
+        self.__violations = []
+        merged = dict(disk)
+
+        for key in list(data.keys()):
+            mine = data[key]
+            frozen = self.__base.get(key)
+            theirs = disk.get(key, _MISSING)
+
+            if frozen is not None and self.__unchanged(mine, frozen):
+                continue  # Untouched locally: the on-disk copy (or deletion) stands
+            base = _MISSING if frozen is None else json.loads(frozen[1])
+
+            if theirs is _MISSING:
+                merged[key] = self.__stamp_version(mine, self.__version_of(base) + 1)
+                self.__check_nonnegative(key, merged[key], mine, base)
+                continue
+
+            if (base is _MISSING and rekey is not None and isinstance(mine, dict)
+                    and self.__version_of(mine) == 0):
+                # Both writers created a record under the same key
+                new_key = rekey(key, mine, set(merged.keys()) | set(data.keys()))
+                data[new_key] = data.pop(key)
+                merged[new_key] = self.__stamp_version(mine, 1)
+                self.__check_nonnegative(new_key, merged[new_key], mine, base)
+                continue
+
+            # Without a base, the version the local copy carries is what it was based on
+            base_version = self.__version_of(mine if base is _MISSING else base)
+            if self.__version_of(theirs) == base_version:
+                merged[key] = self.__stamp_version(mine, self.__version_of(theirs) + 1)
+            else:
+                merged[key] = self.__stamp_version(
+                    self.__merge_record(key, base, mine, theirs),
+                    self.__version_of(theirs) + 1)
+            self.__check_nonnegative(key, merged[key], mine, base)
+
+        for key, (base_version, _) in self.__base.items():
+            if key in data or key not in disk:
+                continue
+            # Deleted locally: only honour it if nobody changed the record since
+            if self.__version_of(disk[key]) == base_version:
+                del merged[key]
+            else:
+                self.__conflicts.append(SaveConflict(key, None, None, disk[key]))
+
+        return merged
+
+    def __check_nonnegative(self, key: str, record: Any, mine: Any, base: Any) -> None:
+        """
+        Records each nonnegative field this process changed that the merge takes below zero.
+
+        Fields only the other writers changed are not checked, so existing
+        records never block a save.
+
+        :param key: Record key (for reporting).
+        :param record: The merged record.
+        :param mine: The local record.
+        :param base: The record as last loaded, or _MISSING.
+        """
+        if not isinstance(record, dict) or not isinstance(mine, dict):
+            return
+        if not isinstance(base, dict):
+            base = {}
+        for field in self.__nonnegative_fields:
+            value = record.get(field)
+            if (isinstance(value, (int, float)) and not isinstance(value, bool) and value < 0
+                    and mine.get(field, _MISSING) != base.get(field, _MISSING)):
+                self.__violations.append((key, field, value))
+
+    @staticmethod
+    def __unchanged(record: Any, frozen: BaseRecord) -> bool:
+        """
+        Returns whether a record still equals its merge-base copy.
+
+        The texts are compared first; only when they differ (e.g. the same
+        fields in another order, or 10 against 10.0) is the base decoded.
+
+        :param record: The local record.
+        :param frozen: The record's (version, text) in the merge base.
+        :return: True if the record is unchanged.
+        """
+        return json.dumps(record, separators=(',', ':')) == frozen[1] or record == json.loads(frozen[1])
+
+    def __merge_record(self, key: str, base: Any, mine: Any, theirs: Any) -> Any:
+        """
+        Merges one record changed by both this process and another writer.
+
+        :param key: Record key (for conflict reporting).
+        :param base: The record as last loaded, or _MISSING.
+        :param mine: The local record.
+        :param theirs: The on-disk record.
+        :return: The merged record.
+        """
+        if not isinstance(mine, dict) or not isinstance(theirs, dict):
+            self.__conflicts.append(SaveConflict(key, None, mine, theirs))
+            return mine
+        if not isinstance(base, dict):
+            base = {}
+
+        merged = {}
+        for field in dict.fromkeys([*mine, *theirs, *base]):
+            if field == self.VERSION_FIELD:
+                continue
+            m = mine.get(field, _MISSING)
+            b = base.get(field, _MISSING)
+            t = theirs.get(field, _MISSING)
+
+            if m == b:
+                value = t
+            elif (field in self.__delta_fields and all(
+                    isinstance(v, (int, float)) and not isinstance(v, bool) for v in (m, b, t))):
+                # Checked before m == t: two equal deltas both count
+                value = t + (m - b)
+            elif t == b or m == t:
+                value = m
+            elif field in self.__list_fields and all(isinstance(v, list) for v in (m, b, t)):
+                value = t + [item for item in m if item not in b and item not in t]
+            else:
+                self.__conflicts.append(SaveConflict(key, field, m, t))
+                value = m
+
+            if value is not _MISSING:
+                merged[field] = value
+        return merged
+
+    def __refresh(self, data: Dict[str, Any], merged: Dict[str, Any]) -> None:
+        """
+        Updates the caller's records in place to match what was written.
+
+        :param data: The caller's record dictionary.
+        :param merged: The records now on disk.
+        """
+        for key in [k for k in data if k not in merged]:
+            del data[key]
+        for key, record in merged.items():
+            current = data.get(key)
+            if isinstance(current, dict) and isinstance(record, dict):
+                if current != record:
+                    current.clear()
+                    current.update(copy.deepcopy(record))
+            else:
+                data[key] = copy.deepcopy(record)
+
+    def __version_of(self, record: Any) -> int:
+        """
+        Returns a record's version number (0 if unversioned or absent).
+
+        :param record: A record or _MISSING.
+        :return: Version number.
+        """
+        if isinstance(record, dict):
+            return record.get(self.VERSION_FIELD, 0)
+        return 0
+
+    def __stamp_version(self, record: Any, version: int) -> Any:
+        """
+        Returns a copy of the record carrying the given version.
+
+        :param record: The record to stamp.
+        :param version: Version number to set.
+        :return: Stamped copy (non-dict records are returned unchanged).
+        """
+        if not isinstance(record, dict):
+            return record
+        stamped = dict(record)
+        stamped[self.VERSION_FIELD] = version
+        return stamped
+
+
+class DataManager:
+    """
+    Handles data persistence operations for loading and saving application data.
+
+    This class encapsulates file I/O operations with comprehensive error handling
+    to ensure data integrity and provide meaningful error messages. Files listed
+    in STORE_POLICIES hold versioned records and are saved with compare-and-swap
+    so concurrent front-ends sharing the data directory merge their changes.
+    """
+
+    # One versioned store per file, shared by every page in the process
+    _stores: Dict[str, VersionedJSONStore] = {}
+
+    @staticmethod
+    def store_for(filename: str) -> Optional[VersionedJSONStore]:
+        """
+        Returns the versioned store for a file, or None if the file is not versioned.
+
+        :param filename: Path to the JSON file.
+        :return: The shared VersionedJSONStore, or None.
+        """
+        policy = STORE_POLICIES.get(os.path.basename(filename))
+        if policy is None:
+            return None
+        key = os.path.abspath(filename)
+        if key not in DataManager._stores:
+            DataManager._stores[key] = VersionedJSONStore(filename, **policy)
+        return DataManager._stores[key]
+
+    @staticmethod
+    def load_data(filename: str) -> Dict[str, Any]:
+        """
+        Loads data from a JSON file with comprehensive error handling.
+
+        :param filename: Path to the JSON file to load.
+        :return: Dictionary containing the loaded data, or empty dictionary on error.
+        """
+        store = DataManager.store_for(filename)
+        if store is not None:
+            return store.load()
+        try:
+            with FileLockManager.shared(filename), open(filename, 'r') as f:
+                return read_object(f)
+        except FileNotFoundError:
+            print(f"Warning: {filename} not found, starting with empty data.")
+            return {}
+        except json.JSONDecodeError:
+            print(f"Error: {filename} is corrupted, starting with empty data.")
+            return {}
+
+    @staticmethod
+    def save_data(filename: str, data: Dict[str, Any]) -> bool:
+        """
+        Saves data to a JSON file with error handling.
+
+        :param filename: Path to the JSON file where data will be saved.
+        :param data: Dictionary containing the data to save.
+        :return: True if the operation was successful, False otherwise.
+        """
+        store = DataManager.store_for(filename)
+        if store is not None:
+            return store.save(data)
+        try:
+            with FileLockManager.exclusive(filename), open(filename, 'w') as f:
+                json.dump(data, f, indent=4)
+            return True
+        except Exception as e:
+            print(f"Error saving to {filename}: {e}")
+            return False
+
+
+class PromoCodeStore:
+    """
+    PromoCodeStore - Process-wide in-memory copy of the promo code file.
+
+    The codes are read once and then served from memory. save() writes the file
+    and replaces the cached copy, so the next load does not go back to disk.
+    Each load compares the file's stamp with the one that was read, so codes
+    saved by another process are still picked up.
+
+    Author: Applied10_Group6
+    Version: 1.0
+    """
+
+    # One store per file, shared by the customer and administrator pages
+    _stores: Dict[str, 'PromoCodeStore'] = {}
+
+    @classmethod
+    def for_file(cls, filename: str) -> 'PromoCodeStore':
+        """
+        Returns the shared store for a promo code file.
+
+        :param filename: Path to the promo code JSON file.
+        :return: The PromoCodeStore for that file.
+        """
+        key = os.path.abspath(filename)
+        if key not in cls._stores:
+            cls._stores[key] = cls(filename)
+        return cls._stores[key]
+
+    def __init__(self, filename: str):
+        """
+        Constructs an empty store; nothing is read until the first load.
+
+        :param filename: Path to the promo code JSON file.
+        """
+        self.__filename = filename
+        self.__codes: Optional[Dict[str, Any]] = None
+        self.__stamp: Optional[Tuple[int, int, int]] = None
+        self.__reads = 0
+
+    @property
+    def filename(self) -> str:
+        """
+        Returns the path of the promo code file.
+
+        :return: The file path.
+        """
+        return self.__filename
+
+    @property
+    def reads(self) -> int:
+        """
+        Returns how many times the file has actually been read.
+
+        :return: Number of disk reads.
+        """
+        return self.__reads
+
+    def load(self) -> Optional[Dict[str, Any]]:
+        """
+        Returns the promo codes, reading the file only if it changed since the last read.
+
+        :return: A copy of the promo codes, or None if the file does not exist.
+        :raises json.JSONDecodeError: If the file is not valid JSON.
+        """
+        stamp = self.__file_stamp()
+        if stamp is None:
+            self.invalidate()
+            return None
+        if self.__codes is None or stamp != self.__stamp:
+            with FileLockManager.shared(self.__filename), \
+                    open(self.__filename, 'r', encoding='utf-8') as f:
+                stat = os.fstat(f.fileno())
+                self.__codes = json.load(f)
+            self.__stamp = (stat.st_ino, stat.st_mtime_ns, stat.st_size)
+            self.__reads += 1
+        return copy.deepcopy(self.__codes)
+
+    def save(self, promo_codes: Dict[str, Any]) -> None:
+        """
+        Writes the promo codes and keeps them as the cached copy.
+
+        :param promo_codes: Dictionary of promo codes to save.
+        :raises OSError: If the file cannot be written.
+        """
+        with FileLockManager.exclusive(self.__filename), \
+                open(self.__filename, 'w', encoding='utf-8') as f:
+            json.dump(promo_codes, f, indent=4, ensure_ascii=False)
+        self.__codes = copy.deepcopy(promo_codes)
+        self.__stamp = self.__file_stamp()
+
+    def invalidate(self) -> None:
+        """
+        Drops the cached codes so the next load reads the file.
+        """
+        self.__codes = None
+        self.__stamp = None
+
+    def __file_stamp(self) -> Optional[Tuple[int, int, int]]:
+        """
+        Returns the current stamp of the promo code file.
+
+        :return: Tuple of (inode, mtime_ns, size), or None if the file is absent.
+        """
+        try:
+            stat = os.stat(self.__filename)
+        except FileNotFoundError:
+            return None
+        return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+if __name__ == '__main__':
+    # Demonstration: two front-ends editing the same users file
+    import tempfile
+
+    path = os.path.join(tempfile.mkdtemp(), 'users.txt')
+    with open(path, 'w') as f:
+        json.dump({'a@monash.edu': {'balance': 100, 'address': 'Clayton'}}, f)
+
+    first = VersionedJSONStore(path, delta_fields=('balance',))
+    second = VersionedJSONStore(path, delta_fields=('balance',))
+    users_1, users_2 = first.load(), second.load()
+
+    users_1['a@monash.edu']['balance'] += 50       # top-up in terminal 1
+    first.save(users_1)
+    users_2['a@monash.edu']['balance'] -= 30       # purchase in terminal 2
+    users_2['a@monash.edu']['address'] = 'Caulfield'
+    second.save(users_2)
+
+    print(f"Merged record: {users_2['a@monash.edu']}")   # balance 120, version 2
@@ -0,0 +1,225 @@
+"""
+FileLock Module - Cross-process advisory locking for the data directory.
+
+Several store front-ends may run against the same data directory. This module
+coordinates them with fcntl advisory locks: any number of processes may read
+a store under a shared lock, while a writer commits under an exclusive lock.
+Processes keep serving from their in-memory copies while a writer commits;
+locks are only taken around the actual file reads and writes.
+
+Each store is locked through a sidecar '<file>.lock' rather than the data
+file itself, because writers replace the data file atomically (a lock on the
+old inode would not protect the new one). Time spent waiting for locks is
+recorded in a histogram per store and mode.
+
+Author: Applied10_Group6
+Version: 1.0
+"""
+
+import os
+import threading
+import time
+from contextlib import contextmanager
+from typing import Dict, Iterator, List, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Not available on Windows: fall back to in-process locking only
+    fcntl = None
+
+
+class LockWaitHistogram:
+    """
+    LockWaitHistogram - Records how long callers waited to acquire store locks.
+
+    Waits are counted in fixed millisecond buckets per (store, mode) pair.
+
+    Author: Applied10_Group6
+    Version: 1.0
+    """
+
+    BUCKET_BOUNDS_MS: Tuple[float, ...] = (0.1, 1.0, 10.0, 100.0, 1000.0)
+
+    def __init__(self):
+        """
+        Constructs an empty histogram.
+        """
+        self.__counts: Dict[Tuple[str, str], List[int]] = {}
+        self.__total_ms: Dict[Tuple[str, str], float] = {}
+        self.__lock = threading.Lock()
+
+    def record(self, store: str, mode: str, waited_seconds: float) -> None:
+        """
+        Records one lock acquisition.
+
+        :param store: Store name (data file base name).
+        :param mode: 'shared' or 'exclusive'.
+        :param waited_seconds: Time spent waiting for the lock.
+        """
+        waited_ms = waited_seconds * 1000
+        bucket = len(self.BUCKET_BOUNDS_MS)
+        for i, bound in enumerate(self.BUCKET_BOUNDS_MS):
+            if waited_ms <= bound:
+                bucket = i
+                break
+        key = (store, mode)
+        with self.__lock:
+            counts = self.__counts.setdefault(key, [0] * (len(self.BUCKET_BOUNDS_MS) + 1))
+            counts[bucket] += 1
+            self.__total_ms[key] = self.__total_ms.get(key, 0.0) + waited_ms
+
+    def snapshot(self) -> Dict[Tuple[str, str], List[int]]:
+        """
+        Returns a copy of the bucket counts.
+
+        :return: Mapping of (store, mode) to per-bucket counts.
+        """
+        with self.__lock:
+            return {key: list(counts) for key, counts in self.__counts.items()}
+
+    def report(self) -> None:
+        """
+        Prints the lock wait histogram as a table.
+        """
+        labels = [f"<={b:g}ms" for b in self.BUCKET_BOUNDS_MS] + [f">{self.BUCKET_BOUNDS_MS[-1]:g}ms"]
+        print("\n--- Lock Wait Times ---")
+        print(f"{'Store':<18} {'Mode':<10} " + " ".join(f"{label:>9}" for label in labels) + f" {'Avg ms':>8}")
+        for (store, mode), counts in sorted(self.snapshot().items()):
+            avg = self.__total_ms[(store, mode)] / max(1, sum(counts))
+            print(f"{store:<18} {mode:<10} " + " ".join(f"{c:>9}" for c in counts) + f" {avg:>8.3f}")
+
+
+class _HeldLock:
+    """
+    _HeldLock - Book-keeping for a lock file currently held by this process.
+    """
+    __slots__ = ('fd', 'mode', 'depth', 'mutex')
+
+    def __init__(self):
+        """
+        Constructs an unheld lock record.
+        """
+        self.fd = None
+        self.mode = None
+        self.depth = 0
+        self.mutex = threading.RLock()
+
+
+class FileLockManager:
+    """
+    FileLockManager - Shared-read / exclusive-write locks per data store.
+
+    Locks are re-entrant within a thread, so a writer holding a store's
+    exclusive lock may re-read the file. Threads of one process are
+    serialised on the same store by an in-process mutex, since fcntl locks
+    are owned by the process rather than the thread.
+
+    Author: Applied10_Group6
+    Version: 1.0
+    """
+
+    LOCK_SUFFIX = '.lock'
+    histogram = LockWaitHistogram()
+
+    _held: Dict[str, _HeldLock] = {}
+    _registry_lock = threading.Lock()
+
+    @classmethod
+    @contextmanager
+    def shared(cls, filename: str) -> Iterator[None]:
+        """
+        Holds a shared (read) lock on a store for the duration of the block.
+
+        :param filename: Path of the data file to lock.
+        """
+        with cls.__acquire(filename, 'shared'):
+            yield
+
+    @classmethod
+    @contextmanager
+    def exclusive(cls, filename: str) -> Iterator[None]:
+        """
+        Holds an exclusive (write) lock on a store for the duration of the block.
+
+        :param filename: Path of the data file to lock.
+        """
+        with cls.__acquire(filename, 'exclusive'):
+            yield
+
+    @classmethod
+    @contextmanager
+    def __acquire(cls, filename: str, mode: str) -> Iterator[None]:
+        """
+        Acquires the lock file for a store, recording the wait time.
+
+        :param filename: Path of the data file to lock.
+        :param mode: 'shared' or 'exclusive'.
+        """
+        lock_path = os.path.abspath(filename) + cls.LOCK_SUFFIX
+        with cls._registry_lock:
+            held = cls._held.setdefault(lock_path, _HeldLock())
+
+        start = time.perf_counter()
+        held.mutex.acquire()
+        previous_mode = held.mode
+        try:
+            if held.depth == 0:
+                held.fd = os.open(lock_path, os.O_RDWR | os.O_CREAT, 0o644)
+                cls.__flock(held.fd, mode)
+                held.mode = mode
+            elif mode == 'exclusive' and held.mode == 'shared':
+                cls.__flock(held.fd, mode)  # Upgrade a nested read to a write
+                held.mode = mode
+            held.depth += 1
+        except BaseException:
+            if held.depth == 0 and held.fd is not None:
+                os.close(held.fd)
+                held.fd = None
+            held.mutex.release()
+            raise
+        cls.histogram.record(os.path.basename(filename), mode, time.perf_counter() - start)
+
+        try:
+            yield
+        finally:
+            held.depth -= 1
+            if held.depth == 0:
+                os.close(held.fd)  # Closing the descriptor releases the fcntl lock
+                held.fd = None
+                held.mode = None
+            elif held.mode != previous_mode:
+                cls.__flock(held.fd, previous_mode)
+                held.mode = previous_mode
+            held.mutex.release()
+
+    @staticmethod
+    def __flock(fd: int, mode: str) -> None:
+        """
+        Applies an fcntl lock to an open lock file, blocking until granted.
+
+        :param fd: Descriptor of the lock file.
+        :param mode: 'shared' or 'exclusive'.
+        """
+        if fcntl is None:
+            return
+        fcntl.flock(fd, fcntl.LOCK_SH if mode == 'shared' else fcntl.LOCK_EX)
+
+
+if __name__ == '__main__':
+    # Demonstration: a reader waits while another process holds the write lock
+    import multiprocessing
+    import tempfile
+
+    path = os.path.join(tempfile.mkdtemp(), 'products.txt')
+
+    def hold_write_lock(seconds: float) -> None:
+        with FileLockManager.exclusive(path):
+            time.sleep(seconds)
+
+    writer = multiprocessing.Process(target=hold_write_lock, args=(0.2,))
+    writer.start()
+    time.sleep(0.05)
+    with FileLockManager.shared(path):
+        print("Reader acquired the shared lock after the writer committed.")
+    writer.join()
+    FileLockManager.histogram.report()
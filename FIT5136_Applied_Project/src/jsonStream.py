@@ -0,0 +1,207 @@
+"""
+JsonStream Module - Incremental reader for large top-level JSON objects.
+
+Every store file is one JSON object mapping a key to a record. json.load()
+needs the whole document in memory as a string before it builds the result,
+so loading a multi-gigabyte orders file briefly holds both. The reader here
+consumes the file in fixed-size chunks and yields one (key, record) pair at a
+time, keeping only the current chunk and the record being decoded in memory.
+Callers can therefore build whatever representation they want record by
+record.
+
+Only the standard library is used: each record is decoded with
+json.JSONDecoder.raw_decode, so values parse exactly as json.load parses them.
+json.load shares one string object per distinct key across the whole document;
+decoding record by record loses that, so field names are shared through a
+small key table instead, keeping the loaded records as compact as json.load's.
+
+Author: Applied10_Group6
+Version: 1.0
+"""
+
+import json
+import os
+from typing import Any, Dict, Iterator, List, TextIO, Tuple
+
+# Files at least this large are streamed instead of read with json.load
+STREAM_THRESHOLD_BYTES = 64 * 1024 * 1024
+CHUNK_SIZE = 1024 * 1024
+
+# Upper bound on distinct field names shared between records
+MAX_SHARED_KEYS = 65536
+
+_WHITESPACE = ' \t\n\r'
+_DELIMITERS = _WHITESPACE + ',:}]'
+_SHARED_KEYS: Dict[str, str] = {}
+
+
+def _share_keys(pairs: List[Tuple[str, Any]]) -> Dict[str, Any]:
+    """
+    Builds a JSON object whose keys are shared with earlier records.
+
+    :param pairs: The object's (key, value) pairs in document order.
+    :return: The object as a dictionary.
+    """
+    if len(_SHARED_KEYS) >= MAX_SHARED_KEYS:
+        _SHARED_KEYS.clear()
+    return {_SHARED_KEYS.setdefault(key, key): value for key, value in pairs}
+
+
+_DECODER = json.JSONDecoder(object_pairs_hook=_share_keys)
+
+
+class _ChunkReader:
+    """
+    _ChunkReader - A sliding text window over a file, refilled on demand.
+
+    Author: Applied10_Group6
+    Version: 1.0
+    """
+
+    def __init__(self, fp: TextIO, chunk_size: int):
+        """
+        Constructs a reader with an empty window.
+
+        :param fp: Text file positioned at the start of the JSON document.
+        :param chunk_size: Characters read per refill.
+        """
+        self.fp = fp
+        self.chunk_size = chunk_size
+        self.buffer = ''
+        self.pos = 0
+        self.eof = False
+
+    def fill(self, minimum: int = 0) -> bool:
+        """
+        Drops consumed text and reads at least one more chunk.
+
+        :param minimum: Read at least this many more characters, when available.
+        :return: False if the end of the file was already reached.
+        """
+        if self.eof:
+            return False
+        self.buffer = self.buffer[self.pos:]
+        self.pos = 0
+        wanted = max(self.chunk_size, minimum)
+        while wanted > 0:
+            chunk = self.fp.read(wanted)
+            if not chunk:
+                self.eof = True
+                break
+            self.buffer += chunk
+            wanted -= len(chunk)
+        return True
+
+    def skip_whitespace(self) -> None:
+        """
+        Advances past whitespace, refilling the window as needed.
+        """
+        while True:
+            while self.pos < len(self.buffer) and self.buffer[self.pos] in _WHITESPACE:
+                self.pos += 1
+            if self.pos < len(self.buffer) or not self.fill():
+                return
+
+    def expect(self, chars: str) -> str:
+        """
+        Consumes one of the given characters after optional whitespace.
+
+        :param chars: Characters acceptable at this point.
+        :return: The character consumed.
+        :raises json.JSONDecodeError: If another character (or the end of file) is found.
+        """
+        self.skip_whitespace()
+        if self.pos >= len(self.buffer) or self.buffer[self.pos] not in chars:
+            found = self.buffer[self.pos] if self.pos < len(self.buffer) else 'end of file'
+            raise json.JSONDecodeError(f"Expected one of {chars!r}, found {found!r}",
+                                       self.buffer, self.pos)
+        self.pos += 1
+        return self.buffer[self.pos - 1]
+
+    def decode(self) -> Any:
+        """
+        Decodes the next JSON value, reading more of the file until it is complete.
+
+        In valid JSON a value is always followed by whitespace, ',', '}', ']'
+        or ':'. A value followed by anything else, or by the end of the window,
+        may be cut short (e.g. a number split across chunks), so it is only
+        accepted once the file is exhausted. Each retry at least doubles the
+        window, so a large value is decoded in a logarithmic number of attempts.
+
+        :return: The decoded value.
+        :raises json.JSONDecodeError: If the value is malformed.
+        """
+        self.skip_whitespace()
+        while True:
+            try:
+                value, end = _DECODER.raw_decode(self.buffer, self.pos)
+                if self.eof or (end < len(self.buffer) and self.buffer[end] in _DELIMITERS):
+                    self.pos = end
+                    return value
+            except json.JSONDecodeError:
+                if self.eof:
+                    raise
+            self.fill(len(self.buffer) - self.pos)
+
+
+def iter_object_items(fp: TextIO, chunk_size: int = CHUNK_SIZE) -> Iterator[Tuple[str, Any]]:
+    """
+    Yields the members of a top-level JSON object one at a time.
+
+    :param fp: Text file positioned at the start of the document.
+    :param chunk_size: Characters read from the file per refill.
+    :return: Iterator of (key, value) pairs in file order.
+    :raises json.JSONDecodeError: If the document is not a well-formed JSON object.
+    """
+    reader = _ChunkReader(fp, chunk_size)
+    reader.expect('{')
+    reader.skip_whitespace()
+    if reader.buffer[reader.pos:reader.pos + 1] == '}':
+        reader.pos += 1
+    else:
+        while True:
+            key = reader.decode()
+            if not isinstance(key, str):
+                raise json.JSONDecodeError("Object keys must be strings", reader.buffer, reader.pos)
+            reader.expect(':')
+            yield key, reader.decode()
+            if reader.expect(',}') == '}':
+                break
+    reader.skip_whitespace()
+    if reader.pos < len(reader.buffer):
+        raise json.JSONDecodeError("Extra data", reader.buffer, reader.pos)
+
+
+def should_stream(fp: TextIO) -> bool:
+    """
+    Decides whether an open file is large enough to be streamed.
+
+    :param fp: An open file object backed by a real file.
+    :return: True if its size is at least STREAM_THRESHOLD_BYTES.
+    """
+    try:
+        return os.fstat(fp.fileno()).st_size >= STREAM_THRESHOLD_BYTES
+    except (AttributeError, OSError, ValueError):
+        return False
+
+
+def read_object(fp: TextIO) -> Dict[str, Any]:
+    """
+    Reads a top-level JSON object, streaming it if the file is large.
+
+    :param fp: Text file positioned at the start of the document.
+    :return: The decoded object.
+    :raises json.JSONDecodeError: If the document is not valid JSON.
+    """
+    if should_stream(fp):
+        return dict(iter_object_items(fp))
+    return json.load(fp)
+
+
+if __name__ == '__main__':
+    # Demonstration: records are produced one at a time from small chunks
+    import io
+
+    document = json.dumps({str(i): {'order_id': str(i), 'total_price': i * 1.5} for i in range(5)}, indent=4)
+    for key, record in iter_object_items(io.StringIO(document), chunk_size=16):
+        print(key, record)
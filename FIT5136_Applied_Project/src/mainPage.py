@@ -11,13 +11,16 @@ Version: 3.0
 """
 
 from abc import ABC, abstractmethod
-from typing import Dict, Any, Optional
-import json
+from typing import TYPE_CHECKING, Dict, Any, Tuple
+import importlib
 import re
 import os
-from AdminPage import AdminPage
-from UserPage import UserPage
 from InputHandler import InputHandler, BackToMainException, ExitApplicationException
+from dataContext import DataContext
+
+if TYPE_CHECKING:
+    from cart import ShoppingCart
+    from Order import OrderManager
 
 
 # Abstract base class for all pages (Abstraction principle)
@@ -33,6 +36,37 @@ class Page(ABC):
         pass
 
 
+class PageRegistry:
+    """
+    Resolves page classes by role, importing each page module on first use.
+
+    A customer session therefore never loads the administrator page (and an
+    administrator session never loads shopping code).
+    """
+
+    # Role -> (module name, class name)
+    PAGES: Dict[str, Tuple[str, str]] = {
+        'admin': ('AdminPage', 'AdminPage'),
+        'user': ('UserPage', 'UserPage'),
+    }
+
+    _classes: Dict[str, type] = {}
+
+    @classmethod
+    def get(cls, role: str) -> type:
+        """
+        Returns the page class for a role, importing its module if needed.
+
+        :param role: A key of PAGES.
+        :return: The page class.
+        :raises KeyError: If the role is not registered.
+        """
+        if role not in cls._classes:
+            module_name, class_name = cls.PAGES[role]
+            cls._classes[role] = getattr(importlib.import_module(module_name), class_name)
+        return cls._classes[role]
+
+
 class ScreenManager:
     """
     Abstract base class defining the interface for all page components.
@@ -60,50 +94,6 @@ class ScreenManager:
         print(char * length)
 
 
-class DataManager:
-    """
-    Handles data persistence operations for loading and saving application data.
-
-    This class encapsulates file I/O operations with comprehensive error handling
-    to ensure data integrity and provide meaningful error messages.
-    """
-
-    @staticmethod
-    def load_data(filename: str) -> Dict[str, Any]:
-        """
-        Loads data from a JSON file with comprehensive error handling.
-
-        :param filename: Path to the JSON file to load.
-        :return: Dictionary containing the loaded data, or empty dictionary on error.
-        """
-        try:
-            with open(filename, 'r') as f:
-                return json.load(f)
-        except FileNotFoundError:
-            print(f"Warning: {filename} not found, starting with empty data.")
-            return {}
-        except json.JSONDecodeError:
-            print(f"Error: {filename} is corrupted, starting with empty data.")
-            return {}
-
-    @staticmethod
-    def save_data(filename: str, data: Dict[str, Any]) -> bool:
-        """
-        Saves data to a JSON file with error handling.
-
-        :param filename: Path to the JSON file where data will be saved.
-        :param data: Dictionary containing the data to save.
-        :return: True if the operation was successful, False otherwise.
-        """
-        try:
-            with open(filename, 'w') as f:
-                json.dump(data, f, indent=4)
-            return True
-        except Exception as e:
-            print(f"Error saving to {filename}: {e}")
-            return False
-
-
 class InputValidator:
     """
     Provides input validation utilities for user data.
@@ -149,39 +139,37 @@ class MainPage(Page):
     and coordinates the launch of specialized pages for different user types.
     """
 
-    # Class constants for filenames
-    USERS_FILE = 'users.txt'
-    ADMINS_FILE = 'admins.txt'
-    PRODUCTS_FILE = 'products.txt'
-    ORDERS_FILE = 'orders.txt'
-    CARTS_FILE = 'carts.txt'
-
     # Admin credentials as class constants
     ADMIN_EMAIL = 'admin@monash.edu'
     ADMIN_PASSWORD = 'Admin1234!'
 
     def __init__(self):
         """
-        Constructs a MainPage instance and loads all core application data.
+        Constructs a MainPage instance and the data context it shares with every page.
 
-        This initializer loads user, admin, product, order, and cart data
-        from their respective files to initialize the application state.
+        The context loads each store (users, admins, products, orders, carts
+        and promo codes) the first time it is needed, and every page launched
+        from here uses the same in-memory copies.
         """
         # Use private attributes for encapsulation
-        self.__users = DataManager.load_data(self.USERS_FILE)
-        self.__admins = DataManager.load_data(self.ADMINS_FILE)
-        self.__products = DataManager.load_data(self.PRODUCTS_FILE)
-        self.__orders = DataManager.load_data(self.ORDERS_FILE)
-        self.__carts = DataManager.load_data(self.CARTS_FILE)
+        self.__context = DataContext()
 
     # Property decorators for controlled access (Encapsulation)
+    @property
+    def context(self) -> DataContext:
+        """Retrieves the data context shared with every page.
+
+        :return: The application's DataContext.
+        """
+        return self.__context
+
     @property
     def users(self) -> Dict[str, Any]:
         """Retrieves the users dictionary.
 
         :return: Dictionary containing all user data.
         """
-        return self.__users
+        return self.__context.users
 
     @property
     def products(self) -> Dict[str, Any]:
@@ -189,35 +177,32 @@ class MainPage(Page):
 
         :return: Dictionary containing all product data.
         """
-        return self.__products
+        return self.__context.products
 
     @property
-    def orders(self) -> Dict[str, Any]:
-        """Retrieves the orders dictionary.
+    def orders(self) -> 'OrderManager':
+        """Retrieves the order manager.
 
-        :return: Dictionary containing all order data.
+        :return: OrderManager holding all order data.
         """
-        return self.__orders
+        return self.__context.order_manager
 
     @property
-    def carts(self) -> Dict[str, Any]:
-        """Retrieves the carts dictionary.
+    def carts(self) -> 'ShoppingCart':
+        """Retrieves the lazily loaded shopping cart store.
 
-        :return: Dictionary containing all shopping cart data.
+        :return: ShoppingCart holding every user's cart.
         """
-        return self.__carts
+        return self.__context.carts
 
     def save_all_data(self) -> None:
         """Saves all application data to their respective files.
 
-        This method persists user, admin, product, order, and cart data
-        to ensure data consistency across application sessions.
+        This method persists user, admin, product, and cart data to ensure
+        data consistency across application sessions; orders are saved as
+        they are placed. Called at exit, so the startup snapshot is written too.
         """
-        DataManager.save_data(self.USERS_FILE, self.__users)
-        DataManager.save_data(self.ADMINS_FILE, self.__admins)
-        DataManager.save_data(self.PRODUCTS_FILE, self.__products)
-        DataManager.save_data(self.ORDERS_FILE, self.__orders)
-        DataManager.save_data(self.CARTS_FILE, self.__carts)
+        self.__context.save_all(final=True)
 
     def run(self) -> None:
         """
@@ -245,6 +230,7 @@ class MainPage(Page):
                     pass
                 elif choice == '3':
                     print("Exiting system...")
+                    self.save_all_data()
                     break
                 elif choice == '4':
                     print("Running tests...")
@@ -255,6 +241,7 @@ class MainPage(Page):
             except ExitApplicationException as e:
                 # Handle exit request
                 InputHandler.handle_navigation_exception(e)
+                self.save_all_data()
                 break
 
     def __display_main_menu(self) -> None:
@@ -316,8 +303,8 @@ class MainPage(Page):
         :param password: The password to validate.
         :return: True if credentials match a registered user, False otherwise.
         """
-        return (email in self.__users and
-                self.__users[email].get('password') == password)
+        users = self.__context.users
+        return email in users and users[email].get('password') == password
 
     def __launch_admin_page(self, admin_email: str = "admin@monash.edu") -> None:
         """
@@ -327,8 +314,10 @@ class MainPage(Page):
 
         :param admin_email: Email address of the logged-in administrator.
         """
-        page: Page = AdminPage(self.__products, admin_email)
+        page: Page = PageRegistry.get('admin')(self.__context, admin_email)
         page.run()
+        # Save data after the admin session
+        self.__context.save_all()
 
     def __launch_user_page(self, email: str) -> None:
         """
@@ -336,11 +325,12 @@ class MainPage(Page):
 
         :param email: The email address of the user to launch the interface for.
         """
-        page: Page = UserPage(email, self.__users, self.__products)
+        page: Page = PageRegistry.get('user')(email, self.__context)
         page.run()
+        # Session over: the cart is discarded, so its stock holds are released
+        self.__context.reservations.release_user(email)
         # Save data after user session
-        DataManager.save_data(self.USERS_FILE, self.__users)
-        DataManager.save_data(self.PRODUCTS_FILE, self.__products)
+        self.__context.save_all()
 
 
     def handle_register(self) -> None:
@@ -358,7 +348,7 @@ class MainPage(Page):
             input("Press Enter to continue...")
             return
 
-        if email in self.__users:
+        if email in self.__context.users:
             print("\n❌ This email is already registered.")
             print("   Please login or use a different email.")
             input("Press Enter to continue...")
@@ -414,8 +404,8 @@ class MainPage(Page):
         :param email: The email address for the new user account.
         :param user_profile: Dictionary containing the user's profile data.
         """
-        self.__users[email] = user_profile
-        DataManager.save_data(self.USERS_FILE, self.__users)
+        self.__context.users[email] = user_profile
+        self.__context.save_users()
         print("Registration successful! You have been granted an initial $1000 credit.")
 
 
@@ -0,0 +1,319 @@
+"""
+OrderArchive Module - Compressed, time-partitioned storage for cold orders.
+
+Delivered, cancelled and old orders are rarely read again, yet keeping them in
+orders.txt means every OrderManager parses and holds them. The archive keeps
+them instead in gzip segment files, one JSON record per line, each segment
+holding the orders of a single calendar month. An archival run adds its
+orders to the month's newest segment while that holds fewer than
+SEGMENT_RECORDS records, writing the merged segment under a new name, so a
+month ends up in a few large segments rather than one per run. Full segments
+are never rewritten.
+
+A small sparse index (index.json) describes each segment by its month, the
+range of order IDs and creation times it covers and its record count. A lookup
+only decompresses the segments whose ID range can contain the order, and the
+most recently read segments are kept decoded in a small cache.
+
+Author: Applied10_Group6
+Version: 1.0
+"""
+
+import gzip
+import json
+import os
+from collections import OrderedDict
+from typing import Any, Dict, Iterator, List, Optional
+
+from fileLock import FileLockManager
+from snapshot import file_stamp
+
+INDEX_FILE = 'index.json'
+CACHED_SEGMENTS = 2
+SEGMENT_RECORDS = 5000
+
+
+def _numeric_id(order_id: str) -> Optional[int]:
+    """
+    Returns the numeric value of an order ID.
+
+    :param order_id: The order ID.
+    :return: The ID as an integer, or None if it is not numeric.
+    """
+    return int(order_id) if order_id.isdigit() else None
+
+
+class OrderArchive:
+    """
+    OrderArchive - Read and append access to the archived order segments.
+
+    Records are plain order dictionaries (OrderData.to_dict()), so the
+    archive is independent of the order classes.
+
+    Author: Applied10_Group6
+    Version: 1.0
+    """
+
+    def __init__(self, directory: str):
+        """
+        Constructs an archive over a directory; nothing is read until first use.
+
+        :param directory: Directory holding the segments and their index.
+        """
+        self.__directory = directory
+        self.__index_file = os.path.join(directory, INDEX_FILE)
+        self.__segments: List[Dict[str, Any]] = []
+        self.__index_stamp = None
+        self.__index_loaded = False
+        self.__cache: 'OrderedDict[str, Dict[str, Dict[str, Any]]]' = OrderedDict()
+
+    @property
+    def directory(self) -> str:
+        """
+        Returns the archive directory.
+
+        :return: The directory path.
+        """
+        return self.__directory
+
+    @property
+    def segments(self) -> List[Dict[str, Any]]:
+        """
+        Returns the sparse index, oldest segment first.
+
+        :return: List of segment entries (file, period, first_id, last_id,
+                 other_ids, first_created, last_created, count).
+        """
+        return [dict(segment) for segment in self.__index()]
+
+    @property
+    def max_order_id(self) -> int:
+        """
+        Returns the largest numeric order ID held in the archive.
+
+        :return: The largest ID, or 0 if the archive holds none.
+        """
+        return max((segment['last_id'] for segment in self.__index()
+                    if segment['last_id'] is not None), default=0)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of archived records.
+
+        :return: Total record count over all segments.
+        """
+        return sum(segment['count'] for segment in self.__index())
+
+    def get(self, order_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Retrieves an archived order.
+
+        :param order_id: The order's unique identifier.
+        :return: The order record, or None if it is not archived.
+        """
+        numeric = _numeric_id(order_id)
+        # Newest segment first: an order archived twice is read from its latest copy
+        for segment in reversed(self.__index()):
+            if numeric is None:
+                if not segment['other_ids']:
+                    continue
+            elif segment['last_id'] is None or not segment['first_id'] <= numeric <= segment['last_id']:
+                continue
+            record = self.__read_segment(segment['file']).get(order_id)
+            if record is not None:
+                return dict(record)
+        return None
+
+    def iter_records(self, user_email: Optional[str] = None) -> Iterator[Dict[str, Any]]:
+        """
+        Yields archived orders, decompressing one segment at a time.
+
+        :param user_email: Optional filter by user email.
+        :return: Iterator of order records, newest segment first.
+        """
+        seen = set()
+        for segment in reversed(self.__index()):
+            for order_id, record in self.__load_segment(segment['file']).items():
+                if order_id in seen:
+                    continue
+                seen.add(order_id)
+                if user_email is None or record.get('user_email') == user_email:
+                    yield record
+
+    def stream_segment(self, name: str) -> Iterator[Dict[str, Any]]:
+        """
+        Yields a segment's records in stored (ID) order, one line at a time.
+
+        Unlike get(), nothing is cached, so any number of segments can be
+        streamed side by side in constant memory.
+
+        :param name: Segment file name, as in the index.
+        :return: Iterator of order records.
+        """
+        try:
+            with gzip.open(os.path.join(self.__directory, name), 'rt', encoding='utf-8') as f:
+                for line in f:
+                    yield json.loads(line)
+        except (OSError, EOFError, ValueError) as e:
+            print(f"Error reading archive segment {name}: {e}")
+
+    def append(self, records: List[Dict[str, Any]]) -> int:
+        """
+        Writes records to segments, one per calendar month, and indexes them.
+
+        A month's newest segment is merged with the new records while it
+        holds fewer than SEGMENT_RECORDS records. Each segment is fully
+        written before the index refers to it, and a replaced segment is only
+        deleted once the index no longer does, so a failed run leaves the
+        archive unchanged.
+
+        :param records: Order records to archive.
+        :return: Number of segments written.
+        :raises OSError: If a segment or the index cannot be written.
+        """
+        if not records:
+            return 0
+        by_period: Dict[str, List[Dict[str, Any]]] = {}
+        for record in records:
+            by_period.setdefault(str(record.get('created_at', ''))[:7] or 'unknown', []).append(record)
+
+        os.makedirs(self.__directory, exist_ok=True)
+        with FileLockManager.exclusive(self.__index_file):
+            self.__index_loaded = False
+            segments = list(self.__index())
+            sequence = max((int(segment['file'].rsplit('-', 1)[1].split('.')[0]) for segment in segments),
+                           default=0)
+            replaced = []
+            for period, group in sorted(by_period.items()):
+                latest = next((position for position in range(len(segments) - 1, -1, -1)
+                               if segments[position]['period'] == period), None)
+                if latest is not None and segments[latest]['count'] < SEGMENT_RECORDS:
+                    merged = self.__load_segment(segments[latest]['file'])
+                    if len(merged) == segments[latest]['count']:  # Never merge a segment that failed to read
+                        merged.update((record['order_id'], record) for record in group)
+                        group = list(merged.values())
+                        replaced.append(segments.pop(latest)['file'])
+                # Numeric IDs by value, then any others by text
+                group.sort(key=lambda record: (_numeric_id(record['order_id']) is None,
+                                               _numeric_id(record['order_id']) or 0, record['order_id']))
+                sequence += 1
+                name = f"orders-{period}-{sequence:05d}.jsonl.gz"
+                self.__write_segment(name, group)
+                numeric = [n for n in (_numeric_id(record['order_id']) for record in group) if n is not None]
+                created = [record.get('created_at', '') for record in group]
+                segments.append({'file': name, 'period': period,
+                                 'first_id': min(numeric, default=None),
+                                 'last_id': max(numeric, default=None),
+                                 'other_ids': len(group) - len(numeric),
+                                 'first_created': min(created), 'last_created': max(created),
+                                 'count': len(group)})
+            self.__write_index(segments)
+            for name in replaced:
+                self.__cache.pop(name, None)
+                try:
+                    os.remove(os.path.join(self.__directory, name))
+                except OSError as e:
+                    print(f"Warning: could not remove merged archive segment {name}: {e}")
+        return len(by_period)
+
+    def __index(self) -> List[Dict[str, Any]]:
+        """
+        Returns the sparse index, re-reading it if another process has appended since.
+
+        :return: Segment entries, oldest first.
+        """
+        stamp = file_stamp(self.__index_file)
+        if self.__index_loaded and stamp == self.__index_stamp:
+            return self.__segments
+        try:
+            with open(self.__index_file, 'r') as f:
+                segments = json.load(f).get('segments', [])
+        except FileNotFoundError:
+            segments = []
+        except (json.JSONDecodeError, AttributeError):
+            print(f"Error: {self.__index_file} is corrupted, archived orders are unavailable.")
+            segments = []
+        self.__segments, self.__index_stamp, self.__index_loaded = segments, stamp, True
+        return self.__segments
+
+    def __write_index(self, segments: List[Dict[str, Any]]) -> None:
+        """
+        Atomically replaces the index file.
+
+        :param segments: The full list of segment entries.
+        :raises OSError: If the file cannot be written.
+        """
+        tmp_name = f"{self.__index_file}.{os.getpid()}.tmp"
+        with open(tmp_name, 'w') as f:
+            json.dump({'segments': segments}, f, indent=2)
+        os.replace(tmp_name, self.__index_file)
+        self.__segments, self.__index_stamp = segments, file_stamp(self.__index_file)
+
+    def __write_segment(self, name: str, records: List[Dict[str, Any]]) -> None:
+        """
+        Writes one compressed segment file.
+
+        :param name: Segment file name within the archive directory.
+        :param records: Records of the segment, in ID order.
+        :raises OSError: If the file cannot be written.
+        """
+        path = os.path.join(self.__directory, name)
+        tmp_name = f"{path}.{os.getpid()}.tmp"
+        with gzip.open(tmp_name, 'wt', encoding='utf-8') as f:
+            for record in records:
+                f.write(json.dumps(record, separators=(',', ':')) + '\n')
+        os.replace(tmp_name, path)
+
+    def __load_segment(self, name: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Decompresses a segment, using the cache when it holds it.
+
+        :param name: Segment file name.
+        :return: Records of the segment by order ID (empty if unreadable).
+        """
+        if name in self.__cache:
+            return self.__cache[name]
+        records = {}
+        try:
+            with gzip.open(os.path.join(self.__directory, name), 'rt', encoding='utf-8') as f:
+                for line in f:
+                    record = json.loads(line)
+                    records[record['order_id']] = record
+        except (OSError, EOFError, ValueError, KeyError) as e:
+            print(f"Error reading archive segment {name}: {e}")
+        return records
+
+    def __read_segment(self, name: str) -> Dict[str, Dict[str, Any]]:
+        """
+        Returns a segment's records and keeps them among the recently read segments.
+
+        :param name: Segment file name.
+        :return: Records of the segment by order ID.
+        """
+        records = self.__load_segment(name)
+        self.__cache[name] = records
+        self.__cache.move_to_end(name)
+        while len(self.__cache) > CACHED_SEGMENTS:
+            self.__cache.popitem(last=False)
+        return records
+
+
+if __name__ == '__main__':
+    # Demonstration: archive two months of orders and read them back
+    import tempfile
+
+    archive = OrderArchive(tempfile.mkdtemp())
+    archive.append([
+        {'order_id': '1', 'user_email': 'a@monash.edu', 'created_at': '2024-01-05 10:00:00', 'status': 'Delivered'},
+        {'order_id': '2', 'user_email': 'b@monash.edu', 'created_at': '2024-01-20 12:30:00', 'status': 'Cancelled'},
+        {'order_id': '3', 'user_email': 'a@monash.edu', 'created_at': '2024-02-02 09:15:00', 'status': 'Delivered'},
+    ])
+    for entry in archive.segments:
+        print(entry)
+    archive.append([
+        {'order_id': '4', 'user_email': 'b@monash.edu', 'created_at': '2024-02-14 18:45:00', 'status': 'Delivered'},
+    ])
+    print(f"After a second run: {[(entry['file'], entry['count']) for entry in archive.segments]}")
+    print(f"Order 2: {archive.get('2')}")
+    print(f"Orders of a@monash.edu: {[record['order_id'] for record in archive.iter_records('a@monash.edu')]}")
+    print(f"Next order ID: {archive.max_order_id + 1}")
@@ -0,0 +1,141 @@
+"""
+PriceEvents Module - Price-change notifications for carts holding a product.
+
+Carts subscribe to the products they contain. When an administrator changes a
+product's price, member price or promotion, the change is published once and
+only the carts holding that product are repriced; carts are never re-joined
+against the whole catalog.
+
+Subscribers are held weakly, so a cart that is discarded without unsubscribing
+does not stay alive just because it once held a product.
+
+Author: Applied10_Group6
+Version: 1.0
+"""
+
+import threading
+import weakref
+from typing import Any, Dict, Optional
+
+
+class PriceChangeBus:
+    """
+    PriceChangeBus - Routes product price changes to subscribed carts.
+
+    Subscribers are indexed by product ID and must provide an
+    on_price_change(product_id, product) method.
+
+    Author: Applied10_Group6
+    Version: 1.0
+    """
+
+    PRICE_FIELDS = ('price', 'member_price', 'promotion_price')
+
+    def __init__(self):
+        """
+        Constructs a bus with no subscribers.
+        """
+        self.__subscribers: Dict[str, Dict[int, weakref.ref]] = {}
+        self.__lock = threading.RLock()  # Weakref callbacks may fire while it is held
+        self.__published = 0
+        self.__delivered = 0
+
+    @property
+    def stats(self) -> Dict[str, int]:
+        """
+        Returns counters for published events and deliveries to carts.
+
+        :return: Dictionary with 'published' and 'delivered' counts.
+        """
+        return {'published': self.__published, 'delivered': self.__delivered}
+
+    def subscribe(self, product_id: str, subscriber: Any) -> None:
+        """
+        Subscribes an object to price changes of one product.
+
+        :param product_id: The product to watch.
+        :param subscriber: Object with an on_price_change(product_id, product) method.
+        """
+        key = id(subscriber)
+        ref = weakref.ref(subscriber, lambda _, pid=product_id, k=key: self.__discard(pid, k))
+        with self.__lock:
+            self.__subscribers.setdefault(product_id, {})[key] = ref
+
+    def unsubscribe(self, product_id: str, subscriber: Any) -> None:
+        """
+        Stops delivering a product's price changes to a subscriber.
+
+        :param product_id: The product no longer watched.
+        :param subscriber: The subscribed object.
+        """
+        self.__discard(product_id, id(subscriber))
+
+    def subscriber_count(self, product_id: str) -> int:
+        """
+        Returns how many live subscribers watch a product.
+
+        :param product_id: The product to inspect.
+        :return: Number of subscribers.
+        """
+        with self.__lock:
+            return len(self.__subscribers.get(product_id, {}))
+
+    def publish(self, product_id: str, product: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Notifies every subscriber holding a product that its prices changed.
+
+        :param product_id: The product whose prices changed.
+        :param product: The product's current dictionary, if the caller has it.
+        :return: Number of subscribers notified.
+        """
+        with self.__lock:
+            refs = list(self.__subscribers.get(product_id, {}).values())
+            self.__published += 1
+        delivered = 0
+        for ref in refs:
+            subscriber = ref()
+            if subscriber is not None:
+                subscriber.on_price_change(product_id, product)
+                delivered += 1
+        with self.__lock:
+            self.__delivered += delivered
+        return delivered
+
+    def __discard(self, product_id: str, key: int) -> None:
+        """
+        Removes one subscription, dropping the product entry once empty.
+
+        :param product_id: The watched product.
+        :param key: The subscriber's identity key.
+        """
+        with self.__lock:
+            subscribers = self.__subscribers.get(product_id)
+            if subscribers is None:
+                return
+            subscribers.pop(key, None)
+            if not subscribers:
+                del self.__subscribers[product_id]
+
+
+# Process-wide bus used by admin price edits and shopping carts
+PRICE_CHANGES = PriceChangeBus()
+
+
+if __name__ == '__main__':
+    # Demonstration: only the subscribed cart is repriced
+    class DemoCart:
+        def __init__(self, name: str):
+            self.name = name
+
+        def on_price_change(self, product_id: str, product: Optional[Dict[str, Any]]) -> None:
+            print(f"{self.name}: repricing product {product_id} at ${product['price']:.2f}")
+
+    bus = PriceChangeBus()
+    alice, bob = DemoCart('alice'), DemoCart('bob')
+    bus.subscribe('1', alice)
+    bus.subscribe('2', bob)
+
+    milk = {'id': '1', 'name': 'Milk', 'price': 2.50}
+    print(f"Notified {bus.publish('1', milk)} cart(s)")
+    del alice
+    print(f"Subscribers left for product 1: {bus.subscriber_count('1')}")
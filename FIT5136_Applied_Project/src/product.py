@@ -10,6 +10,7 @@ Version: 1.0
 import json
 from abc import ABC, abstractmethod
 from typing import Dict, Any, Optional, Union
+from fileLock import FileLockManager
 
 
 class ProductValidator:
@@ -555,7 +556,7 @@ class ProductFactory:
         :return: Dict of product_id -> Product (may be empty on error).
         """
         try:
-            with open(filename, 'r') as f:
+            with FileLockManager.shared(filename), open(filename, 'r') as f:
                 data = json.load(f)
 
             products = {}
@@ -587,7 +588,7 @@ class ProductFactory:
         """
         try:
             products_dict = {pid: prod.to_dict() for pid, prod in products.items()}
-            with open(filename, 'w') as f:
+            with FileLockManager.exclusive(filename), open(filename, 'w') as f:
                 json.dump(products_dict, f, indent=4)
             return True
         except Exception as e:
@@ -0,0 +1,332 @@
+"""
+ProductBulk Module - Streaming bulk import and export of products.
+
+A supplier feed of hundreds of thousands of products cannot be entered one at
+a time through AdminPage. ProductBulkIO reads a CSV or NDJSON feed row by row,
+validates the rows in batches on a pool of worker processes with the same
+rules as the add-product form (ProductValidator and
+ProductManager.validate_product_data), and upserts the valid products into
+the catalog batch by batch, in file order. Rejected rows are written to an
+error report instead of stopping the import.
+
+Only the batches in flight are held in memory. The catalog is not saved and
+its indexes are not rebuilt here: the caller saves once after the import,
+which refreshes them once. Price changes to existing products are published
+once per product at the end.
+
+Author: Applied10_Group6
+Version: 1.0
+"""
+
+import csv
+import io
+import json
+import os
+import time
+from collections import deque
+from concurrent.futures import Future, ProcessPoolExecutor
+from contextlib import redirect_stdout
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple, Union
+
+from AdminPage import ProductManager
+from priceEvents import PriceChangeBus, PRICE_CHANGES
+from product import ProductValidator
+
+# Columns of a product feed; the first eight are required in every row
+IMPORT_FIELDS = ('id', 'name', 'brand', 'description', 'category', 'price', 'member_price', 'quantity',
+                 'subcategory', 'expiration_date', 'ingredients', 'storage_instructions', 'allergens')
+FOOD_FIELDS = ('expiration_date', 'ingredients', 'storage_instructions', 'allergens')
+BATCH_SIZE = 2000
+
+# A row as read from the feed: its line number and either a CSV dict or an NDJSON line
+RawRow = Tuple[int, Union[Dict[str, Any], str]]
+# A validated row: line number, product ID, product (None if rejected) and error message
+CheckedRow = Tuple[int, str, Optional[Dict[str, Any]], Optional[str]]
+
+
+def _feed_format(path: str, fmt: Optional[str]) -> str:
+    """
+    Determines the feed format from an explicit choice or the file extension.
+
+    :param path: The file path.
+    :param fmt: 'csv', 'ndjson' or None to decide by extension.
+    :return: 'csv' or 'ndjson'.
+    :raises ValueError: If fmt is not recognised.
+    """
+    if fmt is None:
+        return 'ndjson' if os.path.splitext(path)[1].lower() in ('.ndjson', '.jsonl') else 'csv'
+    if fmt not in ('csv', 'ndjson'):
+        raise ValueError(f"Unknown product feed format: {fmt}")
+    return fmt
+
+
+def _to_number(value: Any, integer: bool) -> Union[int, float]:
+    """
+    Converts a feed value to a number.
+
+    :param value: The value (a CSV string or a JSON number).
+    :param integer: True for a whole number.
+    :return: The number.
+    :raises ValueError: If the value is not a number (or not whole when integer).
+    """
+    if isinstance(value, bool):
+        raise ValueError(value)
+    number = float(value)
+    if not integer:
+        return number
+    if not number.is_integer():
+        raise ValueError(value)
+    return int(number)
+
+
+def _check_row(line: int, raw: Union[Dict[str, Any], str]) -> CheckedRow:
+    """
+    Validates one feed row with the add-product rules and builds its product record.
+
+    :param line: Line number of the row in the feed.
+    :param raw: The CSV row dictionary, or the NDJSON line text.
+    :return: The checked row.
+    """
+    if isinstance(raw, str):
+        try:
+            raw = json.loads(raw)
+        except json.JSONDecodeError as e:
+            return line, '', None, f"Invalid JSON: {e.msg}"
+        if not isinstance(raw, dict):
+            return line, '', None, "Invalid JSON: expected an object"
+
+    fields = {key: value.strip() if isinstance(value, str) else value
+              for key, value in raw.items() if key in IMPORT_FIELDS and value not in (None, '')}
+    product_id = str(fields.get('id', ''))
+    try:
+        ProductValidator.validate_required_string(product_id, "Product ID")
+        ProductValidator.validate_required_string(fields.get('category'), "Category")
+    except ValueError as e:
+        return line, product_id, None, str(e)
+    try:
+        price = _to_number(fields.get('price'), integer=False)
+        member_price = _to_number(fields.get('member_price', price), integer=False)
+        quantity = _to_number(fields.get('quantity', 0), integer=True)
+    except (TypeError, ValueError):
+        return line, product_id, None, "Price and Quantity must be numbers"
+
+    messages = io.StringIO()
+    with redirect_stdout(messages):  # validate_product_data reports problems by printing them
+        valid = ProductManager.validate_product_data(fields.get('name', ''), fields.get('brand', ''),
+                                                     price, member_price, quantity)
+    if not valid:
+        return line, product_id, None, messages.getvalue().strip().replace('Error: ', '', 1)
+
+    product = {
+        'id': product_id,
+        'name': fields['name'],
+        'brand': fields['brand'],
+        'description': str(fields.get('description', '')),
+        'price': price,
+        'member_price': member_price,
+        'quantity': quantity,
+        'category': fields['category']
+    }
+    if 'subcategory' in fields:
+        product['subcategory'] = fields['subcategory']
+    if product['category'].lower() == 'food':
+        product.update({field: str(fields[field]) for field in FOOD_FIELDS if field in fields})
+    return line, product_id, product, None
+
+
+def _check_batch(rows: List[RawRow]) -> List[CheckedRow]:
+    """
+    Validates a batch of feed rows; runs in a worker process.
+
+    :param rows: Raw rows.
+    :return: Checked rows, in the same order.
+    """
+    return [_check_row(line, raw) for line, raw in rows]
+
+
+class ProductBulkIO:
+    """
+    ProductBulkIO - Streams product feeds into and out of the catalog.
+
+    Author: Applied10_Group6
+    Version: 1.0
+    """
+
+    @staticmethod
+    def iter_rows(path: str, fmt: Optional[str] = None) -> Iterator[RawRow]:
+        """
+        Reads a product feed one row at a time.
+
+        CSV rows are parsed here, since quoting makes CSV inherently
+        sequential. NDJSON lines are passed on as text and parsed by the
+        workers.
+
+        :param path: The feed file.
+        :param fmt: 'csv', 'ndjson' or None to decide by extension.
+        :return: Iterator of (line number, row).
+        :raises OSError: If the file cannot be read.
+        """
+        with open(path, 'r', newline='', encoding='utf-8') as f:
+            if _feed_format(path, fmt) == 'csv':
+                reader = csv.DictReader(f)
+                for row in reader:
+                    yield reader.line_num, row
+            else:
+                for line, text in enumerate(f, 1):
+                    if text.strip():
+                        yield line, text
+
+    @staticmethod
+    def import_products(path: str, products: Dict[str, Any], fmt: Optional[str] = None,
+                        errors_path: Optional[str] = None, workers: Optional[int] = None,
+                        batch_size: int = BATCH_SIZE) -> Dict[str, Any]:
+        """
+        Validates a feed in worker processes and upserts its valid products.
+
+        Batches are applied in file order, so when a product appears twice
+        the later row wins. An existing product keeps any field the feed does
+        not carry (e.g. its promotion or food details). A row that would lower
+        a product's price to or below its current promotion price is rejected.
+
+        :param path: The feed file.
+        :param products: The catalog, updated in place.
+        :param fmt: 'csv', 'ndjson' or None to decide by extension.
+        :param errors_path: Error report path (default: '<path>.errors.csv'), written only if rows fail.
+        :param workers: Worker processes (default: CPU count; 0 validates in this process).
+        :param batch_size: Rows per batch.
+        :return: Dictionary with 'rows', 'created', 'updated', 'rejected', 'errors_path',
+                 'seconds' and 'rows_per_second'.
+        :raises OSError: If the feed cannot be read or the error report cannot be written.
+        """
+        errors_path = errors_path or f"{path}.errors.csv"
+        report = {'rows': 0, 'created': 0, 'updated': 0, 'rejected': 0, 'errors_path': None}
+        repriced: Dict[str, None] = {}
+        error_file = None
+        error_writer = None
+        started = time.perf_counter()
+
+        def reject(line: int, product_id: str, error: str) -> None:
+            nonlocal error_file, error_writer
+            if error_writer is None:
+                error_file = open(errors_path, 'w', newline='', encoding='utf-8')
+                error_writer = csv.writer(error_file)
+                error_writer.writerow(('line', 'product_id', 'error'))
+            error_writer.writerow((line, product_id, error))
+            report['rejected'] += 1
+
+        def apply(checked: List[CheckedRow]) -> None:
+            for line, product_id, product, error in checked:
+                report['rows'] += 1
+                if product is None:
+                    reject(line, product_id, error)
+                    continue
+                existing = products.get(product_id)
+                if existing is None:
+                    if product['category'].lower() == 'food':
+                        for field in FOOD_FIELDS:
+                            product.setdefault(field, '')
+                    products[product_id] = product
+                    report['created'] += 1
+                else:
+                    promotion = existing.get('promotion_price')
+                    if promotion is not None and promotion >= product['price']:
+                        reject(line, product_id, f"Promotion price ${promotion:.2f} would not be below "
+                                                 f"price ${product['price']:.2f}")
+                        continue
+                    if any(existing.get(field) != product.get(field) for field in PriceChangeBus.PRICE_FIELDS
+                           if field in product):
+                        repriced[product_id] = None
+                    existing.update(product)
+                    report['updated'] += 1
+
+        try:
+            batches = ProductBulkIO.__batches(ProductBulkIO.iter_rows(path, fmt), batch_size)
+            if workers == 0:
+                for batch in batches:
+                    apply(_check_batch(batch))
+            else:
+                workers = workers or os.cpu_count() or 1
+                in_flight: Deque[Future] = deque()
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    for batch in batches:
+                        in_flight.append(pool.submit(_check_batch, batch))
+                        if len(in_flight) >= workers * 2:  # Bound the rows held in memory
+                            apply(in_flight.popleft().result())
+                    while in_flight:
+                        apply(in_flight.popleft().result())
+        finally:
+            if error_file is not None:
+                error_file.close()
+                report['errors_path'] = errors_path
+
+        for product_id in repriced:
+            PRICE_CHANGES.publish(product_id, products[product_id])
+        report['seconds'] = time.perf_counter() - started
+        report['rows_per_second'] = report['rows'] / report['seconds'] if report['seconds'] > 0 else 0.0
+        return report
+
+    @staticmethod
+    def export_products(path: str, products: Dict[str, Any], fmt: Optional[str] = None) -> Dict[str, Any]:
+        """
+        Writes the catalog to a CSV or NDJSON feed that import_products can read back.
+
+        CSV carries the IMPORT_FIELDS columns; NDJSON carries every field.
+
+        :param path: Output file path.
+        :param products: The catalog.
+        :param fmt: 'csv', 'ndjson' or None to decide by extension.
+        :return: Dictionary with 'rows', 'seconds' and 'rows_per_second'.
+        :raises OSError: If the file cannot be written.
+        """
+        started = time.perf_counter()
+        rows = 0
+        with open(path, 'w', newline='', encoding='utf-8') as f:
+            if _feed_format(path, fmt) == 'csv':
+                writer = csv.DictWriter(f, fieldnames=IMPORT_FIELDS, extrasaction='ignore')
+                writer.writeheader()
+                for product_id, product in products.items():
+                    writer.writerow(dict(product, id=product.get('id', product_id)))
+                    rows += 1
+            else:
+                for product_id, product in products.items():
+                    f.write(json.dumps(dict(product, id=product.get('id', product_id))) + '\n')
+                    rows += 1
+        seconds = time.perf_counter() - started
+        return {'rows': rows, 'seconds': seconds, 'rows_per_second': rows / seconds if seconds > 0 else 0.0}
+
+    @staticmethod
+    def __batches(rows: Iterator[RawRow], size: int) -> Iterator[List[RawRow]]:
+        """
+        Groups rows into lists of at most size rows.
+
+        :param rows: Row iterator.
+        :param size: Maximum rows per batch.
+        :return: Iterator of batches.
+        """
+        batch: List[RawRow] = []
+        for row in rows:
+            batch.append(row)
+            if len(batch) >= size:
+                yield batch
+                batch = []
+        if batch:
+            yield batch
+
+
+if __name__ == '__main__':
+    # Demonstration: import a small feed with one bad row, then export it again
+    import tempfile
+
+    folder = tempfile.mkdtemp()
+    feed = os.path.join(folder, 'feed.csv')
+    with open(feed, 'w', newline='') as f:
+        f.write("id,name,brand,description,category,price,member_price,quantity\n"
+                "100,Milk,Dairy Co,Full cream,Food,3.5,3.0,20\n"
+                "101,Pen,Inky,Blue,Stationery,1.0,2.0,50\n"
+                "102,Notebook,Inky,A5,Stationery,4.0,3.5,abc\n")
+    catalog: Dict[str, Any] = {}
+    result = ProductBulkIO.import_products(feed, catalog, workers=0)
+    print(f"Import: {result}")
+    with open(result['errors_path']) as f:
+        print(f.read())
+    print(f"Export: {ProductBulkIO.export_products(os.path.join(folder, 'catalog.ndjson'), catalog)}")
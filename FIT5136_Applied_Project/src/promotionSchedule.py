@@ -0,0 +1,410 @@
+"""
+PromotionSchedule Module - Promotions with start and end times.
+
+A product's promotion_price is either set or not, so an administrator had to
+start and stop every sale by hand at the right moment. A scheduled promotion
+instead carries a validity window, and PromotionScheduler switches it on and
+off when the window opens and closes.
+
+Upcoming starts and ends are kept as events in a min-heap ordered by time.
+advance() only looks at the top of the heap, so checking for due events is
+O(1) and each event that falls due costs O(log n). The scheduler keeps the
+lowest active scheduled price per product in a dictionary, so resolving the
+price of a product is a single lookup, however many promotions exist.
+
+When a promotion starts or ends, the change is published on the price-change
+bus, so carts holding the product are repriced.
+
+Price lookups never touch the disk. Changes other processes make to the
+schedule file are picked up by advance(), which the pages call before
+listing products, showing the cart and checking out.
+
+Author: Applied10_Group6
+Version: 1.0
+"""
+
+import heapq
+import itertools
+import json
+import os
+import threading
+import time
+from datetime import datetime
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from fileLock import FileLockManager
+from priceEvents import PriceChangeBus, PRICE_CHANGES
+from snapshot import file_stamp
+
+SCHEDULE_FILE = 'scheduled_promotions.json'
+SCHEDULE_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+START = 'start'
+END = 'end'
+
+
+def _to_seconds(moment: str) -> float:
+    """
+    Converts a stored local date and time to seconds since the epoch.
+
+    :param moment: Time in SCHEDULE_FORMAT.
+    :return: Seconds since the epoch.
+    """
+    return datetime.strptime(moment, SCHEDULE_FORMAT).timestamp()
+
+
+class PromotionScheduler:
+    """
+    PromotionScheduler - Activates and expires scheduled promotions on time.
+
+    Promotions are stored by ID as {'product_id', 'promotion_price', 'start',
+    'end'}. Each promotion has at most one queued event, whose sequence
+    number is recorded; a cancelled promotion leaves its event in the heap
+    and the event is skipped when it comes due. Expired promotions are
+    removed from the file, including those that ended while no process was
+    running, which are dropped when the file is read.
+
+    Every change re-reads the file, applies the change and writes it within
+    one exclusive lock, so two administrators scheduling at once never pick
+    the same ID or overwrite each other's promotions.
+
+    Author: Applied10_Group6
+    Version: 1.0
+    """
+
+    def __init__(self, filename: str = SCHEDULE_FILE,
+                 price_bus: Optional[PriceChangeBus] = PRICE_CHANGES,
+                 clock: Callable[[], float] = time.time):
+        """
+        Constructs a scheduler; the schedule file is not read until first use.
+
+        :param filename: Path to the scheduled promotions JSON file.
+        :param price_bus: Bus notified when a product's active price changes (None to opt out).
+        :param clock: Function returning the current time in seconds since the epoch.
+        """
+        self.__filename = filename
+        self.__price_bus = price_bus
+        self.__clock = clock
+        self.__lock = threading.RLock()
+        self.__promotions: Dict[str, Dict[str, Any]] = {}
+        self.__stamp = None
+        self.__loaded = False
+        self.__unsaved = False  # Expired promotions were dropped on load but are still in the file
+        self.__events: List[Tuple[float, int, str, str]] = []  # (time, sequence, kind, promotion ID)
+        self.__sequence = itertools.count()
+        self.__pending: Dict[str, int] = {}  # promotion ID -> sequence of its queued event
+        self.__active: Dict[str, Dict[str, float]] = {}  # product ID -> {promotion ID: price}
+        self.__best: Dict[str, float] = {}  # product ID -> lowest active scheduled price
+
+    @property
+    def filename(self) -> str:
+        """
+        Returns the path of the schedule file.
+
+        :return: The file path.
+        """
+        return self.__filename
+
+    def schedule(self, product_id: str, promotion_price: float,
+                 start: datetime, end: datetime) -> str:
+        """
+        Schedules a promotion for a product and saves the schedule.
+
+        :param product_id: The product on promotion.
+        :param promotion_price: Price charged while the promotion is active.
+        :param start: When the promotion starts.
+        :param end: When the promotion ends.
+        :return: The new promotion's ID.
+        :raises ValueError: If the price is negative or the window is empty or already over.
+        """
+        if promotion_price < 0:
+            raise ValueError("Promotion price cannot be negative")
+        if end <= start:
+            raise ValueError("The promotion must end after it starts")
+        if end.timestamp() <= self.__clock():
+            raise ValueError("The promotion would already have ended")
+
+        with self.__lock, FileLockManager.exclusive(self.__filename):
+            self.__ensure_loaded(refresh=True)
+            promotion_id = str(max((int(pid) for pid in self.__promotions if pid.isdigit()), default=0) + 1)
+            promotion = {'product_id': str(product_id), 'promotion_price': round(float(promotion_price), 2),
+                         'start': start.strftime(SCHEDULE_FORMAT), 'end': end.strftime(SCHEDULE_FORMAT)}
+            self.__promotions[promotion_id] = promotion
+            self.__save()
+            changed = self.__enqueue(promotion_id, promotion, self.__clock())
+        self.__publish([promotion['product_id']] if changed else [])
+        return promotion_id
+
+    def cancel(self, promotion_id: str) -> bool:
+        """
+        Cancels a scheduled promotion, ending it at once if it is active.
+
+        :param promotion_id: The promotion's ID.
+        :return: True if the promotion existed.
+        """
+        with self.__lock, FileLockManager.exclusive(self.__filename):
+            self.__ensure_loaded(refresh=True)
+            promotion = self.__promotions.pop(promotion_id, None)
+            if promotion is None:
+                return False
+            self.__pending.pop(promotion_id, None)
+            self.__save()
+            changed = self.__deactivate(promotion_id, promotion['product_id'])
+        self.__publish([promotion['product_id']] if changed else [])
+        return True
+
+    def advance(self, now: Optional[float] = None) -> int:
+        """
+        Applies every start and end event that has come due, after reloading
+        the schedule if another process has changed it.
+
+        Each product whose active price changes is published as soon as its
+        event is applied, so a cart is never repriced against events that
+        have not been applied yet. The exclusive lock is only taken when an
+        event is due or expired promotions must be removed from the file.
+
+        :param now: Current time in seconds since the epoch (default: the clock).
+        :return: Number of events applied.
+        """
+        now = self.__clock() if now is None else now
+        with self.__lock:
+            self.__ensure_loaded(now, refresh=True)
+            if not self.__unsaved and not (self.__events and self.__events[0][0] <= now):
+                return 0
+            with FileLockManager.exclusive(self.__filename):
+                return self.__apply_due(now)
+
+    def __apply_due(self, now: float) -> int:
+        """
+        Applies the events due by now and saves the schedule if any promotion
+        was removed; the caller holds the file's exclusive lock.
+
+        :param now: Current time in seconds since the epoch.
+        :return: Number of events applied.
+        """
+        applied = 0
+        self.__ensure_loaded(now, refresh=True)
+        expired = self.__unsaved
+        while self.__events and self.__events[0][0] <= now:
+            _, sequence, kind, promotion_id = heapq.heappop(self.__events)
+            if self.__pending.get(promotion_id) != sequence:  # Cancelled after it was queued
+                continue
+            del self.__pending[promotion_id]
+            promotion = self.__promotions[promotion_id]
+            product_id = promotion['product_id']
+            applied += 1
+            if kind == START:
+                changed = self.__activate(promotion_id, promotion)
+                self.__push(_to_seconds(promotion['end']), END, promotion_id)
+            else:
+                changed = self.__deactivate(promotion_id, product_id)
+                del self.__promotions[promotion_id]
+                expired = True
+            if changed:
+                self.__publish([product_id])
+        if expired:
+            self.__save()
+        return applied
+
+    def promotion_price(self, product: Dict[str, Any]) -> Optional[float]:
+        """
+        Returns the promotion price in force for a product.
+
+        A manually set promotion_price and the active scheduled promotions
+        are combined by taking the lowest.
+
+        :param product: The product dictionary (with its 'id').
+        :return: The promotion price, or None if no promotion is active.
+        """
+        with self.__lock:
+            self.__ensure_loaded()
+            scheduled = self.__best.get(str(product.get('id')))
+        manual = product.get('promotion_price')
+        if manual is None:
+            return scheduled
+        return manual if scheduled is None else min(manual, scheduled)
+
+    def resolve_price(self, product: Dict[str, Any], is_vip: bool) -> float:
+        """
+        Returns the unit price a customer pays for a product.
+
+        :param product: The product dictionary.
+        :param is_vip: Whether member prices apply.
+        :return: The member (for VIPs) or regular price, or the promotion price if lower.
+        """
+        base = product.get('member_price', product['price']) if is_vip else product['price']
+        promotion = self.promotion_price(product)
+        return base if promotion is None else min(base, promotion)
+
+    def list_promotions(self) -> List[Dict[str, Any]]:
+        """
+        Returns the scheduled promotions that have not yet ended, by start time.
+
+        :return: List of promotions, each with its 'id' and whether it is 'active'.
+        """
+        with self.__lock:
+            self.__ensure_loaded(refresh=True)
+            now = self.__clock()
+            promotions = [dict(promotion, id=promotion_id,
+                               active=promotion_id in self.__active.get(promotion['product_id'], {}))
+                          for promotion_id, promotion in self.__promotions.items()
+                          if _to_seconds(promotion['end']) > now]
+        return sorted(promotions, key=lambda promotion: (promotion['start'], promotion['id']))
+
+    def __ensure_loaded(self, now: Optional[float] = None, refresh: bool = False) -> None:
+        """
+        Reads the schedule file on first use, or again on refresh if another
+        process changed it.
+
+        The heap and active prices are rebuilt from the file's promotions.
+        Promotions that have already ended are dropped, and the file is
+        saved without them by the next advance() or change.
+        The new best prices then replace the old ones one product at a time,
+        each followed by its price-change event.
+
+        :param now: Current time in seconds since the epoch (default: the clock).
+        :param refresh: Check the file for changes even if it has been read.
+        """
+        if self.__loaded and not refresh:
+            return
+        stamp = file_stamp(self.__filename)
+        if self.__loaded and stamp == self.__stamp:
+            return
+        promotions: Dict[str, Dict[str, Any]] = {}
+        if stamp is not None:
+            try:
+                with FileLockManager.shared(self.__filename), open(self.__filename, 'r') as f:
+                    promotions = json.load(f)
+            except (OSError, json.JSONDecodeError) as e:
+                print(f"Error: {self.__filename} could not be read, no promotions are scheduled: {e}")
+        now = self.__clock() if now is None else now
+        expired = [promotion_id for promotion_id, promotion in promotions.items()
+                   if _to_seconds(promotion['end']) <= now]
+        for promotion_id in expired:
+            del promotions[promotion_id]
+        previous = self.__best
+        self.__promotions, self.__stamp, self.__loaded = promotions, stamp, True
+        self.__unsaved = bool(expired)
+        self.__events, self.__pending, self.__active, self.__best = [], {}, {}, {}
+        for promotion_id, promotion in promotions.items():
+            self.__enqueue(promotion_id, promotion, now)
+
+        best, self.__best = self.__best, dict(previous)
+        for product_id in set(previous) | set(best):
+            if previous.get(product_id) == best.get(product_id):
+                continue
+            if product_id in best:
+                self.__best[product_id] = best[product_id]
+            else:
+                del self.__best[product_id]
+            self.__publish([product_id])
+
+    def __enqueue(self, promotion_id: str, promotion: Dict[str, Any], now: float) -> bool:
+        """
+        Queues a promotion's next event, activating it if its window is open.
+
+        :param promotion_id: The promotion's ID.
+        :param promotion: The promotion record.
+        :param now: Current time in seconds since the epoch.
+        :return: True if the product's active price changed.
+        """
+        start, end = _to_seconds(promotion['start']), _to_seconds(promotion['end'])
+        if end <= now:
+            return False  # Already over; dropped from the schedule when read
+        if start > now:
+            self.__push(start, START, promotion_id)
+            return False
+        self.__push(end, END, promotion_id)
+        return self.__activate(promotion_id, promotion)
+
+    def __push(self, when: float, kind: str, promotion_id: str) -> None:
+        """
+        Queues a promotion's next event, superseding any event queued before.
+
+        :param when: Event time in seconds since the epoch.
+        :param kind: START or END.
+        :param promotion_id: The promotion's ID.
+        """
+        sequence = next(self.__sequence)
+        self.__pending[promotion_id] = sequence
+        heapq.heappush(self.__events, (when, sequence, kind, promotion_id))
+
+    def __activate(self, promotion_id: str, promotion: Dict[str, Any]) -> bool:
+        """
+        Marks a promotion active and updates its product's best price.
+
+        :param promotion_id: The promotion's ID.
+        :param promotion: The promotion record.
+        :return: True if the product's active price changed.
+        """
+        product_id = promotion['product_id']
+        self.__active.setdefault(product_id, {})[promotion_id] = promotion['promotion_price']
+        best = self.__best.get(product_id)
+        if best is None or promotion['promotion_price'] < best:
+            self.__best[product_id] = promotion['promotion_price']
+            return True
+        return False
+
+    def __deactivate(self, promotion_id: str, product_id: str) -> bool:
+        """
+        Marks a promotion inactive and recomputes its product's best price.
+
+        Only the product's own active promotions are examined.
+
+        :param promotion_id: The promotion's ID.
+        :param product_id: The product the promotion applies to.
+        :return: True if the product's active price changed.
+        """
+        active = self.__active.get(product_id, {})
+        if active.pop(promotion_id, None) is None:
+            return False
+        previous = self.__best.pop(product_id)
+        if active:
+            self.__best[product_id] = min(active.values())
+        else:
+            del self.__active[product_id]
+        return self.__best.get(product_id) != previous
+
+    def __save(self) -> None:
+        """
+        Writes the schedule file atomically; the caller holds its exclusive lock.
+        """
+        tmp_name = f"{self.__filename}.{os.getpid()}.tmp"
+        try:
+            with open(tmp_name, 'w') as f:
+                json.dump(self.__promotions, f, indent=4)
+            os.replace(tmp_name, self.__filename)
+            self.__stamp = file_stamp(self.__filename)
+            self.__unsaved = False
+        except OSError as e:
+            print(f"Error saving to {self.__filename}: {e}")
+
+    def __publish(self, product_ids: List[str]) -> None:
+        """
+        Notifies carts holding the given products that their price changed.
+
+        :param product_ids: Products whose active price changed.
+        """
+        if self.__price_bus is not None:
+            for product_id in product_ids:
+                self.__price_bus.publish(product_id)
+
+
+# Process-wide scheduler used by the shopping and administrator pages
+PROMOTIONS = PromotionScheduler()
+
+
+if __name__ == '__main__':
+    # Demonstration: a weekend promotion, with the clock moved by hand
+    import tempfile
+
+    now = [datetime(2024, 3, 1, 12, 0).timestamp()]
+    scheduler = PromotionScheduler(os.path.join(tempfile.mkdtemp(), SCHEDULE_FILE),
+                                   price_bus=None, clock=lambda: now[0])
+    milk = {'id': '1', 'name': 'Milk', 'price': 3.50, 'member_price': 3.20}
+    scheduler.schedule('1', 2.99, datetime(2024, 3, 2), datetime(2024, 3, 4))
+    for moment in (datetime(2024, 3, 1, 23, 59), datetime(2024, 3, 2), datetime(2024, 3, 4)):
+        now[0] = moment.timestamp()
+        events = scheduler.advance()
+        print(f"{moment}: {events} event(s), regular ${scheduler.resolve_price(milk, False):.2f}, "
+              f"member ${scheduler.resolve_price(milk, True):.2f}")
@@ -0,0 +1,310 @@
+"""
+RestockAdvisor Module - Restock suggestions forecast from recent sales.
+
+The low-stock report only shows products once their stock is already low.
+RestockAdvisor looks ahead instead: from each product's recent rate of sale
+it projects how many days of stock are left, and suggests reordering any
+product that would sell out before a new delivery could arrive.
+
+The rate of sale is an exponentially weighted moving average kept by
+SalesVelocity. Each order adds its units to the product's rate, and the rate
+decays with a half-life of HALF_LIFE_DAYS, so recent weeks count most. While
+a product's sales history is still short compared with the decay time, the
+rate is scaled up by the share of the window its history covers, so a new
+product is not under-forecast. The history is taken as at least one
+half-life long, so the rate is never more than doubled, and products first
+sold less than MIN_HISTORY_DAYS ago are not forecast at all: one early order
+says little about a daily rate.
+
+The average is updated as each order is placed (and reduced if it is
+cancelled) in time proportional to the order's line items. A refresh of the
+suggestions therefore takes one pass over the products, however long the
+order history.
+
+Like the sales counters, the rates are saved in a sidecar file next to the
+orders file. Each process adds only its own unsaved changes to the file,
+under the file's exclusive lock.
+
+Author: Applied10_Group6
+Version: 1.0
+"""
+
+import json
+import math
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, Iterable, List, Optional
+
+from fileLock import FileLockManager
+
+HALF_LIFE_DAYS = 14
+LEAD_TIME_DAYS = 7
+SAFETY_DAYS = 3
+COVER_DAYS = 14
+MIN_HISTORY_DAYS = 3
+
+SECONDS_PER_DAY = 86400
+CREATED_AT_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+# Per product: [rate in units per day, as of this day, day of the first sale] (days since the epoch)
+Rates = Dict[str, List[float]]
+
+
+def _merge(rates: Rates, product_id: str, rate: float, day: float, first_day: float,
+           decay_days: float) -> None:
+    """
+    Adds a rate contribution observed on a given day to a product's rate.
+
+    The moving average is a sum of decaying contributions, so two rates are
+    added by decaying the earlier one to the later day.
+
+    :param rates: Rates updated in place.
+    :param product_id: The product.
+    :param rate: Contribution in units per day (negative to remove one).
+    :param day: Day of the contribution, in days since the epoch.
+    :param first_day: Day of the first sale the contribution covers.
+    :param decay_days: Decay time constant in days.
+    """
+    current = rates.get(product_id)
+    if current is None:
+        rates[product_id] = [rate, day, first_day]
+        return
+    if day >= current[1]:
+        current[0] = current[0] * math.exp((current[1] - day) / decay_days) + rate
+        current[1] = day
+    else:
+        current[0] += rate * math.exp((day - current[1]) / decay_days)
+    current[2] = min(current[2], first_day)
+
+
+class SalesVelocity:
+    """
+    SalesVelocity - Exponentially weighted units sold per day, per product.
+
+    Author: Applied10_Group6
+    Version: 1.0
+    """
+
+    def __init__(self, filename: str, half_life_days: float = HALF_LIFE_DAYS):
+        """
+        Constructs the tracker and loads the persisted rates.
+
+        :param filename: Path of the sidecar file.
+        :param half_life_days: Days after which a sale counts half as much.
+        """
+        self.__filename = filename
+        self.__decay_days = half_life_days / math.log(2)
+        self.__rates = self.__read()
+        self.__pending: Rates = {}
+
+    @property
+    def filename(self) -> str:
+        """
+        Returns the path of the sidecar file.
+
+        :return: The file path.
+        """
+        return self.__filename
+
+    @property
+    def exists(self) -> bool:
+        """
+        Returns whether the sidecar file has been written.
+
+        :return: True if the file exists.
+        """
+        return os.path.exists(self.__filename)
+
+    def record(self, order: Dict[str, Any], sign: int = 1) -> None:
+        """
+        Adds an order's units to its products' rates, or removes them.
+
+        :param order: The order as a dictionary (OrderData.to_dict()).
+        :param sign: 1 when the order is placed, -1 when it is cancelled.
+        """
+        try:
+            day = datetime.strptime(str(order.get('created_at', '')), CREATED_AT_FORMAT).timestamp()
+        except ValueError:
+            day = time.time()
+        day /= SECONDS_PER_DAY
+        for item in order.get('product_list', []):
+            # One unit adds 1/decay_days per day, so a steady rate r averages to r
+            contribution = sign * item.get('quantity', 0) / self.__decay_days
+            product_id = str(item.get('product_id'))
+            for rates in (self.__rates, self.__pending):
+                _merge(rates, product_id, contribution, day, day, self.__decay_days)
+
+    def rebuild(self, orders: Iterable[Dict[str, Any]]) -> int:
+        """
+        Recomputes every rate from the orders and overwrites the sidecar file.
+
+        Cancelled orders are skipped.
+
+        :param orders: Every order, as dictionaries.
+        :return: Number of orders counted.
+        """
+        self.__rates, self.__pending = {}, {}
+        counted = 0
+        for order in orders:
+            if order.get('status') != 'Cancelled':
+                self.record(order)
+                counted += 1
+        self.__pending = {}
+        try:
+            with FileLockManager.exclusive(self.__filename):
+                self.__write(self.__rates)
+        except OSError as e:
+            print(f"Error saving sales velocity: {e}")
+        return counted
+
+    def flush(self) -> bool:
+        """
+        Adds this process's unsaved changes to the sidecar file.
+
+        :return: True if written (or nothing was pending), False if the write failed.
+        """
+        if not self.__pending:
+            return True
+        try:
+            with FileLockManager.exclusive(self.__filename):
+                rates = self.__read()
+                for product_id, (rate, day, first_day) in self.__pending.items():
+                    _merge(rates, product_id, rate, day, first_day, self.__decay_days)
+                self.__write(rates)
+        except OSError as e:
+            print(f"Error saving sales velocity: {e}")
+            return False
+        self.__rates, self.__pending = rates, {}
+        return True
+
+    def rates(self, now: Optional[float] = None, min_history_days: float = 0) -> Dict[str, float]:
+        """
+        Returns every product's current rate of sale.
+
+        A product sold for less than one half-life is treated as sold for one.
+
+        :param now: Reference time in seconds since the epoch (default: the current time).
+        :param min_history_days: Leave out products first sold more recently than this.
+        :return: Dictionary mapping product IDs to units sold per day.
+        """
+        today = (time.time() if now is None else now) / SECONDS_PER_DAY
+        half_life = self.__decay_days * math.log(2)
+        rates = {}
+        for product_id, (rate, day, first_day) in self.__rates.items():
+            history = today - first_day
+            if history < min_history_days:
+                continue
+            covered = 1 - math.exp(-max(history, half_life) / self.__decay_days)
+            rates[product_id] = max(rate * math.exp((day - today) / self.__decay_days) / covered, 0.0)
+        return rates
+
+    def __read(self) -> Rates:
+        """
+        Reads the sidecar file.
+
+        :return: Rates by product, empty if the file is missing or corrupt.
+        """
+        try:
+            with open(self.__filename, 'r') as f:
+                data = json.load(f)
+            if isinstance(data, dict) and isinstance(data.get('products'), dict):
+                return data['products']
+            print(f"Error: {self.__filename} is corrupted, sales velocity restarts from zero.")
+        except FileNotFoundError:
+            pass
+        except json.JSONDecodeError:
+            print(f"Error: {self.__filename} is corrupted, sales velocity restarts from zero.")
+        return {}
+
+    def __write(self, rates: Rates) -> None:
+        """
+        Atomically replaces the sidecar file.
+
+        :param rates: Rates by product.
+        :raises OSError: If the file cannot be written.
+        """
+        tmp_name = f"{self.__filename}.{os.getpid()}.tmp"
+        with open(tmp_name, 'w') as f:
+            json.dump({'products': rates}, f)
+        os.replace(tmp_name, self.__filename)
+
+
+class RestockAdvisor:
+    """
+    RestockAdvisor - Ranks products by how soon they will sell out.
+
+    A product needs restocking once its stock is at or below its reorder
+    point: the units expected to sell during the delivery lead time plus a
+    few days of safety stock. The suggested order brings the stock up to
+    enough for the lead time, the safety days and a further COVER_DAYS.
+
+    Author: Applied10_Group6
+    Version: 1.0
+    """
+
+    def __init__(self, velocity: SalesVelocity, lead_time_days: float = LEAD_TIME_DAYS,
+                 safety_days: float = SAFETY_DAYS, cover_days: float = COVER_DAYS):
+        """
+        Constructs an advisor over a sales velocity tracker.
+
+        :param velocity: The products' rates of sale.
+        :param lead_time_days: Days between placing a restock order and receiving it.
+        :param safety_days: Extra days of sales kept in reserve.
+        :param cover_days: Days of sales a restock should last beyond the lead time.
+        """
+        self.__velocity = velocity
+        self.__lead_time_days = lead_time_days
+        self.__safety_days = safety_days
+        self.__cover_days = cover_days
+
+    def suggestions(self, products: Dict[str, Any], now: Optional[float] = None,
+                    include_all: bool = False) -> List[Dict[str, Any]]:
+        """
+        Forecasts stock-outs and lists the products to restock, most urgent first.
+
+        Products that have not sold recently, or were first sold less than
+        MIN_HISTORY_DAYS ago, have no forecast and are left out.
+
+        :param products: Dictionary mapping product IDs to product records.
+        :param now: Reference time in seconds since the epoch (default: the current time).
+        :param include_all: List every selling product, not only those at their reorder point.
+        :return: List of dictionaries with 'product_id', 'name', 'quantity', 'daily_rate',
+                 'days_left', 'reorder_point' and 'order_quantity'.
+        """
+        rates = self.__velocity.rates(now, MIN_HISTORY_DAYS)
+        horizon = self.__lead_time_days + self.__safety_days
+        ranked = []
+        for product_id, product in products.items():
+            rate = rates.get(product_id, 0.0)
+            if rate < 0.01:  # Less than one unit every hundred days
+                continue
+            stock = max(product.get('quantity', 0), 0)
+            reorder_point = math.ceil(rate * horizon)
+            if stock > reorder_point and not include_all:
+                continue
+            ranked.append({'product_id': product_id, 'name': product.get('name', product_id),
+                           'quantity': stock, 'daily_rate': round(rate, 2),
+                           'days_left': round(stock / rate, 1), 'reorder_point': reorder_point,
+                           'order_quantity': max(math.ceil(rate * (horizon + self.__cover_days)) - stock, 0)})
+        ranked.sort(key=lambda entry: (entry['days_left'], -entry['daily_rate']))
+        return ranked
+
+
+if __name__ == '__main__':
+    # Demonstration: four weeks of steady milk sales and one recent bread order
+    import tempfile
+
+    velocity = SalesVelocity(os.path.join(tempfile.mkdtemp(), 'orders_velocity.json'))
+    now = time.time()
+    for days_ago in range(28):
+        created = datetime.fromtimestamp(now - days_ago * SECONDS_PER_DAY).strftime(CREATED_AT_FORMAT)
+        velocity.record({'created_at': created, 'product_list': [{'product_id': '1', 'quantity': 5}]})
+    velocity.record({'created_at': datetime.fromtimestamp(now).strftime(CREATED_AT_FORMAT),
+                     'product_list': [{'product_id': '2', 'quantity': 3}]})
+    velocity.flush()
+
+    catalog = {'1': {'name': 'Milk', 'quantity': 40}, '2': {'name': 'Bread', 'quantity': 30}}
+    print(f"Rates (units/day): {velocity.rates(now)}")
+    for entry in RestockAdvisor(velocity).suggestions(catalog, now, include_all=True):
+        print(entry)
@@ -0,0 +1,262 @@
+"""
+SalesAggregates Module - Running sales counters maintained as orders change.
+
+Answering "units sold per product" or "revenue per category" from the orders
+themselves means replaying every order's product_list, including archived
+ones. SalesAggregates instead keeps counters that are updated as each order
+is placed or cancelled, in time proportional to the order's line items.
+
+Counters are kept per product and per category, both as all-time totals and
+in daily buckets covering the last RETENTION_DAYS days, so reports over any
+recent window only add up a few buckets. Each bucket also counts orders.
+
+The counters are persisted in a sidecar file next to the orders file. Each
+process only writes the changes it made since its last flush, added to the
+file's current contents under the file's exclusive lock, so concurrent
+processes never lose each other's counts.
+
+Author: Applied10_Group6
+Version: 1.0
+"""
+
+import json
+import os
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from fileLock import FileLockManager
+
+RETENTION_DAYS = 400
+UNKNOWN_CATEGORY = 'Unknown'
+
+Bucket = Dict[str, Any]
+
+
+def _empty_bucket() -> Bucket:
+    """
+    Creates a bucket with no sales.
+
+    :return: Dictionary with 'orders', 'products' and 'categories' counters.
+    """
+    return {'orders': 0, 'products': {}, 'categories': {}}
+
+
+def _add_bucket(target: Bucket, delta: Bucket, sign: int = 1) -> None:
+    """
+    Adds (or subtracts) one bucket's counters to another.
+
+    :param target: Bucket updated in place.
+    :param delta: Bucket whose counters are added.
+    :param sign: 1 to add, -1 to subtract.
+    """
+    target['orders'] += sign * delta['orders']
+    for group in ('products', 'categories'):
+        counters = target[group]
+        for key, (units, revenue) in delta[group].items():
+            current = counters.setdefault(key, [0, 0.0])
+            current[0] += sign * units
+            current[1] = round(current[1] + sign * revenue, 2)
+
+
+class SalesAggregates:
+    """
+    SalesAggregates - Per-product and per-category sales counters in daily buckets.
+
+    Author: Applied10_Group6
+    Version: 1.0
+    """
+
+    def __init__(self, filename: str,
+                 category_of: Optional[Callable[[str], Optional[str]]] = None):
+        """
+        Constructs the aggregates and loads the persisted counters.
+
+        :param filename: Path of the sidecar file.
+        :param category_of: Callable returning a product's category (default: all 'Unknown').
+        """
+        self.__filename = filename
+        self.__category_of = category_of or (lambda product_id: None)
+        self.__data = self.__read()
+        self.__pending = {'total': _empty_bucket(), 'days': {}}
+
+    @property
+    def filename(self) -> str:
+        """
+        Returns the path of the sidecar file.
+
+        :return: The file path.
+        """
+        return self.__filename
+
+    @property
+    def exists(self) -> bool:
+        """
+        Returns whether the sidecar file has been written.
+
+        :return: True if the file exists.
+        """
+        return os.path.exists(self.__filename)
+
+    def record(self, order: Dict[str, Any], sign: int = 1) -> None:
+        """
+        Adds an order's line items to the counters, or removes them.
+
+        :param order: The order as a dictionary (OrderData.to_dict()).
+        :param sign: 1 when the order is placed, -1 when it is cancelled.
+        """
+        delta = _empty_bucket()
+        delta['orders'] = 1
+        for item in order.get('product_list', []):
+            product_id = str(item.get('product_id'))
+            units = item.get('quantity', 0)
+            revenue = item.get('subtotal', units * item.get('unit_price', 0.0))
+            category = self.__category_of(product_id) or UNKNOWN_CATEGORY
+            for group, key in (('products', product_id), ('categories', category)):
+                counters = delta[group].setdefault(key, [0, 0.0])
+                counters[0] += units
+                counters[1] += revenue
+
+        day = str(order.get('created_at', ''))[:10]
+        for view in (self.__data, self.__pending):
+            _add_bucket(view['total'], delta, sign)
+            if day and day >= self.__oldest_day():
+                _add_bucket(view['days'].setdefault(day, _empty_bucket()), delta, sign)
+
+    def rebuild(self, orders: Iterable[Dict[str, Any]]) -> int:
+        """
+        Recomputes every counter from the orders and overwrites the sidecar file.
+
+        Cancelled orders are skipped.
+
+        :param orders: Every order, as dictionaries.
+        :return: Number of orders counted.
+        """
+        self.__data = {'total': _empty_bucket(), 'days': {}}
+        self.__pending = {'total': _empty_bucket(), 'days': {}}
+        counted = 0
+        for order in orders:
+            if order.get('status') != 'Cancelled':
+                self.record(order)
+                counted += 1
+        self.__pending = {'total': _empty_bucket(), 'days': {}}
+        try:
+            with FileLockManager.exclusive(self.__filename):
+                self.__write(self.__data)
+        except OSError as e:
+            print(f"Error saving sales aggregates: {e}")
+        return counted
+
+    def flush(self) -> bool:
+        """
+        Adds this process's unsaved changes to the sidecar file.
+
+        :return: True if written (or nothing was pending), False if the write failed.
+        """
+        if not self.__pending['total']['orders'] and not self.__pending['days']:
+            return True
+        try:
+            with FileLockManager.exclusive(self.__filename):
+                data = self.__read()
+                _add_bucket(data['total'], self.__pending['total'])
+                for day, bucket in self.__pending['days'].items():
+                    _add_bucket(data['days'].setdefault(day, _empty_bucket()), bucket)
+                oldest = self.__oldest_day()
+                data['days'] = {day: bucket for day, bucket in data['days'].items() if day >= oldest}
+                self.__write(data)
+        except OSError as e:
+            print(f"Error saving sales aggregates: {e}")
+            return False
+        self.__data = data
+        self.__pending = {'total': _empty_bucket(), 'days': {}}
+        return True
+
+    def summary(self, days: Optional[int] = None, now: Optional[datetime] = None) -> Bucket:
+        """
+        Returns the counters over a window of recent days.
+
+        :param days: Number of days up to and including today, or None for all time.
+        :param now: Reference time (default: the current time).
+        :return: Bucket with 'orders', 'products' and 'categories' ({key: [units, revenue]}).
+        """
+        window = _empty_bucket()
+        if days is None:
+            _add_bucket(window, self.__data['total'])
+            return window
+        first = ((now or datetime.now()) - timedelta(days=days - 1)).strftime('%Y-%m-%d')
+        for day, bucket in self.__data['days'].items():
+            if day >= first:
+                _add_bucket(window, bucket)
+        return window
+
+    def top_products(self, limit: int = 10, days: Optional[int] = None,
+                     by: str = 'units') -> List[Tuple[str, int, float]]:
+        """
+        Returns the best-selling products over a window.
+
+        :param limit: Maximum number of products.
+        :param days: Number of recent days, or None for all time.
+        :param by: 'units' or 'revenue'.
+        :return: List of (product_id, units, revenue), best first.
+        """
+        column = 1 if by == 'revenue' else 0
+        ranked = sorted(self.summary(days)['products'].items(),
+                        key=lambda entry: entry[1][column], reverse=True)
+        return [(product_id, units, revenue) for product_id, (units, revenue) in ranked[:limit]
+                if units > 0]
+
+    def __oldest_day(self) -> str:
+        """
+        Returns the first day still kept in daily buckets.
+
+        :return: Date string 'YYYY-MM-DD'.
+        """
+        return (datetime.now() - timedelta(days=RETENTION_DAYS)).strftime('%Y-%m-%d')
+
+    def __read(self) -> Dict[str, Any]:
+        """
+        Reads the sidecar file.
+
+        :return: Dictionary with 'total' and 'days', empty if the file is missing or corrupt.
+        """
+        try:
+            with open(self.__filename, 'r') as f:
+                data = json.load(f)
+            if isinstance(data, dict) and 'total' in data and 'days' in data:
+                return data
+            print(f"Error: {self.__filename} is corrupted, sales counters restart from zero.")
+        except FileNotFoundError:
+            pass
+        except json.JSONDecodeError:
+            print(f"Error: {self.__filename} is corrupted, sales counters restart from zero.")
+        return {'total': _empty_bucket(), 'days': {}}
+
+    def __write(self, data: Dict[str, Any]) -> None:
+        """
+        Atomically replaces the sidecar file.
+
+        :param data: Dictionary with 'total' and 'days'.
+        :raises OSError: If the file cannot be written.
+        """
+        tmp_name = f"{self.__filename}.{os.getpid()}.tmp"
+        with open(tmp_name, 'w') as f:
+            json.dump(data, f)
+        os.replace(tmp_name, self.__filename)
+
+
+if __name__ == '__main__':
+    # Demonstration: counters follow orders being placed and cancelled
+    import tempfile
+
+    categories = {'1': 'Dairy', '2': 'Bakery'}
+    sales = SalesAggregates(os.path.join(tempfile.mkdtemp(), 'orders_sales.json'), categories.get)
+    today = datetime.now().strftime('%Y-%m-%d %H:%M:%S')
+    order = {'created_at': today, 'product_list': [
+        {'product_id': '1', 'name': 'Milk', 'quantity': 2, 'unit_price': 2.5, 'subtotal': 5.0},
+        {'product_id': '2', 'name': 'Bread', 'quantity': 1, 'unit_price': 4.0, 'subtotal': 4.0}]}
+    sales.record(order)
+    sales.record(dict(order, product_list=order['product_list'][:1]))
+    sales.flush()
+    print(f"This week: {sales.summary(days=7)}")
+    print(f"Top sellers: {sales.top_products(days=7)}")
+    sales.record(order, sign=-1)
+    print(f"After cancelling the first order: {sales.summary()['categories']}")
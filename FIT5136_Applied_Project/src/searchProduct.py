@@ -10,7 +10,8 @@ Version: 1.0
 """
 
 from abc import ABC, abstractmethod
-from typing import List, Dict, Any
+from typing import List, Dict, Any, Optional
+from stockReservation import StockReservationLedger
 
 
 class SearchStrategy(ABC):
@@ -126,14 +127,17 @@ class SearchProduct:
     It demonstrates encapsulation, composition, and polymorphism in action.
 
     """
-    def __init__(self, products: Dict[str, Any]):
+    def __init__(self, products: Dict[str, Any],
+                 reservations: Optional[StockReservationLedger] = None):
         """
         Constructs a SearchProduct instance with product data.
 
         :param products: Dictionary mapping product IDs to product information.
+        :param reservations: Optional ledger of cart holds; results then show available stock.
         """
         self.__products = products  # Private attribute (encapsulation)
         self.__search_strategy: SearchStrategy = None  # Composition
+        self.__reservations = reservations
 
     @property
     def products(self) -> Dict[str, Any]:
@@ -237,8 +241,9 @@ class SearchProduct:
         print("\n--- Search Results ---")
         for p in results:
             member_price = p.get('member_price', p['price'])
+            quantity = self.__reservations.available(p) if self.__reservations else p['quantity']
             print(f"ID: {p['id']} | Name: {p['name']} | Brand: {p['brand']} | "
-                  f"Category: {p['category']} | Price: ${p['price']} | Member Price: ${member_price} | Quantity: {p['quantity']}")
+                  f"Category: {p['category']} | Price: ${p['price']} | Member Price: ${member_price} | Quantity: {quantity}")
         print("-" * 20)
 
 
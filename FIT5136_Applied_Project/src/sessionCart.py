@@ -0,0 +1,373 @@
+"""
+SessionCart Module - In-session shopping cart with incrementally maintained totals.
+
+The shopping session keeps its cart as an ordered mapping of product ID to
+{'product': product_dict, 'quantity': n}. SessionCart keeps that shape, so
+existing code can still iterate it, but also maintains regular, member and
+promotion totals, the item count and per-line subtotals as lines are added,
+changed or removed. Reading a total is O(1) instead of a pass over the cart.
+The regular and member totals are what a customer pays: where a promotion
+(set by hand or scheduled) is active and lower, it replaces the price.
+
+Amounts are accumulated in integer cents so that repeated add/remove cycles
+never drift through floating-point rounding.
+
+Lines reference the catalog's product dictionaries rather than copies, and the
+cart subscribes to price-change events for the products it holds, so an admin
+price edit reprices only the lines (and carts) that contain that product.
+
+Author: Applied10_Group6
+Version: 1.0
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, Optional, Tuple
+from priceEvents import PriceChangeBus, PRICE_CHANGES
+from promotionSchedule import PROMOTIONS
+
+
+class SessionCart(OrderedDict):
+    """
+    SessionCart - Ordered cart mapping that keeps running totals.
+
+    Quantities must be changed through add() or set_quantity() (or by
+    assigning a whole line) so the totals stay in step; editing a line's
+    'quantity' in place bypasses them. With debug enabled, every change is
+    followed by a full recompute that raises if the running totals drifted.
+
+    Author: Applied10_Group6
+    Version: 1.0
+    """
+
+    def __init__(self, items: Optional[Iterable] = None, debug: bool = False,
+                 price_bus: Optional[PriceChangeBus] = PRICE_CHANGES):
+        """
+        Constructs a SessionCart, optionally from existing cart lines.
+
+        :param items: Mapping or iterable of (product_id, line) pairs to start with.
+        :param debug: Verify the running totals after every change.
+        :param price_bus: Bus delivering price changes for held products (None to opt out).
+        """
+        self.__regular_cents = 0
+        self.__member_cents = 0
+        self.__promotion_cents = 0
+        self.__item_count = 0
+        self.__line_cents: Dict[str, Tuple[int, int, int, int]] = {}
+        self.__debug = False
+        self.__price_bus = price_bus
+        super().__init__()
+        if items is not None:
+            self.update(items)
+        self.__debug = debug
+        self.__check()
+
+    @staticmethod
+    def _to_cents(amount: float) -> int:
+        """
+        Converts a dollar amount to whole cents.
+
+        :param amount: Amount in dollars.
+        :return: Amount in cents.
+        """
+        return int(round(amount * 100))
+
+    @staticmethod
+    def _line_cents(line: Dict[str, Any]) -> Tuple[int, int, int, int]:
+        """
+        Computes a line's regular, member and promotion subtotals in cents.
+
+        The active promotion price is looked up once and caps both the
+        regular and the member price.
+
+        :param line: Cart line with 'product' and 'quantity'.
+        :return: Tuple of (regular, member, promotion) subtotals and the quantity.
+        """
+        product = line['product']
+        quantity = line['quantity']
+        regular = SessionCart._to_cents(product['price'])
+        member = SessionCart._to_cents(product.get('member_price', product['price']))
+        active = PROMOTIONS.promotion_price(product)
+        promotion = regular if active is None else SessionCart._to_cents(active)
+        return (min(regular, promotion) * quantity, min(member, promotion) * quantity,
+                promotion * quantity, quantity)
+
+    def __add_line(self, product_id: str, line: Dict[str, Any]):
+        """
+        Adds a line's contribution to the totals and records it.
+
+        :param product_id: The line's product ID.
+        :param line: The cart line.
+        """
+        cents = self._line_cents(line)
+        if product_id not in self.__line_cents and self.__price_bus is not None:
+            self.__price_bus.subscribe(product_id, self)
+        self.__line_cents[product_id] = cents
+        self.__shift(cents, 1)
+
+    def __remove_line(self, product_id: str):
+        """
+        Subtracts a line's recorded contribution from the totals.
+
+        The recorded values are used rather than the line itself, so a line
+        whose quantity was edited in place is still removed correctly.
+
+        :param product_id: The line's product ID.
+        """
+        self.__shift(self.__line_cents.pop(product_id), -1)
+
+    def __shift(self, cents: Tuple[int, int, int, int], sign: int):
+        """
+        Applies a line contribution to the running totals.
+
+        :param cents: (regular, member, promotion, quantity) of the line.
+        :param sign: +1 to add, -1 to subtract.
+        """
+        self.__regular_cents += sign * cents[0]
+        self.__member_cents += sign * cents[1]
+        self.__promotion_cents += sign * cents[2]
+        self.__item_count += sign * cents[3]
+
+    def __check(self):
+        """
+        In debug mode, verifies the running totals against a full recompute.
+
+        :raises RuntimeError: If the running totals no longer match the lines.
+        """
+        if self.__debug and not self.verify():
+            raise RuntimeError("SessionCart running totals drifted from cart contents")
+
+    def __setitem__(self, product_id: str, line: Dict[str, Any]):
+        """
+        Sets a whole cart line, replacing any existing line for the product.
+
+        :param product_id: The product ID.
+        :param line: Cart line with 'product' and 'quantity'.
+        :raises ValueError: If the line is missing its product or quantity.
+        """
+        if 'product' not in line or 'quantity' not in line:
+            raise ValueError("Cart line must have 'product' and 'quantity'")
+        if product_id in self:
+            self.__remove_line(product_id)
+        super().__setitem__(product_id, line)
+        self.__add_line(product_id, line)
+        self.__check()
+
+    def __delitem__(self, product_id: str):
+        """
+        Removes a cart line.
+
+        :param product_id: The product ID to remove.
+        """
+        super().__delitem__(product_id)
+        self.__remove_line(product_id)
+        if self.__price_bus is not None:
+            self.__price_bus.unsubscribe(product_id, self)
+        self.__check()
+
+    def pop(self, product_id: str, *default):
+        """
+        Removes and returns a cart line.
+
+        :param product_id: The product ID to remove.
+        :param default: Optional value returned if the product is not in the cart.
+        :return: The removed line, or default.
+        """
+        if product_id not in self:
+            if default:
+                return default[0]
+            raise KeyError(product_id)
+        line = self[product_id]
+        del self[product_id]
+        return line
+
+    def popitem(self, last: bool = True) -> Tuple[str, Dict[str, Any]]:
+        """
+        Removes and returns the newest (or oldest) cart line.
+
+        :param last: Remove the most recently added line if True, else the oldest.
+        :return: Tuple of (product_id, line).
+        """
+        if not self:
+            raise KeyError('cart is empty')
+        product_id = next(reversed(self)) if last else next(iter(self))
+        return product_id, self.pop(product_id)
+
+    def setdefault(self, product_id: str, line: Optional[Dict[str, Any]] = None):
+        """
+        Returns the line for a product, inserting the given line if absent.
+
+        :param product_id: The product ID.
+        :param line: Line to insert if the product is not in the cart.
+        :return: The product's cart line.
+        """
+        if product_id not in self:
+            self[product_id] = line
+        return self[product_id]
+
+    def clear(self):
+        """
+        Removes every line and resets the totals.
+        """
+        if self.__price_bus is not None:
+            for product_id in self.__line_cents:
+                self.__price_bus.unsubscribe(product_id, self)
+        super().clear()
+        self.__regular_cents = self.__member_cents = self.__promotion_cents = 0
+        self.__item_count = 0
+        self.__line_cents.clear()
+
+    def add(self, product_id: str, product: Dict[str, Any], quantity: int) -> int:
+        """
+        Adds units of a product, creating its line if needed.
+
+        :param product_id: The product ID.
+        :param product: The product dictionary.
+        :param quantity: Units to add.
+        :return: The line's new quantity.
+        """
+        current = self[product_id]['quantity'] if product_id in self else 0
+        return self.set_quantity(product_id, current + quantity, product)
+
+    def set_quantity(self, product_id: str, quantity: int,
+                     product: Optional[Dict[str, Any]] = None) -> int:
+        """
+        Sets a line's quantity in O(1); zero or less removes the line.
+
+        Updating an existing line keeps its position in the cart.
+
+        :param product_id: The product ID.
+        :param quantity: The new quantity.
+        :param product: The product dictionary, required if the line is new.
+        :return: The line's new quantity (0 if removed).
+        :raises KeyError: If the product is not in the cart and no product was given.
+        """
+        if quantity <= 0:
+            if product_id in self:
+                del self[product_id]
+            return 0
+        if product_id in self:
+            line = self[product_id]
+            self.__remove_line(product_id)
+            line['quantity'] = quantity
+            self.__add_line(product_id, line)
+            self.__check()
+        elif product is None:
+            raise KeyError(product_id)
+        else:
+            self[product_id] = {'product': product, 'quantity': quantity}
+        return quantity
+
+    def refresh_line(self, product_id: str):
+        """
+        Recomputes one line's subtotals after its product's prices changed.
+
+        :param product_id: The product whose prices changed.
+        """
+        if product_id in self:
+            self.__remove_line(product_id)
+            self.__add_line(product_id, self[product_id])
+            self.__check()
+
+    def on_price_change(self, product_id: str, product: Optional[Dict[str, Any]] = None):
+        """
+        Reprices a line after its product's prices changed.
+
+        :param product_id: The product whose prices changed.
+        :param product: The product's current dictionary; the line is pointed at it if given.
+        """
+        if product_id not in self:
+            return
+        if product is not None:
+            self[product_id]['product'] = product
+        self.refresh_line(product_id)
+
+    @property
+    def regular_total(self) -> float:
+        """
+        Returns the cart total at regular prices, or promotion prices where lower.
+
+        :return: Total in dollars.
+        """
+        return self.__regular_cents / 100
+
+    @property
+    def member_total(self) -> float:
+        """
+        Returns the cart total at member prices (regular where none is set),
+        or promotion prices where lower.
+
+        :return: Total in dollars.
+        """
+        return self.__member_cents / 100
+
+    @property
+    def promotion_total(self) -> float:
+        """
+        Returns the cart total at promotion prices (regular where none is set).
+
+        :return: Total in dollars.
+        """
+        return self.__promotion_cents / 100
+
+    @property
+    def item_count(self) -> int:
+        """
+        Returns the total number of units across all lines.
+
+        :return: Sum of line quantities.
+        """
+        return self.__item_count
+
+    def total(self, is_vip: bool) -> float:
+        """
+        Returns the amount payable before discounts and fees.
+
+        :param is_vip: Whether member prices apply.
+        :return: Member total for VIPs, regular total otherwise.
+        """
+        return self.member_total if is_vip else self.regular_total
+
+    def line_subtotal(self, product_id: str, is_vip: bool) -> float:
+        """
+        Returns a line's subtotal at the price the user pays.
+
+        :param product_id: The product ID.
+        :param is_vip: Whether member prices apply.
+        :return: Line subtotal in dollars.
+        """
+        regular, member, _, _ = self.__line_cents[product_id]
+        return (member if is_vip else regular) / 100
+
+    def verify(self) -> bool:
+        """
+        Recomputes every total from the lines and compares with the running totals.
+
+        :return: True if the running totals are correct.
+        """
+        regular = member = promotion = items = 0
+        for product_id, line in self.items():
+            cents = self._line_cents(line)
+            if self.__line_cents.get(product_id) != cents:
+                return False
+            regular += cents[0]
+            member += cents[1]
+            promotion += cents[2]
+            items += cents[3]
+        return (regular, member, promotion, items) == (
+            self.__regular_cents, self.__member_cents, self.__promotion_cents, self.__item_count)
+
+
+if __name__ == '__main__':
+    # Demonstration of running totals with verification enabled
+    milk = {'id': '1', 'name': 'Milk', 'price': 3.10, 'member_price': 2.80}
+    bread = {'id': '2', 'name': 'Bread', 'price': 4.50, 'promotion_price': 3.99}
+
+    cart = SessionCart(debug=True)
+    cart.add('1', milk, 2)
+    cart.add('2', bread, 1)
+    cart.set_quantity('1', 5)
+    print(f"Items: {cart.item_count} | Regular: ${cart.regular_total:.2f} | "
+          f"Member: ${cart.member_total:.2f} | Promotion: ${cart.promotion_total:.2f}")
+
+    del cart['2']
+    print(f"After removing bread: {cart.item_count} items, ${cart.total(is_vip=True):.2f} for VIPs")
@@ -0,0 +1,210 @@
+"""
+Snapshot Module - Checksummed warm-start image of the loaded data stores.
+
+Parsing the JSON stores (and rebuilding indexes derived from them) dominates
+startup on a large catalog. A StartupSnapshot keeps a binary image of each
+store as it is on disk, plus built indexes, so the next start can skip both.
+
+Every entry records the source file it was taken from and that file's stamp
+(inode, modification time and size). An entry is only used while its source
+file still carries the same stamp; otherwise the store is rebuilt from the
+JSON file as usual. The whole image is protected by a SHA-256 checksum, and a
+missing, truncated or corrupt snapshot is simply ignored.
+
+The snapshot is a local cache written by this application and loaded with
+pickle, so it must live in the application's own data directory.
+
+Author: Applied10_Group6
+Version: 1.0
+"""
+
+import hashlib
+import os
+import pickle
+import threading
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+Stamp = Tuple[int, int, int]
+
+
+def file_stamp(filename: str) -> Optional[Stamp]:
+    """
+    Returns the stamp identifying the current version of a file.
+
+    :param filename: Path to the file.
+    :return: Tuple of (inode, mtime_ns, size), or None if the file is absent.
+    """
+    try:
+        stat = os.stat(filename)
+    except FileNotFoundError:
+        return None
+    return stat.st_ino, stat.st_mtime_ns, stat.st_size
+
+
+class StartupSnapshot:
+    """
+    StartupSnapshot - Reads and writes the warm-start image of the data stores.
+
+    The file is read once, on the first restore. Entries are kept pickled
+    until they are restored, so unused stores cost nothing to load.
+
+    Author: Applied10_Group6
+    Version: 1.0
+    """
+
+    MAGIC = b'MMSNAP1\n'
+    FORMAT = 1
+
+    def __init__(self, filename: str):
+        """
+        Constructs a snapshot over a file; nothing is read until the first restore.
+
+        :param filename: Path of the snapshot file.
+        """
+        self.__filename = filename
+        self.__lock = threading.Lock()
+        self.__entries: Optional[Dict[str, Dict[str, Any]]] = None
+        self.__status = 'unread'
+        self.__restored: List[str] = []
+        self.__rebuilt: List[str] = []
+
+    @property
+    def filename(self) -> str:
+        """
+        Returns the path of the snapshot file.
+
+        :return: The file path.
+        """
+        return self.__filename
+
+    @property
+    def status(self) -> str:
+        """
+        Returns the state of the snapshot file.
+
+        :return: 'unread', 'missing', 'corrupt' or 'valid'.
+        """
+        return self.__status
+
+    @property
+    def report(self) -> Dict[str, List[str]]:
+        """
+        Returns which entries were restored and which had to be rebuilt.
+
+        :return: Dictionary with 'restored' and 'rebuilt' entry names.
+        """
+        return {'restored': list(self.__restored), 'rebuilt': list(self.__rebuilt)}
+
+    def restore(self, name: str, stamp: Optional[Stamp]) -> Optional[Tuple[Any, Callable[[], Any]]]:
+        """
+        Returns an entry if it was taken from the given version of its source file.
+
+        :param name: The entry name.
+        :param stamp: Stamp of the source file version the caller needs.
+        :return: Tuple of (value, loader returning an independent copy of the value),
+                 or None if the entry is absent or stale.
+        """
+        with self.__lock:
+            entry = self.__read().get(name)
+            if entry is None or stamp is None or tuple(entry['stamp']) != stamp:
+                self.__rebuilt.append(name)
+                return None
+            self.__restored.append(name)
+        blob = entry['data']
+        return pickle.loads(blob), lambda: pickle.loads(blob)
+
+    def is_current(self, name: str, stamp: Optional[Stamp]) -> bool:
+        """
+        Returns whether an entry was taken from the given version of its source file.
+
+        :param name: The entry name.
+        :param stamp: Stamp of the source file version.
+        :return: True if the snapshot already holds that version.
+        """
+        with self.__lock:
+            entry = self.__read().get(name)
+            return entry is not None and stamp is not None and tuple(entry['stamp']) == stamp
+
+    def write(self, entries: Dict[str, Tuple[str, Stamp, Any]]) -> bool:
+        """
+        Writes a new snapshot file.
+
+        Entries of the current file that are not replaced are carried over
+        while their source files are unchanged.
+
+        :param entries: New entries by name, each (source filename, source stamp, value).
+        :return: True if written, False otherwise.
+        """
+        with self.__lock:
+            kept = {name: entry for name, entry in self.__read().items()
+                    if name not in entries and file_stamp(entry['source']) == tuple(entry['stamp'])}
+            for name, (source, stamp, value) in entries.items():
+                kept[name] = {'source': source, 'stamp': stamp,
+                              'data': pickle.dumps(value, protocol=pickle.HIGHEST_PROTOCOL)}
+            payload = pickle.dumps({'format': self.FORMAT, 'entries': kept},
+                                   protocol=pickle.HIGHEST_PROTOCOL)
+            tmp_name = f"{self.__filename}.{os.getpid()}.tmp"
+            try:
+                with open(tmp_name, 'wb') as f:
+                    f.write(self.MAGIC + hashlib.sha256(payload).digest() + payload)
+                os.replace(tmp_name, self.__filename)
+            except OSError as e:
+                print(f"Error writing startup snapshot: {e}")
+                return False
+            self.__entries = kept
+            self.__status = 'valid'
+            return True
+
+    def __read(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Reads and verifies the snapshot file on first use.
+
+        :return: Entries by name (empty if the file is missing or invalid).
+        """
+        if self.__entries is not None:
+            return self.__entries
+        self.__entries = {}
+        try:
+            with open(self.__filename, 'rb') as f:
+                raw = f.read()
+        except FileNotFoundError:
+            self.__status = 'missing'
+            return self.__entries
+        header = len(self.MAGIC) + hashlib.sha256().digest_size
+        payload = raw[header:]
+        if (not raw.startswith(self.MAGIC) or
+                raw[len(self.MAGIC):header] != hashlib.sha256(payload).digest()):
+            print("Warning: startup snapshot is corrupt, rebuilding from data files.")
+            self.__status = 'corrupt'
+            return self.__entries
+        try:
+            image = pickle.loads(payload)
+        except Exception:
+            image = None
+        if not isinstance(image, dict) or image.get('format') != self.FORMAT:
+            self.__status = 'corrupt'
+            return self.__entries
+        self.__entries = image['entries']
+        self.__status = 'valid'
+        return self.__entries
+
+
+if __name__ == '__main__':
+    # Demonstration: an entry is used only while its source file is unchanged
+    import json
+    import tempfile
+
+    folder = tempfile.mkdtemp()
+    source = os.path.join(folder, 'products.txt')
+    with open(source, 'w') as f:
+        json.dump({'1': {'name': 'Milk'}}, f)
+
+    snapshot = StartupSnapshot(os.path.join(folder, 'startup.snapshot'))
+    snapshot.write({'products': (source, file_stamp(source), {'1': {'name': 'Milk'}})})
+
+    warm = StartupSnapshot(snapshot.filename)
+    print(f"Unchanged source: {warm.restore('products', file_stamp(source))[0]}")
+    with open(source, 'w') as f:
+        json.dump({'1': {'name': 'Milk'}, '2': {'name': 'Bread'}}, f)
+    print(f"Changed source:   {warm.restore('products', file_stamp(source))}")
+    print(f"Report: {warm.report}")
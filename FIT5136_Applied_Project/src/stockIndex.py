@@ -0,0 +1,204 @@
+"""
+StockIndex Module - Products ordered by stock level, kept up to date as stock changes.
+
+The low-stock report used to scan the whole catalog for every threshold it
+was asked about. StockIndex instead groups product IDs into buckets by
+quantity and keeps the distinct quantities in a sorted list. "Products with
+stock <= t" is a binary search for t followed by reading the k matching
+products, O(log d + k) for d distinct quantities, and "out of stock" is the
+same query for 0.
+
+A stock change moves one product between buckets. A bucket is added to or
+dropped from the sorted list only when its quantity first appears or last
+disappears; since quantities are small whole numbers, d stays far below
+the number of products.
+
+Alerts can be registered for a threshold; they are called when a product's
+stock falls from above the threshold to at or below it.
+
+Author: Applied10_Group6
+Version: 1.0
+"""
+
+import threading
+from bisect import bisect_left, bisect_right, insort
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+# Alert callback: (product_id, quantity, threshold)
+StockAlert = Callable[[str, int, int], None]
+
+
+class StockIndex:
+    """
+    StockIndex - Order-statistics index of product quantities.
+
+    Every change to a product's quantity must be reported with update() (or
+    remove() when the product is deleted); rebuild() re-reads a whole catalog.
+
+    Author: Applied10_Group6
+    Version: 1.0
+    """
+
+    def __init__(self, products: Optional[Dict[str, Any]] = None):
+        """
+        Constructs an index, optionally over an existing catalog.
+
+        :param products: Dictionary mapping product IDs to product records.
+        """
+        self.__lock = threading.RLock()
+        self.__quantities: Dict[str, int] = {}
+        self.__buckets: Dict[int, Dict[str, None]] = {}  # quantity -> product IDs, in arrival order
+        self.__levels: List[int] = []  # distinct quantities, ascending
+        self.__alerts: List[Tuple[int, StockAlert]] = []
+        if products is not None:
+            self.rebuild(products)
+
+    def __len__(self) -> int:
+        """
+        Returns the number of indexed products.
+
+        :return: Product count.
+        """
+        return len(self.__quantities)
+
+    def quantity(self, product_id: str) -> Optional[int]:
+        """
+        Returns the indexed quantity of a product.
+
+        :param product_id: The product ID.
+        :return: The quantity, or None if the product is not indexed.
+        """
+        return self.__quantities.get(product_id)
+
+    def rebuild(self, products: Dict[str, Any]) -> None:
+        """
+        Re-indexes a whole catalog in one pass; no alerts are raised.
+
+        :param products: Dictionary mapping product IDs to product records.
+        """
+        quantities = {pid: product.get('quantity', 0) for pid, product in products.items()}
+        buckets: Dict[int, Dict[str, None]] = {}
+        for pid, quantity in quantities.items():
+            buckets.setdefault(quantity, {})[pid] = None
+        with self.__lock:
+            self.__quantities, self.__buckets, self.__levels = quantities, buckets, sorted(buckets)
+
+    def sync(self, products: Dict[str, Any]) -> None:
+        """
+        Brings the index in line with a catalog that may have changed outside
+        update(), e.g. when a save merged in another process's stock changes.
+
+        Only products whose quantity differs are moved, and alerts are raised
+        as for update().
+
+        :param products: Dictionary mapping product IDs to product records.
+        """
+        with self.__lock:
+            removed = [pid for pid in self.__quantities if pid not in products]
+        for pid in removed:
+            self.remove(pid)
+        for pid, product in products.items():
+            self.update(pid, product.get('quantity', 0))
+
+    def update(self, product_id: str, quantity: int) -> None:
+        """
+        Records a product's new quantity, adding the product if it is new.
+
+        :param product_id: The product ID.
+        :param quantity: The product's current quantity.
+        """
+        with self.__lock:
+            previous = self.__quantities.get(product_id)
+            if previous == quantity:
+                return
+            if previous is not None:
+                self.__leave(product_id, previous)
+            self.__quantities[product_id] = quantity
+            bucket = self.__buckets.get(quantity)
+            if bucket is None:
+                bucket = self.__buckets[quantity] = {}
+                insort(self.__levels, quantity)
+            bucket[product_id] = None
+            alerts = [(threshold, alert) for threshold, alert in self.__alerts
+                      if quantity <= threshold and (previous is None or previous > threshold)]
+        for threshold, alert in alerts:
+            alert(product_id, quantity, threshold)
+
+    def remove(self, product_id: str) -> None:
+        """
+        Removes a deleted product from the index.
+
+        :param product_id: The product ID.
+        """
+        with self.__lock:
+            previous = self.__quantities.pop(product_id, None)
+            if previous is not None:
+                self.__leave(product_id, previous)
+
+    def at_most(self, threshold: int) -> List[str]:
+        """
+        Returns the products whose stock is at or below a threshold.
+
+        :param threshold: The highest quantity to include.
+        :return: Product IDs, lowest stock first.
+        """
+        with self.__lock:
+            levels = self.__levels[:bisect_right(self.__levels, threshold)]
+            return [pid for level in levels for pid in self.__buckets[level]]
+
+    def out_of_stock(self) -> List[str]:
+        """
+        Returns the products with no stock left.
+
+        :return: Product IDs.
+        """
+        return self.at_most(0)
+
+    def add_alert(self, threshold: int, alert: StockAlert) -> None:
+        """
+        Calls alert(product_id, quantity, threshold) whenever a product's stock
+        falls to or below the threshold.
+
+        Alerts are called after the index has been updated, outside its lock.
+
+        :param threshold: Stock level that triggers the alert.
+        :param alert: The callback.
+        """
+        with self.__lock:
+            self.__alerts.append((threshold, alert))
+
+    def remove_alert(self, threshold: int, alert: StockAlert) -> None:
+        """
+        Stops an alert added with add_alert.
+
+        :param threshold: The alert's threshold.
+        :param alert: The callback.
+        """
+        with self.__lock:
+            if (threshold, alert) in self.__alerts:
+                self.__alerts.remove((threshold, alert))
+
+    def __leave(self, product_id: str, quantity: int) -> None:
+        """
+        Takes a product out of its quantity bucket, dropping the bucket once empty.
+
+        :param product_id: The product ID.
+        :param quantity: The bucket's quantity.
+        """
+        bucket = self.__buckets[quantity]
+        del bucket[product_id]
+        if not bucket:
+            del self.__buckets[quantity]
+            del self.__levels[bisect_left(self.__levels, quantity)]
+
+
+if __name__ == '__main__':
+    # Demonstration: stock falling through a low-stock alert
+    index = StockIndex({'1': {'quantity': 12}, '2': {'quantity': 0}, '3': {'quantity': 4}})
+    index.add_alert(5, lambda pid, quantity, threshold:
+                    print(f"Alert: product {pid} is down to {quantity} (<= {threshold})"))
+    print(f"Stock <= 5: {index.at_most(5)}")
+    index.update('1', 3)
+    index.update('3', 0)
+    print(f"Stock <= 5: {index.at_most(5)}")
+    print(f"Out of stock: {index.out_of_stock()}")
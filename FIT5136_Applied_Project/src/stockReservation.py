@@ -0,0 +1,387 @@
+"""
+StockReservation Module - Time-boxed stock holds for items sitting in shopping carts.
+
+This module provides a reservation ledger that lets a customer hold units of a
+product while it sits in their cart. Holds expire after a configurable TTL so
+abandoned carts release their stock automatically. Expiry is driven by a
+min-heap keyed on expiry time, so each hold is expired in O(log n) without
+scanning the whole ledger.
+
+Browsing and search use available = quantity - active holds, and checkout
+converts the user's holds into a sale.
+
+A ledger given a file shares its holds with every process using the same
+file. Each change is merged into the file under its exclusive lock, and
+other processes' changes are read back when the file's stamp changes,
+checked at most once every refresh_interval seconds. A hold is limited to
+the stock other users have not held according to the file read under that
+lock, so two processes cannot both hold the last unit.
+
+Author: Applied10_Group6
+Version: 1.0
+"""
+
+import heapq
+import itertools
+import json
+import os
+import time
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+
+from fileLock import FileLockManager
+from snapshot import file_stamp
+
+# Holds as stored in the shared file: product_id -> user -> [quantity, expires_at]
+StoredHolds = Dict[str, Dict[str, List[float]]]
+
+
+class StockHold:
+    """
+    StockHold - A single user's hold on units of one product.
+
+    Author: Applied10_Group6
+    Version: 1.0
+    """
+    __slots__ = ('user_email', 'product_id', 'quantity', 'expires_at', 'seq')
+
+    def __init__(self, user_email: str, product_id: str, quantity: int,
+                 expires_at: float, seq: int):
+        """
+        Constructs a StockHold.
+
+        :param user_email: Email of the user holding the stock.
+        :param product_id: The held product's identifier.
+        :param quantity: Number of units held.
+        :param expires_at: Clock time at which the hold lapses.
+        :param seq: Sequence number used to detect stale heap entries.
+        """
+        self.user_email = user_email
+        self.product_id = product_id
+        self.quantity = quantity
+        self.expires_at = expires_at
+        self.seq = seq
+
+
+class StockReservationLedger:
+    """
+    StockReservationLedger - Tracks per-user stock holds keyed by product.
+
+    Each (product, user) pair has at most one hold, whose quantity mirrors the
+    quantity in that user's cart. Re-reserving a product refreshes its TTL.
+    Expired holds are removed lazily from a min-heap on every read or write,
+    so stale heap entries left behind by refreshed or released holds are
+    simply skipped.
+
+    Author: Applied10_Group6
+    Version: 1.0
+    """
+
+    DEFAULT_TTL_SECONDS: float = 15 * 60
+    DEFAULT_REFRESH_INTERVAL: float = 1.0
+
+    def __init__(self, ttl_seconds: float = DEFAULT_TTL_SECONDS,
+                 clock: Callable[[], float] = time.time,
+                 filename: Optional[str] = None,
+                 refresh_interval: float = DEFAULT_REFRESH_INTERVAL):
+        """
+        Constructs a reservation ledger, empty or over a shared holds file.
+
+        :param ttl_seconds: Lifetime of a hold after its last refresh.
+        :param clock: Time source returning seconds (injectable for testing).
+        :param filename: Path of the holds file shared between processes (None to keep holds in memory).
+        :param refresh_interval: Least seconds between checks of the file for other processes' changes.
+        :raises ValueError: If ttl_seconds is not positive.
+        """
+        if ttl_seconds <= 0:
+            raise ValueError("Reservation TTL must be positive")
+        self.__ttl = ttl_seconds
+        self.__clock = clock
+        self.__holds: Dict[str, Dict[str, StockHold]] = {}  # product_id -> user -> hold
+        self.__held: Dict[str, int] = {}  # product_id -> total units held
+        self.__heap: List[Tuple[float, int, str, str]] = []
+        self.__seq = itertools.count()
+        self.__filename = filename
+        self.__refresh_interval = refresh_interval
+        self.__stamp = None
+        self.__checked_at: Optional[float] = None
+
+    @property
+    def ttl_seconds(self) -> float:
+        """
+        Returns the hold lifetime in seconds.
+
+        :return: TTL in seconds.
+        """
+        return self.__ttl
+
+    def expire(self) -> int:
+        """
+        Removes every hold whose TTL has elapsed.
+
+        :return: Number of holds that expired.
+        """
+        now = self.__clock()
+        expired = 0
+        while self.__heap and self.__heap[0][0] <= now:
+            _, seq, product_id, user_email = heapq.heappop(self.__heap)
+            hold = self.__holds.get(product_id, {}).get(user_email)
+            if hold is None or hold.seq != seq:
+                continue  # Stale entry: hold was refreshed or released
+            self.__drop(hold)
+            expired += 1
+        return expired
+
+    def reserve(self, user_email: str, product_id: str, quantity: int,
+                stock: Optional[int] = None) -> int:
+        """
+        Sets the user's hold on a product to the given quantity and refreshes its TTL.
+
+        A quantity of zero or less releases the hold. If the product's stock
+        is given, the hold is limited to the units no other user holds.
+
+        :param user_email: Email of the user holding the stock.
+        :param product_id: The product to hold.
+        :param quantity: Total units the user should hold.
+        :param stock: The product's quantity on hand (None to hold without a limit).
+        :return: The units now held, which may be fewer than requested.
+        """
+        self.expire()
+        if stock is not None and self.__filename is None:
+            # With a holds file the limit is applied to the file's holds when saving
+            quantity = min(quantity, max(0, stock - self.held(product_id, exclude_user=user_email)))
+        self.__set(user_email, product_id, quantity, self.__clock() + self.__ttl)
+        self.__persist(user_email, [product_id], {product_id: stock} if stock is not None else None)
+        hold = self.__holds.get(product_id, {}).get(user_email)
+        return hold.quantity if hold is not None else 0
+
+    def release(self, user_email: str, product_id: str) -> None:
+        """
+        Releases the user's hold on a single product.
+
+        :param user_email: Email of the user holding the stock.
+        :param product_id: The product to release.
+        """
+        hold = self.__holds.get(product_id, {}).get(user_email)
+        if hold is not None:
+            self.__drop(hold)
+        self.__persist(user_email, [product_id])
+
+    def release_user(self, user_email: str, product_ids: Optional[List[str]] = None) -> None:
+        """
+        Releases the user's holds, e.g. when the cart is emptied or on logout.
+
+        :param user_email: Email of the user whose holds are released.
+        :param product_ids: Products to release; all held products when None.
+        """
+        self.__sync()
+        targets = product_ids if product_ids is not None else list(self.__holds.keys())
+        for product_id in targets:
+            hold = self.__holds.get(product_id, {}).get(user_email)
+            if hold is not None:
+                self.__drop(hold)
+        self.__persist(user_email, targets)
+
+    def held(self, product_id: str, exclude_user: Optional[str] = None) -> int:
+        """
+        Returns the units currently held for a product.
+
+        :param product_id: The product to inspect.
+        :param exclude_user: Optional user whose own hold is not counted.
+        :return: Total active held units.
+        """
+        self.__sync()
+        self.expire()
+        total = self.__held.get(product_id, 0)
+        if exclude_user is not None:
+            own = self.__holds.get(product_id, {}).get(exclude_user)
+            if own is not None:
+                total -= own.quantity
+        return total
+
+    def available(self, product: Dict[str, Any], exclude_user: Optional[str] = None) -> int:
+        """
+        Returns the units of a product that are not held by any cart.
+
+        :param product: Product dictionary with 'id' and 'quantity'.
+        :param exclude_user: Optional user whose own hold still counts as available.
+        :return: quantity - active holds, never below zero.
+        """
+        return max(0, product.get('quantity', 0) - self.held(product['id'], exclude_user))
+
+    def commit(self, user_email: str, product_ids: List[str]) -> None:
+        """
+        Converts the user's holds into a sale at checkout.
+
+        The caller decrements the product quantities; the holds are simply
+        retired so the units are not counted twice.
+
+        :param user_email: Email of the purchasing user.
+        :param product_ids: Products that were purchased.
+        """
+        self.release_user(user_email, product_ids)
+
+    def __add(self, user_email: str, product_id: str, quantity: int, expires_at: float) -> None:
+        """
+        Adds a hold to the ledger and queues its expiry.
+
+        :param user_email: Email of the user holding the stock.
+        :param product_id: The held product.
+        :param quantity: Units held.
+        :param expires_at: Clock time at which the hold lapses.
+        """
+        seq = next(self.__seq)
+        hold = StockHold(user_email, product_id, quantity, expires_at, seq)
+        self.__holds.setdefault(product_id, {})[user_email] = hold
+        self.__held[product_id] = self.__held.get(product_id, 0) + quantity
+        heapq.heappush(self.__heap, (expires_at, seq, product_id, user_email))
+
+    def __set(self, user_email: str, product_id: str, quantity: int, expires_at: float) -> None:
+        """
+        Replaces the user's hold on a product; a quantity of zero or less removes it.
+
+        :param user_email: Email of the user holding the stock.
+        :param product_id: The held product.
+        :param quantity: Units held.
+        :param expires_at: Clock time at which the hold lapses.
+        """
+        current = self.__holds.get(product_id, {}).get(user_email)
+        if current is not None:
+            self.__drop(current)
+        if quantity > 0:
+            self.__add(user_email, product_id, quantity, expires_at)
+
+    def __sync(self) -> None:
+        """
+        Reloads the holds file if another process has changed it, checking
+        its stamp at most once every refresh interval.
+        """
+        if self.__filename is None:
+            return
+        now = time.monotonic()
+        if self.__checked_at is not None and now - self.__checked_at < self.__refresh_interval:
+            return
+        self.__checked_at = now
+        if file_stamp(self.__filename) == self.__stamp:
+            return
+        with FileLockManager.shared(self.__filename):
+            stored, self.__stamp = self.__read(), file_stamp(self.__filename)
+        self.__replace(stored)
+
+    def __persist(self, user_email: str, product_ids: Iterable[str],
+                  stock: Optional[Dict[str, int]] = None) -> None:
+        """
+        Writes the user's holds on the given products to the holds file,
+        keeping every other hold other processes have saved there.
+
+        A hold on a product with a known stock is cut to the units the file
+        shows no other user holding. Only the changed holds are updated in
+        memory, unless another process has written the file since it was
+        last read, in which case every hold is reloaded from it.
+
+        :param user_email: The user whose holds changed.
+        :param product_ids: The products whose holds changed.
+        :param stock: Quantity on hand of the products whose holds are limited.
+        """
+        if self.__filename is None:
+            return
+        product_ids = list(product_ids)
+        stock = stock or {}
+        try:
+            with FileLockManager.exclusive(self.__filename):
+                changed_elsewhere = file_stamp(self.__filename) != self.__stamp
+                stored = self.__read()
+                now = self.__clock()
+                stored = {pid: {user: entry for user, entry in users.items() if entry[1] > now}
+                          for pid, users in stored.items()}
+                for product_id in product_ids:
+                    hold = self.__holds.get(product_id, {}).get(user_email)
+                    users = stored.setdefault(product_id, {})
+                    users.pop(user_email, None)
+                    quantity = hold.quantity if hold is not None else 0
+                    if product_id in stock:
+                        others = sum(int(entry[0]) for entry in users.values())
+                        quantity = min(quantity, max(0, stock[product_id] - others))
+                    if quantity > 0:
+                        users[user_email] = [quantity, hold.expires_at]
+                stored = {pid: users for pid, users in stored.items() if users}
+                tmp_name = f"{self.__filename}.{os.getpid()}.tmp"
+                with open(tmp_name, 'w') as f:
+                    json.dump(stored, f)
+                os.replace(tmp_name, self.__filename)
+                self.__stamp = file_stamp(self.__filename)
+        except OSError as e:
+            print(f"Error saving stock holds to {self.__filename}: {e}")
+            return
+        self.__checked_at = time.monotonic()
+        if changed_elsewhere:
+            self.__replace(stored)
+            return
+        for product_id in product_ids:
+            entry = stored.get(product_id, {}).get(user_email)
+            if entry is None:
+                self.__set(user_email, product_id, 0, now)
+            else:
+                self.__set(user_email, product_id, int(entry[0]), entry[1])
+
+    def __read(self) -> StoredHolds:
+        """
+        Reads the holds file.
+
+        :return: Stored holds, empty if the file is missing or corrupt.
+        """
+        try:
+            with open(self.__filename, 'r') as f:
+                stored = json.load(f)
+            if isinstance(stored, dict):
+                return stored
+        except FileNotFoundError:
+            return {}
+        except json.JSONDecodeError:
+            pass
+        print(f"Error: {self.__filename} is corrupted, stock holds start empty.")
+        return {}
+
+    def __replace(self, stored: StoredHolds) -> None:
+        """
+        Replaces the in-memory holds with those read from the holds file.
+
+        :param stored: Holds as stored in the file.
+        """
+        self.__holds, self.__held, self.__heap = {}, {}, []
+        for product_id, users in stored.items():
+            for user_email, (quantity, expires_at) in users.items():
+                self.__add(user_email, product_id, int(quantity), expires_at)
+
+    def __drop(self, hold: StockHold) -> None:
+        """
+        Removes a hold from the ledger (its heap entry becomes stale).
+
+        :param hold: The hold to remove.
+        """
+        users = self.__holds.get(hold.product_id)
+        if users is None or users.get(hold.user_email) is not hold:
+            return
+        del users[hold.user_email]
+        if not users:
+            del self.__holds[hold.product_id]
+        remaining = self.__held.get(hold.product_id, 0) - hold.quantity
+        if remaining > 0:
+            self.__held[hold.product_id] = remaining
+        else:
+            self.__held.pop(hold.product_id, None)
+
+
+if __name__ == '__main__':
+    # Demonstration with a controllable clock
+    now = [0.0]
+    ledger = StockReservationLedger(ttl_seconds=60, clock=lambda: now[0])
+    laptop = {'id': '1', 'name': 'Laptop', 'quantity': 1}
+
+    ledger.reserve('alice@monash.edu', '1', 1, stock=laptop['quantity'])
+    print(f"Held for bob: {ledger.reserve('bob@monash.edu', '1', 1, stock=laptop['quantity'])}")
+    print(f"Available to others: {ledger.available(laptop)}")
+    print(f"Available to alice: {ledger.available(laptop, exclude_user='alice@monash.edu')}")
+
+    now[0] = 61.0
+    print(f"Expired holds: {ledger.expire()}")
+    print(f"Available after expiry: {ledger.available(laptop)}")